@@ -54,13 +54,21 @@ class LiveDiscordDashboard:
             total_unrealized_pnl = 0
             
             if trader.positions:
+                # One batched price request for all positions when the trader supports it
+                current_prices = {}
+                if hasattr(trader, 'get_token_prices'):
+                    try:
+                        current_prices = trader.get_token_prices(list(trader.positions.keys()))
+                    except Exception as e:
+                        logging.debug(f"Batch price lookup failed: {e}")
+                
                 for token, pos in trader.positions.items():
                     try:
                         # SAFE: Get price from trader or skip if not available
-                        current_price = None
-                        if hasattr(trader, 'get_token_price'):
+                        current_price = current_prices.get(token)
+                        if not current_price and hasattr(trader, 'get_token_price'):
                             current_price = trader.get_token_price(token)
-                        elif hasattr(trader, 'price_cache') and token in trader.price_cache:
+                        elif not current_price and hasattr(trader, 'price_cache') and token in trader.price_cache:
                             current_price = trader.price_cache[token]
                         
                         if current_price and pos.get('entry_price'):
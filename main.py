@@ -11,6 +11,9 @@ import pickle
 import subprocess
 import re
 import gc
+import heapq
+import itertools
+import sys
 import os
 import time
 import json
@@ -18,6 +21,7 @@ import random
 import logging
 import requests
 import base64
+import hashlib
 import io
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
@@ -25,9 +29,12 @@ import traceback
 import subprocess
 from typing import Dict, List, Tuple, Optional, Any
 from decimal import Decimal
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from functools import wraps
+from urllib.parse import urlparse
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import classification_report, roc_auc_score
@@ -99,7 +106,7 @@ ALPHA_WALLETS_CONFIG = [
     ("5WZXKX9Sy37waFySjeSX7tSS55ZgZM3kFTrK55iPNovA", "Alpha27"),
     ("TonyuYKmxUzETE6QDAmsBFwb3C4qr1nD38G52UGTjta", "Alpha28"),
     ("G5nxEXuFMfV74DSnsrSatqCW32F34XUnBeq3PfDS7w5E", "Alpha29"),
-    ("HB8B5EQ6TE3Siz1quv5oxBwABHdLyjayh35Cc4ReTJef", "Alpha30)
+    ("HB8B5EQ6TE3Siz1quv5oxBwABHdLyjayh35Cc4ReTJef", "Alpha30")
 ]
 
 daily_stats = {
@@ -113,19 +120,217 @@ daily_stats = {
     'last_reset': time.time()
 }
 
+# Shared adaptive token bucket per upstream host - every request to a host draws from the same bucket
+class HostRateLimiter:
+    # Lower number = served first
+    PRIORITY_EXIT = 0       # sells and stop losses
+    PRIORITY_TRADE = 1      # buys and pre-trade checks
+    PRIORITY_MONITOR = 2    # position monitoring (default)
+    PRIORITY_SCAN = 3       # discovery scans
+    
+    def __init__(self, name, rate, burst=None, min_rate=None, backoff_factor=0.7, increase_step=None):
+        self.name = name
+        self.max_rate = rate                          # configured ceiling, requests per second
+        self.rate = rate
+        self.min_rate = min_rate or rate * 0.1
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.backoff_factor = backoff_factor          # multiplicative decrease on 429
+        self.increase_step = increase_step or rate * 0.05  # additive increase per second of clean traffic
+        self.last_refill = time.time()
+        self.last_increase = time.time()
+        self.last_decrease = 0
+        self.blocked_until = 0
+        self.waiters = []                             # heap of (priority, sequence) tickets
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.stats = {'acquired': 0, 'throttled': 0, 'wait_seconds': 0.0, 'timeouts': 0}
+    
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def acquire(self, priority=None, timeout=None):
+        """Block until a token is available; higher-priority waiters are served first"""
+        if priority is None:
+            priority = current_request_priority()
+        start = time.time()
+        deadline = start + timeout if timeout else None
+        
+        with self.condition:
+            ticket = (priority, next(self.sequence))
+            heapq.heappush(self.waiters, ticket)
+            try:
+                while True:
+                    now = time.time()
+                    self._refill(now)
+                    is_head = self.waiters[0] == ticket
+                    
+                    if is_head and self.tokens >= 1 and now >= self.blocked_until:
+                        heapq.heappop(self.waiters)
+                        self.tokens -= 1
+                        self.stats['acquired'] += 1
+                        self.stats['wait_seconds'] += now - start
+                        self.condition.notify_all()
+                        return True
+                    
+                    if deadline and now >= deadline:
+                        self.stats['timeouts'] += 1
+                        return False
+                    
+                    # Only the head can compute its exact wait; others wake when the head is served
+                    if is_head:
+                        wait_time = max(self.blocked_until - now, (1 - self.tokens) / self.rate, 0.001)
+                    else:
+                        wait_time = 1.0
+                    if deadline:
+                        wait_time = min(wait_time, deadline - now)
+                    self.condition.wait(wait_time)
+            finally:
+                if ticket in self.waiters:
+                    self.waiters.remove(ticket)
+                    heapq.heapify(self.waiters)
+                    self.condition.notify_all()
+    
+    def on_success(self):
+        """Additive increase back toward the configured rate"""
+        with self.condition:
+            now = time.time()
+            if self.rate < self.max_rate and now - self.last_increase >= 1:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+                self.last_increase = now
+    
+    def on_throttled(self, retry_after=None):
+        """Multiplicative decrease on 429 (once per second, so one burst counts once)"""
+        with self.condition:
+            now = time.time()
+            self.stats['throttled'] += 1
+            if now - self.last_decrease >= 1:
+                self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+                self.last_decrease = now
+                self.last_increase = now
+                logging.warning(f"🐢 {self.name} rate limited (429) - now {self.rate * 60:.0f} req/min")
+            self.tokens = 0
+            try:
+                if retry_after:
+                    self.blocked_until = max(self.blocked_until, now + min(float(retry_after), 60))
+            except (TypeError, ValueError):
+                pass
+    
+    def get_stats(self):
+        with self.condition:
+            return {
+                **self.stats,
+                'rate_per_min': self.rate * 60,
+                'max_rate_per_min': self.max_rate * 60,
+                'waiting': len(self.waiters)
+            }
+
+# Request priority is tracked per thread so nested calls inherit the caller's urgency
+_request_priority = threading.local()
+
+def current_request_priority():
+    return getattr(_request_priority, 'value', HostRateLimiter.PRIORITY_MONITOR)
+
+@contextmanager
+def request_priority(priority):
+    """Run a block at a priority; an outer, more urgent priority is kept"""
+    previous = getattr(_request_priority, 'value', None)
+    _request_priority.value = priority if previous is None else min(priority, previous)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del _request_priority.value
+        else:
+            _request_priority.value = previous
+
+def submit_with_priority(executor, func, *args, **kwargs):
+    """Submit to a thread pool, carrying the caller's request priority into the worker"""
+    priority = current_request_priority()
+    
+    def run():
+        with request_priority(priority):
+            return func(*args, **kwargs)
+    return executor.submit(run)
+
+def with_request_priority(priority):
+    """Decorator form of request_priority"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with request_priority(priority):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# Deadline of the scanner job running on this thread, so work it triggers can tell when it went stale
+_scanner_deadline = threading.local()
+
+@contextmanager
+def scanner_deadline(deadline_at):
+    """Run a scanner job that must not act after deadline_at (unix time)"""
+    _scanner_deadline.value = deadline_at
+    try:
+        yield
+    finally:
+        del _scanner_deadline.value
+
+def scanner_deadline_passed():
+    """True inside a scanner job that is past its deadline - its opportunities are stale"""
+    deadline_at = getattr(_scanner_deadline, 'value', None)
+    return deadline_at is not None and time.time() > deadline_at
+
+HOST_RATE_LIMITERS = {
+    'jupiter': HostRateLimiter('Jupiter', float(os.getenv('JUPITER_RATE_LIMIT_PER_MIN', '50')) / 60, burst=3),
+    'helius': HostRateLimiter('Helius', float(os.getenv('HELIUS_RATE_LIMIT_RPS', '10')), burst=10),
+    'dexscreener': HostRateLimiter('DexScreener', float(os.getenv('DEXSCREENER_RATE_LIMIT_PER_MIN', '300')) / 60, burst=5),
+    'birdeye': HostRateLimiter('Birdeye', float(os.getenv('BIRDEYE_RATE_LIMIT_RPS', '1')), burst=2),
+    'raydium': HostRateLimiter('Raydium', float(os.getenv('RAYDIUM_RATE_LIMIT_RPS', '2')), burst=2),
+}
+
+def get_host_limiter(url):
+    """Limiter for the upstream host of a URL, or None for unthrottled hosts"""
+    host = urlparse(url).netloc
+    if 'jup.ag' in host:
+        return HOST_RATE_LIMITERS['jupiter']
+    if 'helius' in host:
+        return HOST_RATE_LIMITERS['helius']
+    if 'dexscreener' in host:
+        return HOST_RATE_LIMITERS['dexscreener']
+    if 'birdeye' in host:
+        return HOST_RATE_LIMITERS['birdeye']
+    if 'raydium' in host:
+        return HOST_RATE_LIMITERS['raydium']
+    return None
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from the host's limiter before sending and feeds 429s back to it"""
+    def send(self, request, **kwargs):
+        limiter = get_host_limiter(request.url)
+        if limiter:
+            limiter.acquire()
+        response = super().send(request, **kwargs)
+        if limiter:
+            if response.status_code == 429:
+                limiter.on_throttled(response.headers.get('Retry-After'))
+            else:
+                limiter.on_success()
+        return response
+
 def create_optimized_session():
     """Create session with connection pooling, keep-alive, and retries"""
     session = requests.Session()
     
-    # Retry strategy for resilience
+    # Retry strategy for resilience (429s are left to the host rate limiters)
     retry_strategy = Retry(
         total=3,
         backoff_factor=0.1,
-        status_forcelist=[429, 500, 502, 503, 504],
+        status_forcelist=[500, 502, 503, 504],
     )
     
-    # Adapter with connection pooling
-    adapter = HTTPAdapter(
+    # Adapter with connection pooling and shared per-host rate limiting
+    adapter = RateLimitedAdapter(
         max_retries=retry_strategy,
         pool_connections=20,  # Increase for Helius
         pool_maxsize=50,      # Increase for parallel requests
@@ -148,6 +353,7 @@ def create_optimized_session():
 
 RPC_SESSION = create_optimized_session()
 HELIUS_SESSION = create_optimized_session()
+HTTP_SESSION = create_optimized_session()  # REST APIs (Jupiter, DexScreener, Birdeye, Raydium, ...)
 
 # Thread pool for parallel requests
 REQUEST_EXECUTOR = ThreadPoolExecutor(max_workers=10)
@@ -230,6 +436,28 @@ CONFIG = {
     'MIN_PROFIT_TO_CONVERT': float(os.getenv('MIN_PROFIT_TO_CONVERT', '2.0')),
     'KEEP_TRADING_BALANCE': float(os.getenv('KEEP_TRADING_BALANCE', '4.0')),
 
+    # Price oracle (hedged requests across price sources)
+    'PRICE_HEDGE_DELAY_MS': int(os.getenv('PRICE_HEDGE_DELAY_MS', '250')),
+    'PRICE_ORACLE_TIMEOUT': float(os.getenv('PRICE_ORACLE_TIMEOUT', '8')),
+    'RAYDIUM_INDEX_REFRESH_SECONDS': int(os.getenv('RAYDIUM_INDEX_REFRESH_SECONDS', '300')),
+    'POOL_STREAM_ENABLED': os.getenv('POOL_STREAM_ENABLED', 'true').lower() == 'true',
+    'JUPITER_QUOTE_REUSE_MS': int(os.getenv('JUPITER_QUOTE_REUSE_MS', '500')),
+    'MARKET_UNIVERSE_MAX_AGE': float(os.getenv('MARKET_UNIVERSE_MAX_AGE', '15')),
+    'SCANNER_WORKERS': int(os.getenv('SCANNER_WORKERS', '4')),
+    'ALPHA_STREAM_ENABLED': os.getenv('ALPHA_STREAM_ENABLED', 'false').lower() == 'true',  # turns copy trading on
+    'ALPHA_EXIT_STREAM_ENABLED': os.getenv('ALPHA_EXIT_STREAM_ENABLED', 'true').lower() == 'true',
+    'SCANNER_DEADLINE_SECONDS': float(os.getenv('SCANNER_DEADLINE_SECONDS', '20')),
+    'RPC_BATCH_SIZE': int(os.getenv('RPC_BATCH_SIZE', '50')),
+    'TX_CACHE_PATH': os.getenv('TX_CACHE_PATH', 'tx_cache.db'),
+    'TX_CACHE_SIZE': int(os.getenv('TX_CACHE_SIZE', '5000')),
+    'TX_CACHE_DISK_ENTRIES': int(os.getenv('TX_CACHE_DISK_ENTRIES', '50000')),
+    'WALLET_CLASSIFY_DAYS': float(os.getenv('WALLET_CLASSIFY_DAYS', '7')),
+    'WALLET_CLASSIFY_MAX_TRANSACTIONS': int(os.getenv('WALLET_CLASSIFY_MAX_TRANSACTIONS', '500')),
+    'WALLET_CLASSIFY_REFRESH_HOURS': float(os.getenv('WALLET_CLASSIFY_REFRESH_HOURS', '24')),
+    'SWAP_WORKER_ENABLED': os.getenv('SWAP_WORKER_ENABLED', 'true').lower() == 'true',
+    'SWAP_WORKERS': int(os.getenv('SWAP_WORKERS', '2')),
+    'SWAP_WORKER_HEALTH_SECONDS': float(os.getenv('SWAP_WORKER_HEALTH_SECONDS', '15')),
+
     # Memory optimization
     'RPC_CALL_DELAY_MS': int(os.environ.get('RPC_CALL_DELAY_MS', '300')),
     'SKIP_ZERO_BALANCE_TOKENS': os.environ.get('SKIP_ZERO_BALANCE_TOKENS', 'true').lower() == 'true',
@@ -423,6 +651,486 @@ MEME_TOKEN_PATTERNS = [
     "smog", "sunny", "saga", "spx", "degods", "wepe", "bab"
 ]
 
+# Thread-safe bounded cache with per-data-class TTLs and stale-while-revalidate
+class TTLCache:
+    def __init__(self, max_size=2000, ttls=None, default_ttl=30, stale_ttl=120, refresh_workers=4):
+        self.max_size = max_size
+        self.ttls = ttls or {}           # data class -> seconds an entry counts as fresh
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl       # extra seconds an expired entry may still be served while refreshing
+        self.entries = OrderedDict()     # (data_class, key) -> (value, stored_at)
+        self.lock = threading.RLock()
+        self.refreshing = set()
+        self.refresh_executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='cache-refresh')
+        self.stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'refreshes': 0}
+        self.listeners = []
+    
+    def add_listener(self, listener):
+        """listener(key, value, data_class) is called after every set"""
+        self.listeners.append(listener)
+    
+    def _ttl(self, data_class):
+        return self.ttls.get(data_class, self.default_ttl)
+    
+    def _lookup(self, entry_key, data_class):
+        """Return (value, is_fresh); value is None when absent or too old to serve"""
+        entry = self.entries.get(entry_key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None, False
+        
+        value, stored_at = entry
+        age = time.time() - stored_at
+        ttl = self._ttl(data_class)
+        
+        if age < ttl:
+            self.entries.move_to_end(entry_key)
+            self.stats['hits'] += 1
+            return value, True
+        if age < ttl + self.stale_ttl:
+            self.entries.move_to_end(entry_key)
+            self.stats['stale_hits'] += 1
+            return value, False
+        
+        del self.entries[entry_key]
+        self.stats['expirations'] += 1
+        self.stats['misses'] += 1
+        return None, False
+    
+    def lookup(self, key, data_class='price'):
+        """(value, is_fresh) - a stale value is still returned so callers can serve it"""
+        with self.lock:
+            return self._lookup((data_class, key), data_class)
+    
+    def get(self, key, data_class='price', default=None):
+        """Fresh value only"""
+        with self.lock:
+            value, is_fresh = self._lookup((data_class, key), data_class)
+            return value if is_fresh else default
+    
+    def peek(self, key, data_class='price', default=None):
+        """Last stored value regardless of age (no stats, no LRU touch)"""
+        with self.lock:
+            entry = self.entries.get((data_class, key))
+            return entry[0] if entry else default
+    
+    def set(self, key, value, data_class='price', stored_at=None):
+        """Store a value; stored_at backdates it (e.g. a value loaded from the database)"""
+        with self.lock:
+            entry_key = (data_class, key)
+            self.entries[entry_key] = (value, stored_at or time.time())
+            self.entries.move_to_end(entry_key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats['evictions'] += 1
+        
+        for listener in self.listeners:
+            try:
+                listener(key, value, data_class)
+            except Exception as e:
+                logging.debug(f"Cache listener error: {e}")
+    
+    def update(self, key, value, data_class='price'):
+        """Replace a value in place, keeping its age (for incremental corrections)"""
+        with self.lock:
+            entry = self.entries.get((data_class, key))
+            if entry is None:
+                return False
+            self.entries[(data_class, key)] = (value, entry[1])
+            return True
+    
+    def delete(self, key, data_class='price'):
+        with self.lock:
+            self.entries.pop((data_class, key), None)
+    
+    def age(self, key, data_class='price'):
+        """Seconds since the value was stored, or None"""
+        with self.lock:
+            entry = self.entries.get((data_class, key))
+            return time.time() - entry[1] if entry else None
+    
+    def refresh_async(self, keys, loader, data_class='price'):
+        """Run loader(keys) in the background unless those keys are already refreshing"""
+        with self.lock:
+            keys = [k for k in keys if (data_class, k) not in self.refreshing]
+            if not keys:
+                return
+            self.refreshing.update((data_class, k) for k in keys)
+            self.stats['refreshes'] += 1
+        
+        def run_refresh():
+            try:
+                loader(keys)
+            except Exception as e:
+                logging.debug(f"Background {data_class} refresh failed: {e}")
+            finally:
+                with self.lock:
+                    self.refreshing.difference_update((data_class, k) for k in keys)
+        
+        self.refresh_executor.submit(run_refresh)
+    
+    def get_or_refresh(self, key, loader, data_class='price'):
+        """Stale-while-revalidate: a stale value returns instantly and loader refreshes it in the background"""
+        value, is_fresh = self.lookup(key, data_class)
+        if is_fresh:
+            return value
+        if value is not None:
+            self.refresh_async([key], lambda keys: loader(keys[0]), data_class)
+            return value
+        return loader(key)
+    
+    def prune(self):
+        """Drop entries too old to be served, even stale"""
+        with self.lock:
+            now = time.time()
+            expired = [
+                entry_key for entry_key, (_, stored_at) in self.entries.items()
+                if now - stored_at >= self._ttl(entry_key[0]) + self.stale_ttl
+            ]
+            for entry_key in expired:
+                del self.entries[entry_key]
+            self.stats['expirations'] += len(expired)
+            return len(expired)
+    
+    def __contains__(self, key):
+        return self.peek(key) is not None
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get_stats(self):
+        with self.lock:
+            lookups = self.stats['hits'] + self.stats['stale_hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'hit_rate': ((self.stats['hits'] + self.stats['stale_hits']) / lookups) * 100 if lookups else 0
+            }
+
+# Per-token tick store - fixed-size NumPy ring buffers of (timestamp, price, volume)
+class TokenTickStore:
+    TIME, PRICE, VOLUME = 0, 1, 2
+    
+    def __init__(self, capacity=1024, max_tokens=500, min_interval=5):
+        self.capacity = capacity          # ticks kept per token
+        self.max_tokens = max_tokens      # least recently updated tokens are dropped beyond this
+        self.min_interval = min_interval  # updates closer together than this merge into one tick
+        self.buffers = OrderedDict()      # token -> [ticks array, next write index, tick count]
+        self.lock = threading.Lock()
+    
+    def record(self, token_address, price=None, volume=None, timestamp=None):
+        """Write a price and/or volume observation (unknown fields stay NaN)"""
+        if price is None and volume is None:
+            return
+        timestamp = timestamp or time.time()
+        
+        with self.lock:
+            buffer = self.buffers.get(token_address)
+            if buffer is None:
+                buffer = [np.full((self.capacity, 3), np.nan), 0, 0]
+                self.buffers[token_address] = buffer
+                while len(self.buffers) > self.max_tokens:
+                    self.buffers.popitem(last=False)
+            else:
+                self.buffers.move_to_end(token_address)
+            
+            ticks, head, count = buffer
+            last = (head - 1) % self.capacity
+            
+            # Merge bursts into the latest tick so the buffer spans a useful time range
+            if count and timestamp - ticks[last, self.TIME] < self.min_interval:
+                if price is not None:
+                    ticks[last, self.PRICE] = price
+                if volume is not None:
+                    ticks[last, self.VOLUME] = volume
+                return
+            
+            ticks[head] = (timestamp, np.nan if price is None else price, np.nan if volume is None else volume)
+            buffer[1] = (head + 1) % self.capacity
+            buffer[2] = min(count + 1, self.capacity)
+    
+    def _series(self, token_address):
+        """Chronological copy of a token's ticks, or None"""
+        with self.lock:
+            buffer = self.buffers.get(token_address)
+            if buffer is None or buffer[2] == 0:
+                return None
+            ticks, head, count = buffer
+            if count < self.capacity:
+                return ticks[:count].copy()
+            return np.concatenate((ticks[head:], ticks[:head]))
+    
+    def _column(self, token_address, column, since=None):
+        """(times, values) for one column with NaNs dropped, optionally from a start time"""
+        series = self._series(token_address)
+        if series is None:
+            return None, None
+        mask = ~np.isnan(series[:, column])
+        if since is not None:
+            mask &= series[:, self.TIME] >= since
+        return series[mask, self.TIME], series[mask, column]
+    
+    def latest_price(self, token_address):
+        times, prices = self._column(token_address, self.PRICE)
+        return float(prices[-1]) if prices is not None and len(prices) else None
+    
+    def price_minutes_ago(self, token_address, minutes):
+        """Price at the last tick at or before N minutes ago, if history reaches back that far"""
+        times, prices = self._column(token_address, self.PRICE)
+        if times is None or not len(times):
+            return None
+        
+        target = time.time() - minutes * 60
+        tolerance = max(60, minutes * 6)  # 10% of the window, at least a minute
+        if times[0] > target + tolerance:
+            return None
+        
+        index = max(int(np.searchsorted(times, target, side='right')) - 1, 0)
+        return float(prices[index])
+    
+    def max_price_since(self, token_address, since):
+        times, prices = self._column(token_address, self.PRICE, since=since)
+        return float(prices.max()) if prices is not None and len(prices) else None
+    
+    def rolling_return(self, token_address, minutes):
+        """Percent change over the last N minutes"""
+        old_price = self.price_minutes_ago(token_address, minutes)
+        current_price = self.latest_price(token_address)
+        if not old_price or not current_price:
+            return None
+        return ((current_price - old_price) / old_price) * 100
+    
+    def returns(self, token_address, minutes):
+        """Tick-to-tick log returns over the last N minutes"""
+        times, prices = self._column(token_address, self.PRICE, since=time.time() - minutes * 60)
+        if prices is None or len(prices) < 2 or (prices <= 0).any():
+            return np.array([])
+        return np.diff(np.log(prices))
+    
+    def volume_acceleration(self, token_address, minutes=30, lag=2):
+        """Relative volume change from the sample `lag` samples back to the newest, within the window"""
+        times, volumes = self._column(token_address, self.VOLUME, since=time.time() - minutes * 60)
+        if volumes is None or len(volumes) <= lag or volumes[-1 - lag] <= 0:
+            return None
+        return float((volumes[-1] - volumes[-1 - lag]) / volumes[-1 - lag])
+    
+    def history(self, token_address, minutes=60):
+        times, prices = self._column(token_address, self.PRICE, since=time.time() - minutes * 60)
+        if times is None:
+            return []
+        return [{'price': float(p), 'timestamp': float(t)} for t, p in zip(times, prices)]
+    
+    def memory_bytes(self):
+        with self.lock:
+            return sum(buffer[0].nbytes for buffer in self.buffers.values())
+    
+    def __len__(self):
+        return len(self.buffers)
+
+# Two-tier token attribute store: in-process first, then the token_data table (written behind in batches)
+class TokenAttributeStore:
+    # Attributes that practically never change - kept in an in-process LRU
+    # (authorities only once renounced, supply only while the mint authority is renounced;
+    # otherwise they are short-TTL like the dynamic columns)
+    STATIC_FIELDS = ('symbol', 'decimals', 'supply', 'mint_authority', 'freeze_authority', 'pool_address')
+    MUTABLE_STATIC_FIELDS = ('supply', 'mint_authority', 'freeze_authority')
+    # Short-TTL attributes - kept in the shared cache under their own data class; attribute -> token_data column
+    DYNAMIC_COLUMNS = {
+        'liquidity': 'liquidity',
+        'volume': 'volume_24h',
+        'holders': 'holder_count',
+        'price_change_5m': 'price_change_5m',
+        'price_change_1h': 'price_change_1h'
+    }
+    
+    def __init__(self, cache, max_tokens=5000, flush_interval=5):
+        self.cache = cache
+        self.max_tokens = max_tokens
+        self.flush_interval = flush_interval
+        self.static = OrderedDict()     # token -> {static field: value}
+        self.loaded = OrderedDict()     # tokens whose database row has been read (or found missing)
+        self.pending = {}               # token -> {field: value} waiting to be written
+        self.db = None
+        self.conn = None                # own long-lived connection, shared by preloads and flushes
+        self.db_lock = threading.Lock()
+        self.lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'db_loads': 0, 'misses': 0, 'rows_written': 0, 'write_errors': 0}
+    
+    def attach_database(self, db_manager):
+        """Start reading through to and writing behind into token_data"""
+        if self.db:
+            return
+        self.db = db_manager
+        threading.Thread(target=self._flush_loop, daemon=True, name='token-store-flush').start()
+    
+    def get(self, token_address, field):
+        """Attribute from memory, else from the database row; None if neither has it"""
+        value = self._get_memory(token_address, field)
+        if value is None and self.preload(token_address):
+            value = self._get_memory(token_address, field)
+        with self.lock:
+            self.stats['memory_hits' if value is not None else 'misses'] += 1
+        return value
+    
+    def _get_memory(self, token_address, field):
+        if field in self.DYNAMIC_COLUMNS:
+            return self.cache.get(token_address, field)
+        with self.lock:
+            attributes = self.static.get(token_address)
+            if attributes is not None:
+                self.static.move_to_end(token_address)
+                if field in attributes and (field != 'supply' or attributes.get('mint_authority') == ''):
+                    return attributes[field]
+        # Supply and authorities can still change while an authority is set
+        return self.cache.get(token_address, field) if field in self.MUTABLE_STATIC_FIELDS else None
+    
+    def _is_short_ttl(self, token_address, field, fields=None):
+        """Dynamic columns, authorities until renounced, and supply unless the mint authority is renounced"""
+        if field in self.DYNAMIC_COLUMNS:
+            return True
+        if field in ('mint_authority', 'freeze_authority'):
+            # A renounced authority ('') can never come back; a set one can still be renounced
+            return (fields or {}).get(field) != ''
+        if field != 'supply':
+            return False
+        mint_authority = (fields or {}).get('mint_authority')
+        if mint_authority is None:
+            mint_authority = self.static.get(token_address, {}).get('mint_authority')
+        return mint_authority != ''
+    
+    def set(self, token_address, **fields):
+        """Write attributes to memory now and to the database on the next flush (None values are ignored)"""
+        fields = {field: value for field, value in fields.items() if value is not None}
+        if not fields:
+            return
+        
+        with self.lock:
+            short_ttl = {field for field in fields if self._is_short_ttl(token_address, field, fields)}
+            for field, value in fields.items():
+                if field not in short_ttl:
+                    self.static.setdefault(token_address, {})[field] = value
+            if token_address in self.static:
+                self.static.move_to_end(token_address)
+                while len(self.static) > self.max_tokens:
+                    self.static.popitem(last=False)
+            if self.db:
+                self.pending.setdefault(token_address, {}).update(fields)
+        
+        for field in short_ttl:
+            self.cache.set(token_address, fields[field], field)
+    
+    def preload(self, token_address):
+        """Read the token's database row into memory once; True if anything new was loaded"""
+        with self.lock:
+            if not self.db or token_address in self.loaded:
+                return False
+            self.loaded[token_address] = True
+            while len(self.loaded) > self.max_tokens:
+                self.loaded.popitem(last=False)
+        
+        try:
+            with self._cursor() as cursor:
+                cursor.execute('SELECT * FROM token_data WHERE token_address = %s', (token_address,))
+                row = cursor.fetchone()
+        except Exception as e:
+            logging.debug(f"Token store load failed for {token_address[:8]}: {e}")
+            return False
+        if not row:
+            return False
+        
+        with self.lock:
+            self.stats['db_loads'] += 1
+            attributes = self.static.setdefault(token_address, {})
+            for field in self.STATIC_FIELDS:
+                if row.get(field) is not None and not self._is_short_ttl(token_address, field, row):
+                    attributes.setdefault(field, row[field])
+        
+        # Short-TTL values keep the age of their own last write, so a restart only reuses ones that are still fresh
+        updated_at = row.get('field_updated_at') or {}
+        short_ttl_columns = dict(self.DYNAMIC_COLUMNS)
+        for field in self.MUTABLE_STATIC_FIELDS:
+            if self._is_short_ttl(token_address, field, row):
+                short_ttl_columns[field] = field
+        for field, column in short_ttl_columns.items():
+            if row.get(column) is None or updated_at.get(column) is None:
+                continue
+            if self.cache.peek(token_address, field) is None:
+                self.cache.set(token_address, row[column], field, stored_at=float(updated_at[column]))
+        return True
+    
+    @contextmanager
+    def _cursor(self, transaction=False):
+        """Cursor on the store's own connection, opened once and reopened once it breaks.
+        Reads autocommit; transaction=True commits the whole block at the end."""
+        with self.db_lock:
+            if self.conn is None or self.conn.closed:
+                self.conn = self.db.get_connection()
+            self.conn.autocommit = not transaction
+            try:
+                with self.conn.cursor() as cursor:
+                    yield cursor
+                if transaction:
+                    self.conn.commit()
+            except Exception:
+                if not self.conn.closed:
+                    self.conn.rollback()
+                raise
+            finally:
+                if not self.conn.closed:
+                    self.conn.autocommit = True
+    
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logging.debug(f"Token store flush failed: {e}")
+    
+    def flush(self):
+        """Upsert pending attributes; columns not being written keep their stored values"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if not pending or not self.db:
+            return
+        
+        columns = list(self.STATIC_FIELDS) + list(self.DYNAMIC_COLUMNS.values())
+        column_of = {field: field for field in self.STATIC_FIELDS}
+        column_of.update(self.DYNAMIC_COLUMNS)
+        now = time.time()
+        rows = []
+        for token_address, fields in pending.items():
+            values = dict.fromkeys(columns)
+            for field, value in fields.items():
+                values[column_of[field]] = value
+            has_dynamic = any(field in self.DYNAMIC_COLUMNS for field in fields)
+            # When each column was written, so a reload ages every column on its own
+            updated_at = {column_of[field]: now for field in fields}
+            rows.append((token_address, *[values[c] for c in columns], json.dumps(updated_at), has_dynamic))
+        
+        updates = ', '.join(f'{c} = COALESCE(EXCLUDED.{c}, token_data.{c})' for c in columns)
+        query = f'''
+        INSERT INTO token_data (token_address, {', '.join(columns)}, field_updated_at, last_updated)
+        VALUES (%s, {', '.join(['%s'] * len(columns))}, %s::jsonb, CASE WHEN %s THEN CURRENT_TIMESTAMP ELSE NULL END)
+        ON CONFLICT (token_address) DO UPDATE SET {updates},
+            field_updated_at = COALESCE(token_data.field_updated_at, '{{}}'::jsonb) || EXCLUDED.field_updated_at,
+            last_updated = COALESCE(EXCLUDED.last_updated, token_data.last_updated)
+        '''
+        try:
+            with self._cursor(transaction=True) as cursor:
+                cursor.executemany(query, rows)
+            with self.lock:
+                self.stats['rows_written'] += len(rows)
+        except Exception as e:
+            with self.lock:
+                self.stats['write_errors'] += 1
+            logging.warning(f"Token store write failed ({len(rows)} tokens): {e}")
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'static_tokens': len(self.static), 'pending': len(self.pending)}
+
 # Global Variables
 circuit_breaker_active = False
 error_count_window = []
@@ -432,19 +1140,28 @@ ERROR_WINDOW_SECONDS = 300
 CIRCUIT_BREAKER_COOLDOWN = 600
 daily_profit_usd = 0
 trades_today = 0
-last_jupiter_call = 0
-JUPITER_CALL_DELAY = 1.5
-
-# Rate limiting variables
-last_api_call_time = 0
-api_call_delay = 2.0
 
 # Track tokens we're monitoring
 daily_profit = 0
 monitored_tokens = {}
 token_buy_timestamps = {}
-price_cache = {}
-price_cache_time = {}
+# 'price' entries are always SOL per whole token (decimals applied) - every writer must follow that
+price_cache = TTLCache(
+    max_size=int(os.getenv('PRICE_CACHE_MAX_SIZE', '2000')),
+    ttls={'price': 30, 'price_usd': 30, 'liquidity': 60, 'volume': 60, 'holders': 120, 'supply': 60,
+          'mint_authority': 300, 'freeze_authority': 300, 'metadata': 3600},
+    stale_ttl=int(os.getenv('PRICE_CACHE_STALE_SECONDS', '120'))
+)
+token_ticks = TokenTickStore(
+    capacity=int(os.getenv('TICK_STORE_CAPACITY', '1024')),
+    max_tokens=int(os.getenv('TICK_STORE_MAX_TOKENS', '500'))
+)
+token_store = TokenAttributeStore(price_cache)
+
+def store_token_price(token_address, price):
+    """Cache a price and record it as a tick - only for prices already in SOL per whole token"""
+    price_cache.set(token_address, price)
+    token_ticks.record(token_address, price=price)
 
 # Stats tracking
 tokens_scanned = 0
@@ -471,6 +1188,7 @@ last_wallet_checks = {}
 
 # SOL token address
 SOL_TOKEN_ADDRESS = "So11111111111111111111111111111111111111112"
+USDC_TOKEN_ADDRESS = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
 
 # Predefined list of known tokens
 KNOWN_TOKENS = [
@@ -939,6 +1657,60 @@ class DatabaseManager:
                 )
                 ''')
                 
+                # Rarely-changing attributes kept by the token attribute store
+                for column, column_type in (('decimals', 'INTEGER'), ('supply', 'TEXT'), ('mint_authority', 'TEXT'),
+                                            ('freeze_authority', 'TEXT'), ('pool_address', 'TEXT'),
+                                            ('field_updated_at', 'JSONB')):
+                    cursor.execute(f'ALTER TABLE token_data ADD COLUMN IF NOT EXISTS {column} {column_type}')
+                
+                # Table for mint creation times (resolved once, never change)
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS mint_creation_times (
+                    mint_address TEXT PRIMARY KEY,
+                    created_at DOUBLE PRECISION NOT NULL,
+                    resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                ''')
+                
+                # Table for per-wallet signature cursors (newest transaction already processed)
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS wallet_signature_cursors (
+                    wallet_address TEXT PRIMARY KEY,
+                    signature TEXT NOT NULL,
+                    slot BIGINT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                ''')
+                
+                # Table for wallet style profiles (refreshed in the background)
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS wallet_style_profiles (
+                    wallet_address TEXT PRIMARY KEY,
+                    style TEXT NOT NULL,
+                    trade_count INTEGER,
+                    round_trips INTEGER,
+                    win_rate REAL,
+                    median_hold_minutes REAL,
+                    p90_hold_minutes REAL,
+                    median_size_sol REAL,
+                    p90_size_sol REAL,
+                    trades_per_day REAL,
+                    transactions INTEGER,
+                    days_covered REAL,
+                    classified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                ''')
+                
+                # Table for deferred checks (outcome checks survive restarts)
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS deferred_checks (
+                    check_key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    due_at DOUBLE PRECISION NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                ''')
+                
                 # Table for profit conversions
                 cursor.execute('''
                 CREATE TABLE IF NOT EXISTS profit_conversions (
@@ -1031,6 +1803,94 @@ class DatabaseManager:
                 
                 conn.commit()
     
+    def get_mint_creation_times(self):
+        """All stored mint creation times as {mint: unix timestamp}"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT mint_address, created_at FROM mint_creation_times')
+                return {row['mint_address']: row['created_at'] for row in cursor.fetchall()}
+    
+    def save_mint_creation_time(self, mint_address, created_at):
+        """Store a resolved mint creation time"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                INSERT INTO mint_creation_times (mint_address, created_at)
+                VALUES (%s, %s)
+                ON CONFLICT (mint_address) DO NOTHING
+                ''', (mint_address, created_at))
+                conn.commit()
+    
+    def get_wallet_signature_cursors(self):
+        """All stored wallet cursors as {wallet: (signature, slot)}"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT wallet_address, signature, slot FROM wallet_signature_cursors')
+                return {row['wallet_address']: (row['signature'], row['slot']) for row in cursor.fetchall()}
+    
+    def save_wallet_signature_cursor(self, wallet_address, signature, slot):
+        """Store the newest processed signature for a wallet"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                INSERT INTO wallet_signature_cursors (wallet_address, signature, slot)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (wallet_address) DO UPDATE SET
+                    signature = EXCLUDED.signature, slot = EXCLUDED.slot, updated_at = CURRENT_TIMESTAMP
+                ''', (wallet_address, signature, slot))
+                conn.commit()
+    
+    def get_wallet_style_profiles(self):
+        """All stored wallet style profiles, classified_at as a unix timestamp"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                SELECT *, EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP::timestamp - classified_at)) AS age_seconds
+                FROM wallet_style_profiles
+                ''')
+                now = time.time()
+                return [{**row, 'classified_at': now - float(row['age_seconds'])} for row in cursor.fetchall()]
+    
+    def save_wallet_style_profile(self, wallet_address, style, stats):
+        """Store a wallet's style and the statistics behind it"""
+        fields = WalletStyleClassifier.STATS_FIELDS
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f'''
+                INSERT INTO wallet_style_profiles (wallet_address, style, {', '.join(fields)}, classified_at)
+                VALUES (%s, %s, {', '.join(['%s'] * len(fields))}, CURRENT_TIMESTAMP)
+                ON CONFLICT (wallet_address) DO UPDATE SET
+                    style = EXCLUDED.style, {', '.join(f'{f} = EXCLUDED.{f}' for f in fields)},
+                    classified_at = CURRENT_TIMESTAMP
+                ''', (wallet_address, style, *[stats.get(f) for f in fields]))
+                conn.commit()
+    
+    def get_deferred_checks(self):
+        """All pending deferred checks"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT check_key, kind, due_at, payload FROM deferred_checks')
+                return cursor.fetchall()
+    
+    def save_deferred_check(self, check_key, kind, due_at, payload):
+        """Store (or replace) a pending deferred check"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                INSERT INTO deferred_checks (check_key, kind, due_at, payload)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (check_key) DO UPDATE SET
+                    kind = EXCLUDED.kind, due_at = EXCLUDED.due_at, payload = EXCLUDED.payload
+                ''', (check_key, kind, due_at, payload))
+                conn.commit()
+    
+    def delete_deferred_checks(self, check_keys):
+        """Remove deferred checks that have run"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('DELETE FROM deferred_checks WHERE check_key = ANY(%s)', (list(check_keys),))
+                conn.commit()
+    
     def get_wallet_stats(self, wallet_address):
         """Get performance stats for a wallet"""
         with self.get_connection() as conn:
@@ -1169,15 +2029,21 @@ class AdaptiveAlphaTrader:
     
     def __init__(self, wallet_instance):
         self.daily_trades = 0
-        self.wallet_trade_tracking = {}
         self.daily_trade_limit = int(os.getenv('DAILY_TRADE_LIMIT', '70'))
         self.last_trade_date = datetime.now().date()
+        self.trade_lock = threading.RLock()   # guards positions and trade counters - never held across a swap
+        self.pending_buys = set()             # tokens with a buy in flight (they count toward the daily limit)
         self.min_ml_confidence = 0.60
         self.wallet = wallet_instance
         self.alpha_wallets = []
         self.ml_brain = None
         self.db_manager = DatabaseManager()
         self.db = self.db_manager.conn  # For ML brain
+        mint_creation_times.attach_database(self.db_manager)
+        wallet_cursors.attach_database(self.db_manager)
+        wallet_classifier.attach_database(self.db_manager)
+        deferred_checks.attach_database(self.db_manager)
+        token_store.attach_database(self.db_manager)
         self.trade_ids = {}
         self.real_high_performers = []
         self.monitoring = {}  # Tokens we're watching
@@ -1187,6 +2053,18 @@ class AdaptiveAlphaTrader:
         self.independent_hunting = True  # Enable autonomous hunting
         self.wallet_styles = {}
         self.initialize_enhanced_systems()
+        
+        # Streamed pool prices trigger stop exits without waiting for the next monitoring pass
+        self.stream_exit_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='stream-exit')
+        if CONFIG['POOL_STREAM_ENABLED']:
+            pool_reserve_stream.add_listener(self.on_pool_price_update)
+        if CONFIG['ALPHA_EXIT_STREAM_ENABLED']:
+            alpha_holding_stream.add_listener(self.on_alpha_holding_exit)
+        wallet_classifier.add_listener(self.on_wallet_classified)
+        deferred_checks.register('wallet_trade_outcome', self.check_wallet_trade_outcomes)
+        deferred_checks.register('skipped_trade', self.analyze_skipped_trades)
+        if CONFIG['SWAP_WORKER_ENABLED']:
+            swap_workers.start()
         self.wallet_performance = defaultdict(lambda: {
             'trades_signaled': 0,
             'trades_copied': 0,
@@ -1262,18 +2140,12 @@ class AdaptiveAlphaTrader:
         """FIXED - Actually uses ML to filter and limits trades"""
         current_time = time.time()
         
-        # HOURLY TRADE LIMITING
-        if not hasattr(self, 'hourly_trades'):
-            self.hourly_trades = 0
-            self.hour_start = time.time()
-        
-        # Reset hourly counter
-        if current_time - self.hour_start > 3600:
-            self.hourly_trades = 0
-            self.hour_start = current_time
-            
         # CRITICAL: LIMIT TRADES PER HOUR
-        if self.hourly_trades >= 20:  # MAX 20 trades per hour, not 1560!
+        if not self.hourly_trade_slot_available():
+            return
+        
+        # Buys arrive over the websocket while it is up - polling is only the fallback
+        if alpha_wallet_stream.is_connected():
             return
 
         for alpha in self.alpha_wallets[:5]:  # Only check top 5 wallets
@@ -1281,7 +2153,6 @@ class AdaptiveAlphaTrader:
                 continue
                 
             # Dynamic check intervals
-            wallet_style = alpha.get('style', 'SCALPER')
             check_interval = self.wallet_styles.get(alpha['address'], {}).get('check_interval', 20)
             
             time_since_last = current_time - self.last_check.get(alpha['address'], 0)
@@ -1291,151 +2162,215 @@ class AdaptiveAlphaTrader:
             self.last_check[alpha['address']] = current_time
             
             try:
-                new_buys = get_wallet_recent_buys_helius(alpha['address'])
+                new_buys = get_wallet_recent_buys_helius(alpha['address'], since_cursor=True)
                 
                 if new_buys:
                     for buy in new_buys[:1]:  # Only process FIRST buy
-                        # Skip if already in position/monitoring
-                        if buy['token'] in self.positions or buy['token'] in self.monitoring:
-                            continue
-                            
-                        # Get token data
-                        token_data = self.get_token_snapshot(buy['token'], wallet_style)
-                        if not token_data or token_data.get('price', 0) == 0:
-                            continue
-                            
-                        # GET WALLET STATS FOR ML
-                        wallet_stats = None
-                        if hasattr(self, 'db_manager'):
-                            wallet_stats = self.db_manager.get_wallet_stats(alpha['address'])
-
-                        if not hasattr(self, 'ml_brain'):
-                            logging.error("❌ ML Brain not initialized - initializing now")
-                            self.initialize_ml_system()
-                        
-                        if not self.ml_brain or not self.ml_brain.is_trained:
-                            logging.warning("⚠️ ML not trained - attempting to train")
-                            self.force_ml_training()
-
-                        # Debug wallet stats
-                        logging.debug(f"Wallet stats for {alpha['name']}: {wallet_stats}")
-                        
-                        # TRACK ALL TRADES FOR LEARNING
-                        if not wallet_stats or wallet_stats['total_trades'] < 5:
-                            logging.warning(f"❌ No/few stats for {alpha['name']} - tracking outcome for learning")
-                            self.track_wallet_trade_outcome(alpha['address'], buy['token'])
-                            
-                            # For unknown wallets, be extra cautious
-                            if token_data.get('liquidity', 0) < 10000:
-                                logging.info(f"❌ Unknown wallet + low liquidity - skipping but tracking")
-                                continue
-                            if token_data.get('holders', 0) < 100:
-                                logging.info(f"❌ Unknown wallet + few holders - skipping but tracking")
-                                continue
-                                
-                            # Use conservative stats for ML
-                            wallet_stats = {
-                                'win_rate': 30,  # Assume bad until proven
-                                'total_trades': 1,
-                                'avg_profit_per_trade': -0.01
-                            }
-                        
-                        # ML FILTERING - THIS IS CRITICAL!
-                        if hasattr(self, 'ml_brain') and self.ml_brain and self.ml_brain.is_trained and wallet_stats:
-                            action, confidence = self.ml_brain.predict_trade(
-                                wallet_stats, 
-                                token_data
-                            )
-                            
-                            # DEBUG LOG
-                            logging.debug(f"ML inputs - wallet_stats: {wallet_stats}, is_trained: {self.ml_brain.is_trained}")
-                            logging.info(f"🤖 ML Decision: {action} with {confidence:.1%} confidence for ${token_data.get('liquidity', 0):,.0f} liquidity")
-                            
-                            # ONLY TAKE HIGH CONFIDENCE TRADES
-                            if action not in ['STRONG_BUY', 'BUY'] or confidence < self.min_ml_confidence:
-                                logging.info(f"❌ ML REJECTED: {alpha['name']} trade - {confidence:.1%} confidence < {self.min_ml_confidence:.1%} required")
-                                # Still track for learning!
-                                self.track_wallet_trade_outcome(alpha['address'], buy['token'])
-                                continue
-                            else:
-                                logging.info(f"✅ ML APPROVED: {alpha['name']} trade - {confidence:.1%} confidence")
-                        else:
-                            # If ML not ready, be extra cautious
-                            if not (token_data.get('liquidity', 0) > 10000 and token_data.get('holders', 0) > 100):
-                                logging.warning(f"⚠️ No ML available - skipping low quality token")
-                                self.track_wallet_trade_outcome(alpha['address'], buy['token'])
-                                continue
-                        
-                        # Check liquidity
-                        style_params = self.wallet_styles.get(alpha['address'], self.get_style_params('SCALPER'))
-                        min_liquidity = style_params.get('min_liquidity', 5000)
-                        
-                        if token_data.get('liquidity', 0) < min_liquidity:
-                            logging.warning(f"⚠️ Skipping {buy['token'][:8]} - low liquidity ${token_data.get('liquidity', 0)} < ${min_liquidity}")
-                            self.track_wallet_trade_outcome(alpha['address'], buy['token'])
-                            continue
-                        
-                        # ULTRA-CONSERVATIVE POSITION SIZING
-                        current_balance = self.wallet.get_balance()
-                        
-                        # Never use more than 2% of balance per trade
-                        max_position = current_balance * 0.02
-                        
-                        # Base position size on balance and CONFIG
-                        base_position = float(CONFIG.get('BASE_POSITION_SIZE', 0.05))
-                        
-                        # Adjust based on balance
-                        if current_balance < 2:
-                            base_position = 0.02  # Ultra tiny for <2 SOL
-                        elif current_balance < 5:
-                            base_position = min(0.05, base_position)  # Small for <5 SOL
-                        elif current_balance < 10:
-                            base_position = min(0.1, base_position)   # Moderate for <10 SOL
-                        
-                        # Adjust based on wallet performance
-                        wallet_perf = self.wallet_performance.get(alpha['address'], {})
-                        if wallet_perf.get('trades_copied', 0) > 10:
-                            win_rate = (wallet_perf.get('wins', 0) / wallet_perf.get('trades_copied', 1)) * 100
-                            if win_rate >= 70:
-                                base_position = base_position * 1.5  # 50% larger for proven winners
-                            elif win_rate < 40:
-                                base_position = base_position * 0.5  # 50% smaller for poor performers
-                        
-                        # Apply all limits
-                        position_size = min(
-                            base_position,
-                            max_position,  # 2% of balance max
-                            current_balance * 0.1,  # 10% of balance absolute max
-                            float(CONFIG.get('MAX_POSITION_SIZE', 0.15))  # Config max
-                        )
-                        
-                        # Skip if position would be too small
-                        if position_size < 0.01:
-                            logging.warning(f"⚠️ Position size too small ({position_size:.3f} SOL), skipping")
-                            continue
-                        
-                        logging.info(f"💎 ML-APPROVED COPY: {alpha['name']} into {buy['token'][:8]}")
-                        logging.info(f"   Position: {position_size:.3f} SOL ({position_size/current_balance*100:.1f}% of balance)")
-                        logging.info(f"   Liquidity: ${token_data.get('liquidity', 0):,.0f}")
-                        logging.info(f"   Holders: {token_data.get('holders', 0)}")
-                        
-                        # Execute trade
-                        if self.execute_trade(
-                            buy['token'], 
-                            'COPY_TRADE', 
-                            position_size, 
-                            token_data['price'], 
-                            source_wallet=alpha['address']
-                        ):
-                            self.hourly_trades += 1
-                            
-                            # Update wallet performance tracking
-                            wallet_perf['trades_signaled'] += 1
-                            wallet_perf['trades_copied'] += 1
+                        self.process_alpha_buy(alpha, buy)
                             
             except Exception as e:
                 logging.error(f"Error checking wallet {alpha['name']}: {e}")
                 
+    def hourly_trade_slot_available(self):
+        """HOURLY TRADE LIMITING - MAX 20 copy trades per hour, not 1560!"""
+        current_time = time.time()
+        with self.trade_lock:
+            if not hasattr(self, 'hourly_trades'):
+                self.hourly_trades = 0
+                self.hour_start = current_time
+            
+            # Reset hourly counter
+            if current_time - self.hour_start > 3600:
+                self.hourly_trades = 0
+                self.hour_start = current_time
+            
+            return self.hourly_trades < 20
+    
+    def on_alpha_buy(self, wallet_address, buy):
+        """Alpha wallet stream listener - a followed wallet just bought"""
+        alpha = next((w for w in self.alpha_wallets if w['address'] == wallet_address), None)
+        if not alpha or not alpha.get('active', True):
+            return
+        logging.info(f"⚡ {alpha['name']} bought {buy['token'][:8]} (slot {buy.get('slot')})")
+        try:
+            self.process_alpha_buy(alpha, buy)
+        except Exception as e:
+            logging.error(f"Error copying {alpha['name']} buy of {buy['token'][:8]}: {e}")
+    
+    @with_request_priority(HostRateLimiter.PRIORITY_TRADE)
+    def process_alpha_buy(self, alpha, buy):
+        """Run one alpha wallet buy through the ML / liquidity filters and copy it if it passes"""
+        if not self.hourly_trade_slot_available():
+            return False
+        wallet_style = alpha.get('style', 'SCALPER')
+        
+        # Skip if already in position/monitoring
+        if buy['token'] in self.positions or buy['token'] in self.monitoring:
+            return False
+            
+        # Get token data
+        token_data = self.get_token_snapshot(buy['token'], wallet_style)
+        if not token_data or token_data.get('price', 0) == 0:
+            return False
+            
+        # GET WALLET STATS FOR ML
+        wallet_stats = None
+        if hasattr(self, 'db_manager'):
+            wallet_stats = self.db_manager.get_wallet_stats(alpha['address'])
+
+        if not hasattr(self, 'ml_brain'):
+            logging.error("❌ ML Brain not initialized - initializing now")
+            self.initialize_ml_system()
+        
+        if not self.ml_brain or not self.ml_brain.is_trained:
+            logging.warning("⚠️ ML not trained - attempting to train")
+            self.force_ml_training()
+
+        # Debug wallet stats
+        logging.debug(f"Wallet stats for {alpha['name']}: {wallet_stats}")
+        
+        # TRACK ALL TRADES FOR LEARNING
+        if not wallet_stats or wallet_stats['total_trades'] < 5:
+            logging.warning(f"❌ No/few stats for {alpha['name']} - tracking outcome for learning")
+            self.track_wallet_trade_outcome(alpha['address'], buy['token'])
+            
+            # For unknown wallets, be extra cautious
+            if token_data.get('liquidity', 0) < 10000:
+                logging.info(f"❌ Unknown wallet + low liquidity - skipping but tracking")
+                return False
+            if token_data.get('holders', 0) < 100:
+                logging.info(f"❌ Unknown wallet + few holders - skipping but tracking")
+                return False
+                
+            # Use conservative stats for ML
+            wallet_stats = {
+                'win_rate': 30,  # Assume bad until proven
+                'total_trades': 1,
+                'avg_profit_per_trade': -0.01
+            }
+        
+        # ML FILTERING - THIS IS CRITICAL!
+        if hasattr(self, 'ml_brain') and self.ml_brain and self.ml_brain.is_trained and wallet_stats:
+            action, confidence = self.ml_brain.predict_trade(
+                wallet_stats, 
+                token_data
+            )
+            
+            # DEBUG LOG
+            logging.debug(f"ML inputs - wallet_stats: {wallet_stats}, is_trained: {self.ml_brain.is_trained}")
+            logging.info(f"🤖 ML Decision: {action} with {confidence:.1%} confidence for ${token_data.get('liquidity', 0):,.0f} liquidity")
+            
+            # ONLY TAKE HIGH CONFIDENCE TRADES
+            if action not in ['STRONG_BUY', 'BUY'] or confidence < self.min_ml_confidence:
+                logging.info(f"❌ ML REJECTED: {alpha['name']} trade - {confidence:.1%} confidence < {self.min_ml_confidence:.1%} required")
+                # Still track for learning!
+                self.track_wallet_trade_outcome(alpha['address'], buy['token'])
+                return False
+            else:
+                logging.info(f"✅ ML APPROVED: {alpha['name']} trade - {confidence:.1%} confidence")
+        else:
+            # If ML not ready, be extra cautious
+            if not (token_data.get('liquidity', 0) > 10000 and token_data.get('holders', 0) > 100):
+                logging.warning(f"⚠️ No ML available - skipping low quality token")
+                self.track_wallet_trade_outcome(alpha['address'], buy['token'])
+                return False
+        
+        # Check liquidity
+        style_params = self.wallet_styles.get(alpha['address'], self.get_style_params('SCALPER'))
+        min_liquidity = style_params.get('min_liquidity', 5000)
+        
+        if token_data.get('liquidity', 0) < min_liquidity:
+            logging.warning(f"⚠️ Skipping {buy['token'][:8]} - low liquidity ${token_data.get('liquidity', 0)} < ${min_liquidity}")
+            self.track_wallet_trade_outcome(alpha['address'], buy['token'])
+            return False
+        
+        # ULTRA-CONSERVATIVE POSITION SIZING
+        current_balance = self.wallet.get_balance()
+        
+        # Never use more than 2% of balance per trade
+        max_position = current_balance * 0.02
+        
+        # Base position size on balance and CONFIG
+        base_position = float(CONFIG.get('BASE_POSITION_SIZE', 0.05))
+        
+        # Adjust based on balance
+        if current_balance < 2:
+            base_position = 0.02  # Ultra tiny for <2 SOL
+        elif current_balance < 5:
+            base_position = min(0.05, base_position)  # Small for <5 SOL
+        elif current_balance < 10:
+            base_position = min(0.1, base_position)   # Moderate for <10 SOL
+        
+        # Adjust based on wallet performance
+        wallet_perf = self.wallet_performance.get(alpha['address'], {})
+        if wallet_perf.get('trades_copied', 0) > 10:
+            win_rate = (wallet_perf.get('wins', 0) / wallet_perf.get('trades_copied', 1)) * 100
+            if win_rate >= 70:
+                base_position = base_position * 1.5  # 50% larger for proven winners
+            elif win_rate < 40:
+                base_position = base_position * 0.5  # 50% smaller for poor performers
+        
+        # Apply all limits
+        position_size = min(
+            base_position,
+            max_position,  # 2% of balance max
+            current_balance * 0.1,  # 10% of balance absolute max
+            float(CONFIG.get('MAX_POSITION_SIZE', 0.15))  # Config max
+        )
+        
+        # Skip if position would be too small
+        if position_size < 0.01:
+            logging.warning(f"⚠️ Position size too small ({position_size:.3f} SOL), skipping")
+            return False
+        
+        logging.info(f"💎 ML-APPROVED COPY: {alpha['name']} into {buy['token'][:8]}")
+        logging.info(f"   Position: {position_size:.3f} SOL ({position_size/current_balance*100:.1f}% of balance)")
+        logging.info(f"   Liquidity: ${token_data.get('liquidity', 0):,.0f}")
+        logging.info(f"   Holders: {token_data.get('holders', 0)}")
+        
+        # Claim the hourly slot first - stream resolver threads copy buys concurrently
+        with self.trade_lock:
+            if not self.hourly_trade_slot_available():
+                return False
+            self.hourly_trades += 1
+        
+        # Execute trade
+        if self.execute_trade(
+            buy['token'], 
+            'COPY_TRADE', 
+            position_size, 
+            token_data['price'], 
+            source_wallet=alpha['address']
+        ):
+            # Update wallet performance tracking
+            with self.trade_lock:
+                wallet_perf['trades_signaled'] += 1
+                wallet_perf['trades_copied'] += 1
+            return True
+        
+        # No buy - hand the slot back
+        with self.trade_lock:
+            self.hourly_trades = max(0, self.hourly_trades - 1)
+        return False
+    
+    def alpha_exit_candidates(self):
+        """(token, position, alpha_wallet) for positions that follow an alpha wallet's exit"""
+        candidates = []
+        for token, position in list(self.positions.items()):
+            # Check both COPY_TRADE and regular alpha positions
+            strategy = position.get('strategy', 'UNKNOWN')
+            alpha_wallet = position.get('source_wallet') or position.get('alpha_wallet')
+            
+            # Skip if no alpha wallet to monitor
+            if not alpha_wallet or alpha_wallet == 'SELF_DISCOVERED':
+                continue
+            
+            # Skip momentum trades - they have their own exit logic
+            if strategy in ['MOMENTUM_EXPLOSION', 'MOMENTUM_DETECT', 'MORI_SETUP', 'PRE_PUMP_PATTERN']:
+                continue
+            candidates.append((token, position, alpha_wallet))
+        return candidates
+    
     def check_alpha_exits(self):
         """Enhanced alpha exit detection - monitors when alpha wallets sell positions"""
         try:
@@ -1443,18 +2378,18 @@ class AdaptiveAlphaTrader:
                 return
                 
             current_time = time.time()
-            
-            for token, position in list(self.positions.items()):
-                # Check both COPY_TRADE and regular alpha positions
-                strategy = position.get('strategy', 'UNKNOWN')
-                alpha_wallet = position.get('source_wallet') or position.get('alpha_wallet')
-                
-                # Skip if no alpha wallet to monitor
-                if not alpha_wallet or alpha_wallet == 'SELF_DISCOVERED':
-                    continue
-                
-                # Skip momentum trades - they have their own exit logic
-                if strategy in ['MOMENTUM_EXPLOSION', 'MOMENTUM_DETECT', 'MORI_SETUP', 'PRE_PUMP_PATTERN']:
+            current_prices = None
+            candidates = self.alpha_exit_candidates()
+            
+            # Every alpha token account in one getMultipleAccounts (skipped while the stream is live and fresh)
+            alpha_holding_stream.sync((alpha_wallet, token) for token, _, alpha_wallet in candidates)
+            if CONFIG['ALPHA_EXIT_STREAM_ENABLED'] and candidates:
+                alpha_holding_stream.start()
+            alpha_holding_stream.refresh()
+            
+            for token, position, alpha_wallet in candidates:
+                # The holding stream is already selling this one
+                if position.get('exit_pending'):
                     continue
                 
                 try:
@@ -1468,43 +2403,17 @@ class AdaptiveAlphaTrader:
                         if int(current_time) % 60 == 0:  # Log every minute for perfect bots
                             logging.info(f"🔍 Monitoring PERFECT BOT {alpha_name} position in {token[:8]}...")
                     
-                    # Check if alpha wallet still holds the token
-                    alpha_balance = get_token_balance(alpha_wallet, token)
+                    # Check if alpha wallet still holds the token (full lookup only when its token accounts can't tell)
+                    alpha_balance = alpha_holding_stream.balance(alpha_wallet, token)
+                    if alpha_balance is None:
+                        alpha_balance = get_token_balance(alpha_wallet, token)
                     
                     if alpha_balance == 0:
-                        logging.warning(f"🚨 ALPHA EXIT DETECTED!")
-                        logging.info(f"   Wallet: {alpha_name} ({alpha_style})")
-                        logging.info(f"   Token: {token[:8]}")
-                        logging.info(f"   Strategy: {strategy}")
-                        logging.info(f"   Our Position: {position['size']:.3f} SOL")
-                        
-                        # Get current price for P&L calculation
-                        current_price = get_token_price(token)
-                        if current_price and position.get('entry_price'):
-                            pnl_pct = ((current_price - position['entry_price']) / position['entry_price']) * 100
-                            pnl_sol = position['size'] * (pnl_pct / 100)
-                            logging.info(f"   P&L before exit: {pnl_pct:+.1f}% ({pnl_sol:+.3f} SOL)")
-                            
-                            # Special alert for PERFECT_BOT exits
-                            if alpha_style == 'PERFECT_BOT':
-                                if pnl_pct > 0:
-                                    logging.info(f"🏆 PERFECT BOT PROFIT EXIT: +{pnl_pct:.1f}% gain!")
-                                else:
-                                    logging.warning(f"⚠️ PERFECT BOT STOP EXIT: {pnl_pct:.1f}% loss")
-                        
-                        # Execute immediate sell with enhanced retry logic
-                        logging.info(f"💰 Following {alpha_name} - selling {token[:8]} immediately")
-                        sell_result = self.ensure_position_sold(token, position, 'alpha_exit')
-                        
-                        if sell_result:
-                            logging.info(f"✅ Successfully followed {alpha_name} exit from {token[:8]}")
-                            # Position is already removed and recorded in ensure_position_sold
-                        else:
-                            logging.error(f"❌ Failed to follow {alpha_name} exit from {token[:8]}")
-                            # Still remove from tracking to avoid getting stuck
-                            if token in self.positions:
-                                del self.positions[token]
-                                logging.info(f"🗑️ Removed {token[:8]} from position tracking after failed exit")
+                        # Get current price for P&L calculation (one batch for all positions on first exit)
+                        if current_prices is None:
+                            current_prices = get_token_prices(list(self.positions.keys()))
+                        position['exit_pending'] = True
+                        self.follow_alpha_exit(token, position, alpha_wallet, current_prices)
                         
                 except Exception as e:
                     logging.debug(f"Error checking alpha balance for {token[:8]} from {alpha_wallet[:8]}: {e}")
@@ -1512,7 +2421,69 @@ class AdaptiveAlphaTrader:
                     
         except Exception as e:
             logging.error(f"Error in check_alpha_exits: {e}")
+    
+    @with_request_priority(HostRateLimiter.PRIORITY_EXIT)
+    def follow_alpha_exit(self, token, position, alpha_wallet, current_prices=None):
+        """Sell a position because the alpha wallet we copied no longer holds the token (caller sets exit_pending)"""
+        strategy = position.get('strategy', 'UNKNOWN')
+        alpha_info = next((w for w in self.alpha_wallets if w['address'] == alpha_wallet), None)
+        alpha_name = alpha_info['name'] if alpha_info else f"{alpha_wallet[:8]}..."
+        alpha_style = alpha_info.get('style', 'UNKNOWN') if alpha_info else 'UNKNOWN'
+        
+        try:
+            logging.warning(f"🚨 ALPHA EXIT DETECTED!")
+            logging.info(f"   Wallet: {alpha_name} ({alpha_style})")
+            logging.info(f"   Token: {token[:8]}")
+            logging.info(f"   Strategy: {strategy}")
+            logging.info(f"   Our Position: {position['size']:.3f} SOL")
+            
+            # Get current price for P&L calculation
+            if current_prices is None:
+                current_prices = get_token_prices([token])
+            current_price = current_prices.get(token)
+            if current_price and position.get('entry_price'):
+                pnl_pct = ((current_price - position['entry_price']) / position['entry_price']) * 100
+                pnl_sol = position['size'] * (pnl_pct / 100)
+                logging.info(f"   P&L before exit: {pnl_pct:+.1f}% ({pnl_sol:+.3f} SOL)")
+                
+                # Special alert for PERFECT_BOT exits
+                if alpha_style == 'PERFECT_BOT':
+                    if pnl_pct > 0:
+                        logging.info(f"🏆 PERFECT BOT PROFIT EXIT: +{pnl_pct:.1f}% gain!")
+                    else:
+                        logging.warning(f"⚠️ PERFECT BOT STOP EXIT: {pnl_pct:.1f}% loss")
+            
+            # Execute immediate sell with enhanced retry logic
+            logging.info(f"💰 Following {alpha_name} - selling {token[:8]} immediately")
+            sell_result = self.ensure_position_sold(token, position, 'alpha_exit')
+            
+            if sell_result:
+                logging.info(f"✅ Successfully followed {alpha_name} exit from {token[:8]}")
+                # Position is already removed and recorded in ensure_position_sold
+            else:
+                logging.error(f"❌ Failed to follow {alpha_name} exit from {token[:8]}")
+                # Still remove from tracking to avoid getting stuck
+                if token in self.positions:
+                    del self.positions[token]
+                    logging.info(f"🗑️ Removed {token[:8]} from position tracking after failed exit")
+        finally:
+            position['exit_pending'] = False
+    
+    def on_alpha_holding_exit(self, alpha_wallet, token):
+        """Alpha holding stream listener - the copied wallet's balance just hit zero"""
+        position = self.positions.get(token)
+        if not position or position.get('exit_pending'):
+            return
+        if alpha_wallet not in (position.get('source_wallet'), position.get('alpha_wallet')):
+            return
+        
+        # Sell off the websocket thread; the flag keeps check_alpha_exits from selling twice
+        position['exit_pending'] = True
+        logging.warning(f"⚡ Alpha holding stream exit trigger: {alpha_wallet[:8]} left {token[:8]}")
+        
+        self.stream_exit_executor.submit(self.follow_alpha_exit, token, position, alpha_wallet)
             
+    @with_request_priority(HostRateLimiter.PRIORITY_SCAN)
     def find_opportunities_independently(self):
         """Hunt for opportunities without waiting for alpha signals"""
         logging.warning("🔍 INDEPENDENT HUNT TRIGGERED!")
@@ -1527,7 +2498,7 @@ class AdaptiveAlphaTrader:
             # STRATEGY 3: Your existing pattern detection (keep as fallback)
             # Use your EXISTING token discovery function
             logging.info("🔍 Scanning for independent opportunities...")
-            new_tokens = enhanced_find_newest_tokens_with_free_apis()[:50]  # Get more tokens to analyze
+            new_tokens = current_market_universe().tokens(50)  # Get more tokens to analyze
             
             opportunities_found = 0
             
@@ -1736,7 +2707,7 @@ class AdaptiveAlphaTrader:
                 return
                 
             # Find similar tokens
-            new_tokens = enhanced_find_newest_tokens_with_free_apis()[:30]
+            new_tokens = current_market_universe().tokens(30)
             
             for token in new_tokens:
                 try:
@@ -1851,40 +2822,35 @@ class AdaptiveAlphaTrader:
         logging.info(f"   👥 Holders: {token_data['holders']}")
         
         
+    def get_token_prices(self, token_addresses):
+        """Batched prices for dashboards and reports"""
+        return get_token_prices(token_addresses)
+    
     def get_token_snapshot(self, token_address, alpha_wallet_style=None):
         """Get current token metrics with Perfect Bot fallback support"""
         try:
-            # Use your existing functions
-            price = get_token_price(token_address)
-            liquidity = get_token_liquidity(token_address) or 0
-            holders = get_holder_count(token_address) or 0
-            volume = get_24h_volume(token_address) or 0
-            age = get_token_age_minutes(token_address) or 0
+            # One DexScreener request plus concurrent holder lookup
+            snapshot = fetch_token_snapshot(token_address)
             
             # If we got basic data, return it
-            if price and price > 0:
-                return {
-                    'price': price,
-                    'liquidity': liquidity,
-                    'holders': holders,
-                    'volume': volume,
-                    'age': age
-                }
+            if snapshot.price and snapshot.price > 0:
+                return snapshot
             
             # PERFECT BOT FALLBACK: If no price data but this is from a perfect bot
             if alpha_wallet_style and alpha_wallet_style.startswith('PERFECT_BOT'):
                 logging.warning(f"🤖 PERFECT BOT FALLBACK: No price data for {token_address[:8]}, creating minimal data")
                 
                 # Create minimal data structure for perfect bot trades
-                fallback_data = {
-                    'price': 0.000001,  # Minimal price for calculations
-                    'liquidity': 5000 if alpha_wallet_style == 'PERFECT_BOT_SWING' else 2000,  # Assume reasonable liquidity
-                    'holders': 100,  # Assume some holders
-                    'volume': 1000,  # Assume some volume
-                    'age': 60,  # Assume 1 hour old
-                    'fallback': True,  # Mark as fallback data
-                    'perfect_bot_override': True
-                }
+                fallback_data = TokenSnapshot(
+                    token_address,
+                    price=0.000001,  # Minimal price for calculations
+                    liquidity=5000 if alpha_wallet_style == 'PERFECT_BOT_SWING' else 2000,  # Assume reasonable liquidity
+                    holders=100,  # Assume some holders
+                    volume=1000,  # Assume some volume
+                    age=60,  # Assume 1 hour old
+                    fallback=True,  # Mark as fallback data
+                    perfect_bot_override=True
+                )
                 
                 logging.info(f"🤖 Using fallback data for {token_address[:8]} from {alpha_wallet_style}")
                 return fallback_data
@@ -1899,15 +2865,16 @@ class AdaptiveAlphaTrader:
             # EMERGENCY FALLBACK for perfect bots even on error
             if alpha_wallet_style and alpha_wallet_style.startswith('PERFECT_BOT'):
                 logging.warning(f"🚨 EMERGENCY FALLBACK: Error getting data for {token_address[:8]} from {alpha_wallet_style}")
-                return {
-                    'price': 0.000001,
-                    'liquidity': 1000,
-                    'holders': 50,
-                    'volume': 500,
-                    'age': 30,
-                    'fallback': True,
-                    'emergency_fallback': True
-                }
+                return TokenSnapshot(
+                    token_address,
+                    price=0.000001,
+                    liquidity=1000,
+                    holders=50,
+                    volume=500,
+                    age=30,
+                    fallback=True,
+                    emergency_fallback=True
+                )
             
             return None
             
@@ -1981,11 +2948,30 @@ class AdaptiveAlphaTrader:
                     self.execute_trade(token_address, strategy, adjusted_size, current['price'])
                     
                     
+    @with_request_priority(HostRateLimiter.PRIORITY_TRADE)
     def execute_trade(self, token_address, strategy, position_size, entry_price, source_wallet=None):
         """Execute the trade using your working function with source wallet tracking and database recording"""
+        # Concurrent scanners may pick the same token - claim it (and a daily-limit slot) before the slow checks
+        with self.trade_lock:
+            if not self._reserve_trade(token_address):
+                return False
+            self.pending_buys.add(token_address)
+        try:
+            return self._execute_trade(token_address, strategy, position_size, entry_price, source_wallet)
+        finally:
+            with self.trade_lock:
+                self.pending_buys.discard(token_address)
+    
+    def _reserve_trade(self, token_address):
+        """Position and daily-limit checks - caller holds trade_lock"""
+        # Already turned down - no need to run the checks again
+        rejected_for = rejection_cache.check(token_address)
+        if rejected_for:
+            logging.info(f"⏭️ Skipping {token_address[:8]} - rejected earlier ({rejected_for})")
+            return False
         
         # CHECK IF ALREADY IN POSITION - ADD THIS
-        if token_address in self.positions:
+        if token_address in self.positions or token_address in self.pending_buys:
             logging.warning(f"⚠️ Already have position in {token_address[:8]} - skipping duplicate buy")
             return False
         
@@ -1995,10 +2981,12 @@ class AdaptiveAlphaTrader:
             self.daily_trades = 0
             self.last_trade_date = current_date
             
-        if self.daily_trades >= self.daily_trade_limit:
+        if self.daily_trades + len(self.pending_buys) >= self.daily_trade_limit:
             logging.warning(f"🛑 Daily trade limit reached ({self.daily_trade_limit} trades)")
             return False
-        
+        return True
+    
+    def _execute_trade(self, token_address, strategy, position_size, entry_price, source_wallet=None):
         # HONEYPOT CHECK - CRITICAL!
         is_honeypot, score, reasons = self.is_honeypot(token_address)
         
@@ -2021,7 +3009,7 @@ class AdaptiveAlphaTrader:
                 "method": "getTokenLargestAccounts",
                 "params": [token_address]
             }
-            response = requests.post(url, json=payload, timeout=5)
+            response = HTTP_SESSION.post(url, json=payload, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if 'result' in data and 'value' in data['result'] and len(data['result']['value']) > 0:
@@ -2047,6 +3035,7 @@ class AdaptiveAlphaTrader:
         # ADDITIONAL SELL ROUTE VERIFICATION (double-check for all trades)
         if not self.verify_sell_route_exists(token_address):
             logging.error(f"🚨 BLOCKED: No sell route exists for {token_address[:8]}")
+            rejection_cache.reject(token_address, 'NO_SELL_ROUTE')
             return False
         
         # EMERGENCY LAST-RESORT CHECK
@@ -2086,10 +3075,13 @@ class AdaptiveAlphaTrader:
                 # Only block if REALLY low
                 if liquidity < 500:
                     logging.error(f"❌ MOMENTUM BLOCKED: Liquidity ${liquidity} too low (need $500+)")
+                    rejection_cache.reject(token_address, 'LOW_LIQUIDITY')
                     return False
                     
             if not holders or holders < 30:  # Lowered from 50!
                 logging.error(f"❌ MOMENTUM BLOCKED: Only {holders} holders (need 30+)")
+                if holders:   # 0 means the count is unknown - not a verdict
+                    rejection_cache.reject(token_address, 'LOW_HOLDERS')
                 return False
         
         # COLLECT ML ENTRY FEATURES BEFORE TRADE
@@ -2131,6 +3123,11 @@ class AdaptiveAlphaTrader:
         else:
             targets = {'take_profit': 1.20, 'stop_loss': 0.92, 'trailing': True}  # Default safe targets
     
+        # A scanner job past its deadline has moved on - its opportunity is stale
+        if scanner_deadline_passed():
+            logging.warning(f"⏱️ Scanner deadline passed - not buying {token_address[:8]}")
+            return False
+        
         # USE YOUR WORKING FUNCTION!
         signature = execute_optimized_transaction(token_address, position_size)
     
@@ -2140,8 +3137,9 @@ class AdaptiveAlphaTrader:
             # Get liquidity if we haven't already (for non-momentum trades)
             if liquidity is None:
                 liquidity = get_token_liquidity(token_address) or 0
+            initial_volume = get_24h_volume(token_address)
         
-            self.positions[token_address] = {
+            position = {
                 'strategy': strategy,
                 'entry_price': entry_price,
                 'size': position_size,
@@ -2151,7 +3149,7 @@ class AdaptiveAlphaTrader:
                 'signature': signature,
                 'source_wallet': source_wallet,  # Track which alpha we're following
                 'partial_sold': False,  # Track partial profit taking
-                'initial_vol_liq_ratio': get_24h_volume(token_address) / max(liquidity, 1) if liquidity else None,
+                'initial_vol_liq_ratio': initial_volume / max(liquidity, 1) if liquidity else None,
                 # ADD ML TRACKING DATA
                 'ml_entry_features': ml_entry_features,
                 'initial_holders': holders,
@@ -2160,6 +3158,14 @@ class AdaptiveAlphaTrader:
                 'entry_age': age
             }
             
+            # Bookkeeping only under the lock - the swap above ran without it
+            with self.trade_lock:
+                self.positions[token_address] = position
+                # Update brain stats
+                self.brain.daily_stats['trades'] += 1
+                # INCREMENT DAILY TRADE COUNTER
+                self.daily_trades += 1
+            
             # RECORD ML TRADE ENTRY
             if hasattr(self, 'brain') and self.brain:
                 try:
@@ -2168,12 +3174,6 @@ class AdaptiveAlphaTrader:
                 except Exception as e:
                     logging.debug(f"ML recording error: {e}")
         
-            # Update brain stats
-            self.brain.daily_stats['trades'] += 1
-            
-            # INCREMENT DAILY TRADE COUNTER
-            self.daily_trades += 1
-        
             # Remove from monitoring
             if token_address in self.monitoring:
                 del self.monitoring[token_address]
@@ -2271,24 +3271,25 @@ class AdaptiveAlphaTrader:
                         logging.warning(f"✅ BUNDLE SUCCESS: {response.get('bundleId')}")
                         
                         # Track all positions
-                        for i, opp in enumerate(valid_opportunities):
-                            self.positions[opp['token']] = {
-                                'strategy': 'MOMENTUM_EXPLOSION',
-                                'entry_price': opp['price'],
-                                'size': opp['position_size'],
-                                'targets': {'take_profit': 1.50, 'stop_loss': 0.85, 'trailing': True},
-                                'entry_time': time.time(),
-                                'peak_price': opp['price'],
-                                'signature': response.get('signatures', [])[i] if i < len(response.get('signatures', [])) else 'bundle',
-                                'source_wallet': 'MOMENTUM_BUNDLE',
-                                'partial_sold': False,
-                                'bundle_id': response.get('bundleId')
-                            }
-                            
-                            # Update daily trades
-                            self.daily_trades += 1
-                            
-                            logging.info(f"📊 Position tracked: {opp['token'][:8]}")
+                        with self.trade_lock:
+                            for i, opp in enumerate(valid_opportunities):
+                                self.positions[opp['token']] = {
+                                    'strategy': 'MOMENTUM_EXPLOSION',
+                                    'entry_price': opp['price'],
+                                    'size': opp['position_size'],
+                                    'targets': {'take_profit': 1.50, 'stop_loss': 0.85, 'trailing': True},
+                                    'entry_time': time.time(),
+                                    'peak_price': opp['price'],
+                                    'signature': response.get('signatures', [])[i] if i < len(response.get('signatures', [])) else 'bundle',
+                                    'source_wallet': 'MOMENTUM_BUNDLE',
+                                    'partial_sold': False,
+                                    'bundle_id': response.get('bundleId')
+                                }
+                                
+                                # Update daily trades
+                                self.daily_trades += 1
+                                
+                                logging.info(f"📊 Position tracked: {opp['token'][:8]}")
                         
                         return True
                     else:
@@ -2319,15 +3320,27 @@ class AdaptiveAlphaTrader:
         try:
             current_time = time.time()
             
+            # One batched price pass for every position (also warms the cache for momentum monitors).
+            # Recently expired prices come back instantly while a background refresh runs.
+            current_prices = get_token_prices(list(self.positions.keys()), allow_stale=True)
+            
+            # Keep pool vault subscriptions in line with what we hold
+            if CONFIG['POOL_STREAM_ENABLED']:
+                pool_reserve_stream.sync(self.positions.keys())
+            
             for token, position in list(self.positions.items()):
                 try:
+                    # The pool stream is already selling this one
+                    if position.get('exit_pending'):
+                        continue
+                    
                     # Special handling for momentum trades
                     if position.get('strategy') in ['MOMENTUM_EXPLOSION', 'MOMENTUM_DETECT', 'MORI_SETUP', 'PRE_PUMP_PATTERN']:
                         self.monitor_momentum_position(token, position)
                         continue  # Skip regular monitoring for momentum trades
                     
                     # Get current price
-                    current_price = get_token_price(token)
+                    current_price = current_prices.get(token)
                     if not current_price:
                         continue
                     
@@ -2349,22 +3362,8 @@ class AdaptiveAlphaTrader:
                     pnl_sol = position_size * (pnl_pct / 100)
                     
                     # TRAILING STOP LOGIC - CRITICAL!
-                    if pnl_pct > 15:  # If we're up 15%+
-                        # Update peak price
-                        if current_price > position.get('peak_price', entry_price):
-                            position['peak_price'] = current_price
-                            logging.info(f"📈 New peak for {token[:8]}: +{pnl_pct:.1f}%")
-                            
-                        # Calculate drop from peak
-                        peak = position.get('peak_price', entry_price)
-                        drop_from_peak = ((peak - current_price) / peak) * 100
-                        
-                        # Sell if dropped 30% from peak
-                        if drop_from_peak > 30:
-                            logging.warning(f"🔴 TRAILING STOP: {token[:8]} dropped {drop_from_peak:.1f}% from peak")
-                            logging.warning(f"   Peak: ${peak:.8f}, Now: ${current_price:.8f}")
-                            self.ensure_position_sold(token, position, "trailing_stop")
-                            continue
+                    if self.check_trailing_stop(token, position, current_price):
+                        continue
                     
                     # Hold time
                     hold_time = (current_time - entry_time) / 60
@@ -2404,13 +3403,7 @@ class AdaptiveAlphaTrader:
                             logging.info(f"   Will hold until alpha exits or limits hit")
                     
                     # STOP LOSS - Use wallet-specific stop loss
-                    if pnl_pct <= stop_loss_pct:
-                        if alpha_style == 'PERFECT_BOT':
-                            logging.warning(f"🚨 PERFECT BOT STOP LOSS: {alpha_name}")
-                            logging.warning(f"   {token[:8]}: {pnl_pct:.1f}% hit {stop_loss_pct}% stop")
-                        else:
-                            logging.info(f"🛑 STOP LOSS HIT for {token[:8]}: {pnl_pct:.1f}%")
-                        self.ensure_position_sold(token, position, 'stop_loss')
+                    if self.check_stop_loss(token, position, pnl_pct, stop_loss_pct, alpha_style, alpha_name):
                         continue
                     
                     # MAX HOLD TIME - Use wallet-specific max hold time
@@ -2435,6 +3428,107 @@ class AdaptiveAlphaTrader:
         except Exception as e:
             logging.error(f"Error in monitor_positions: {e}")
             
+    def check_trailing_stop(self, token, position, current_price):
+        """Track the peak and sell on a 30% drop from it once we are up 15%+. Returns True if sold."""
+        entry_price = position['entry_price']
+        pnl_pct = ((current_price - entry_price) / entry_price) * 100
+        
+        if pnl_pct > 15:  # If we're up 15%+
+            # Update peak price
+            if current_price > position.get('peak_price', entry_price):
+                position['peak_price'] = current_price
+                logging.info(f"📈 New peak for {token[:8]}: +{pnl_pct:.1f}%")
+                
+            # Calculate drop from peak
+            peak = position.get('peak_price', entry_price)
+            drop_from_peak = ((peak - current_price) / peak) * 100
+            
+            # Sell if dropped 30% from peak
+            if drop_from_peak > 30:
+                logging.warning(f"🔴 TRAILING STOP: {token[:8]} dropped {drop_from_peak:.1f}% from peak")
+                logging.warning(f"   Peak: ${peak:.8f}, Now: ${current_price:.8f}")
+                self.ensure_position_sold(token, position, "trailing_stop")
+                return True
+        return False
+    
+    def check_stop_loss(self, token, position, pnl_pct, stop_loss_pct, alpha_style, alpha_name):
+        """Sell when the wallet-specific stop loss is hit. Returns True if sold."""
+        if pnl_pct > stop_loss_pct:
+            return False
+        
+        if alpha_style == 'PERFECT_BOT':
+            logging.warning(f"🚨 PERFECT BOT STOP LOSS: {alpha_name}")
+            logging.warning(f"   {token[:8]}: {pnl_pct:.1f}% hit {stop_loss_pct}% stop")
+        else:
+            logging.info(f"🛑 STOP LOSS HIT for {token[:8]}: {pnl_pct:.1f}%")
+        self.ensure_position_sold(token, position, 'stop_loss')
+        return True
+    
+    def pool_unit_entry_price(self, token, position, current_price):
+        """Entry price in the pool stream's unit (SOL per whole token).
+        
+        Entries recorded from raw-unit Jupiter quotes (before prices were decimals-adjusted)
+        are 10^(9 - decimals) too large; the first pool price converts such an entry once.
+        """
+        entry_price = position['entry_price']
+        if position.get('entry_unit_checked'):
+            return entry_price
+        position['entry_unit_checked'] = True
+        
+        decimals = token_store.get(token, 'decimals')
+        if decimals is None or int(decimals) == 9:
+            return entry_price
+        raw_unit_scale = 10 ** (9 - int(decimals))
+        ratio = current_price / entry_price
+        if not 0.5 <= ratio <= 2 and 0.5 <= ratio * raw_unit_scale <= 2:
+            entry_price /= raw_unit_scale
+            logging.warning(f"📐 Converted raw-unit entry price for {token[:8]} to SOL per token: {entry_price:.10f}")
+            position['entry_price'] = entry_price
+            if position.get('peak_price'):
+                position['peak_price'] /= raw_unit_scale
+        return entry_price
+    
+    def on_pool_price_update(self, token, current_price, slot=None):
+        """Pool stream listener - runs the stop checks on every vault update for held tokens"""
+        position = self.positions.get(token)
+        if not position or position.get('exit_pending') or not position.get('entry_price'):
+            return
+        
+        # Momentum trades keep their own exit logic
+        if position.get('strategy') in ['MOMENTUM_EXPLOSION', 'MOMENTUM_DETECT', 'MORI_SETUP', 'PRE_PUMP_PATTERN']:
+            return
+        
+        alpha_wallet = position.get('source_wallet') or position.get('alpha_wallet', 'UNKNOWN')
+        alpha_info = next((w for w in self.alpha_wallets if w['address'] == alpha_wallet), None)
+        alpha_name = alpha_info['name'] if alpha_info else f"{alpha_wallet[:8]}..."
+        alpha_style = alpha_info.get('style', 'SCALPER') if alpha_info else 'SCALPER'
+        style_params = self.wallet_styles.get(alpha_wallet, self.get_style_params(alpha_style))
+        
+        entry_price = self.pool_unit_entry_price(token, position, current_price)
+        pnl_pct = ((current_price - entry_price) / entry_price) * 100
+        stop_loss_pct = -float(style_params.get('stop_loss', 8))
+        peak = max(position.get('peak_price', entry_price), current_price)
+        
+        trailing_hit = pnl_pct > 15 and ((peak - current_price) / peak) * 100 > 30
+        if not trailing_hit and pnl_pct > stop_loss_pct:
+            # Still record new peaks so the polling loop sees them
+            if pnl_pct > 15 and current_price > position.get('peak_price', entry_price):
+                position['peak_price'] = current_price
+            return
+        
+        # Sell off the websocket thread; the flag keeps monitor_positions from selling twice
+        position['exit_pending'] = True
+        logging.warning(f"⚡ Pool stream exit trigger for {token[:8]} at slot {slot}: {pnl_pct:+.1f}%")
+        
+        def run_exit():
+            try:
+                if not self.check_trailing_stop(token, position, current_price):
+                    self.check_stop_loss(token, position, pnl_pct, stop_loss_pct, alpha_style, alpha_name)
+            finally:
+                position['exit_pending'] = False
+        
+        self.stream_exit_executor.submit(run_exit)
+    
     def record_trade_result(self, token, position, exit_price, exit_reason):
         """Record the result of a closed trade with database tracking"""
         try:
@@ -2556,6 +3650,7 @@ class AdaptiveAlphaTrader:
             except Exception as e:
                 logging.error(f"Error verifying {token}: {e}")
                 
+    @with_request_priority(HostRateLimiter.PRIORITY_EXIT)
     def emergency_sell_all_positions(self):
         """Emergency sell all positions - failsafe"""
         logging.warning("🚨 EMERGENCY SELL ALL ACTIVATED")
@@ -2586,10 +3681,8 @@ class AdaptiveAlphaTrader:
         # Step 2: Find and sell ANY other tokens in wallet (untracked ones)
         logging.warning("🔍 Searching for untracked tokens in wallet...")
         try:
-            import requests
-        
             # Get all token accounts
-            response = requests.post(
+            response = HTTP_SESSION.post(
                 os.environ.get('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com'),
                 json={
                     "jsonrpc": "2.0",
@@ -2653,9 +3746,7 @@ class AdaptiveAlphaTrader:
     def get_all_wallet_tokens(self):
         """Get all SPL tokens in wallet"""
         try:
-            import requests
-        
-            response = requests.post(
+            response = HTTP_SESSION.post(
                 os.environ.get('SOLANA_RPC_URL'),
                 json={
                     "jsonrpc": "2.0",
@@ -2764,7 +3855,7 @@ class AdaptiveAlphaTrader:
         """Determine if it's the market or the signals"""
         try:
             # Check how many tokens are actually pumping
-            recent_tokens = enhanced_find_newest_tokens_with_free_apis()[:100]
+            recent_tokens = current_market_universe().tokens(100)
         
             pumping = 0
             dumping = 0
@@ -2801,84 +3892,79 @@ class AdaptiveAlphaTrader:
             return "UNKNOWN"
 
     def analyze_and_classify_wallet(self, wallet_address, days_to_analyze=7):
-        """Automatically detect wallet trading style"""
+        """Wallet trading style from its stored profile (classified from full history in the background)"""
         try:
-            logging.info(f"🔍 Analyzing wallet {wallet_address[:8]} trading patterns...")
-            
-            # Get recent trades (without days parameter)
-            recent_trades = get_wallet_recent_buys_helius(wallet_address)
+            # Never blocks - a missing or stale profile is queued and on_wallet_classified applies the result
+            profile = wallet_classifier.get(wallet_address)
             
-            if not recent_trades:
+            if not profile:
+                logging.info(f"🔍 Wallet {wallet_address[:8]} queued for history analysis")
                 return 'UNKNOWN', self.get_style_params('SCALPER'), {}
             
-            # Analyze patterns based on what we have
-            trade_count = len(recent_trades)
-            
-            # Since we can't get hold times from get_wallet_recent_buys_helius,
-            # we'll classify based on trading frequency
-            
-            # Classification logic based on trade count
-            if trade_count >= 50:
-                style = 'BOT_TRADER'  # Very high frequency
-                params = {
-                    'max_hold_time': 5,  # Very quick
-                    'stop_loss': 3,      # Tight stop
-                    'take_profit': 8,    # Small but consistent
-                    'position_size_multiplier': 2.0,  # Double size for high certainty
-                    'min_liquidity': 10000,
-                    'copy_delay': 0  # Copy IMMEDIATELY
-                }
-                estimated_win_rate = 90
-                
-            elif trade_count >= 30:
-                style = 'SNIPER'
-                params = self.get_style_params('SNIPER')
-                estimated_win_rate = 75
-                
-            elif trade_count >= 15:
-                style = 'SCALPER'
-                params = self.get_style_params('SCALPER')
-                estimated_win_rate = 65
-                
-            elif trade_count >= 5:
-                style = 'SWINGER'
-                params = self.get_style_params('SWINGER')
-                estimated_win_rate = 60
-                
-            else:
-                style = 'HOLDER'
-                params = {
-                    'max_hold_time': 720,  # 12 hours for selective traders
-                    'stop_loss': 30,       # Give room
-                    'take_profit': 150,    # Big targets
-                    'position_size_multiplier': 1.8,
-                    'min_liquidity': 50000
-                }
-                estimated_win_rate = 70
+            style, stats = profile['style'], profile['stats']
+            params = self.classified_style_params(style)
             
-            logging.info(f"✅ Wallet Classification Complete:")
-            logging.info(f"   Style: {style}")
-            logging.info(f"   Recent Trades: {trade_count}")
-            logging.info(f"   Estimated Type: {style}")
+            logging.info(f"✅ Wallet Classification: {wallet_address[:8]} is {style}")
+            logging.info(f"   Buys: {stats.get('trade_count', 0)} ({stats.get('trades_per_day', 0):.1f}/day), "
+                         f"round trips: {stats.get('round_trips', 0)}")
+            if stats.get('median_hold_minutes') is not None:
+                logging.info(f"   Median hold: {stats['median_hold_minutes']:.1f} min")
+            if stats.get('win_rate') is not None:
+                logging.info(f"   Win rate: {stats['win_rate']:.0f}%")
             
             # Special handling for bot wallets
             if style == 'BOT_TRADER':
                 logging.info(f"   🤖 DETECTED BOT WALLET - PREMIUM SIGNALS!")
                 logging.info(f"   🎯 Will copy trades with 2x position size")
             
-            return style, params, {
-                'trade_count': trade_count,
-                'estimated_win_rate': estimated_win_rate
-            }
+            return style, params, stats
             
         except Exception as e:
             logging.error(f"Error analyzing wallet {wallet_address[:8]}: {e}")
             return 'SCALPER', self.get_style_params('SCALPER'), {}
+    
+    def classified_style_params(self, style):
+        """Copy parameters for a classified style"""
+        if style == 'BOT_TRADER':
+            return {
+                'max_hold_time': 5,  # Very quick
+                'stop_loss': 3,      # Tight stop
+                'take_profit': 8,    # Small but consistent
+                'position_size_multiplier': 2.0,  # Double size for high certainty
+                'min_liquidity': 10000,
+                'copy_delay': 0  # Copy IMMEDIATELY
+            }
+        if style == 'HOLDER':
+            return {
+                'max_hold_time': 720,  # 12 hours for selective traders
+                'stop_loss': 30,       # Give room
+                'take_profit': 150,    # Big targets
+                'position_size_multiplier': 1.8,
+                'min_liquidity': 50000
+            }
+        return self.get_style_params('SCALPER' if style == 'UNKNOWN' else style)
+    
+    def on_wallet_classified(self, wallet_address, style, stats):
+        """Wallet classifier listener - apply a fresh classification to a followed wallet"""
+        wallet = next((w for w in self.alpha_wallets if w['address'] == wallet_address), None)
+        if not wallet or wallet.get('style_locked'):
+            return
+        
+        # Override for known bot wallets
+        if stats.get('win_rate', 0) >= 98:
+            style = 'BOT_TRADER'
+        
+        if style != wallet['style']:
+            logging.warning(f"📊 {wallet['name']} style changed: {wallet['style']} → {style}")
+        wallet['style'] = style
+        wallet['stats'] = stats
+        self.wallet_styles[wallet_address] = self.classified_style_params(style)
 
     def add_alpha_wallet(self, wallet_address, name="", style="AUTO"):
         """Enhanced to auto-detect style"""
     
-        if style == "AUTO":
+        auto = style == "AUTO"
+        if auto:
             # Analyze the wallet automatically
             detected_style, params, stats = self.analyze_and_classify_wallet(wallet_address)
         
@@ -2898,7 +3984,8 @@ class AdaptiveAlphaTrader:
             'trades_copied': 0,
             'profit_generated': 0,
             'active': True,
-            'stats': stats if style == "AUTO" else {}
+            'stats': stats if auto else {},
+            'style_locked': not auto    # explicit styles are not overwritten by the classifier
         })
     
         self.wallet_styles[wallet_address] = params
@@ -2929,23 +4016,9 @@ class AdaptiveAlphaTrader:
 
 
     def reclassify_wallets_periodically(self):
-        """Re-analyze wallets every 24 hours"""
-        if not hasattr(self, 'last_reclassification'):
-            self.last_reclassification = time.time()
-        
-        if time.time() - self.last_reclassification > 86400:  # 24 hours
-            logging.info("🔄 Re-analyzing all wallet styles...")
-        
-            for wallet in self.alpha_wallets:
-                old_style = wallet['style']
-                new_style, params, stats = self.analyze_and_classify_wallet(wallet['address'])
-            
-                if new_style != old_style:
-                    logging.warning(f"📊 {wallet['name']} style changed: {old_style} → {new_style}")
-                    wallet['style'] = new_style
-                    self.wallet_styles[wallet['address']] = params
-                
-            self.last_reclassification = time.time()
+        """Re-analyze wallets every 24 hours (in the background; results arrive via on_wallet_classified)"""
+        for wallet in self.alpha_wallets:
+            wallet_classifier.get(wallet['address'])
 
     def get_style_params(self, style):
         """UPDATED WITH REALISTIC PROFIT TARGETS"""
@@ -3013,6 +4086,7 @@ class AdaptiveAlphaTrader:
         return styles.get(style, styles['SCALPER'])
 
     
+    @with_request_priority(HostRateLimiter.PRIORITY_EXIT)
     def ensure_position_sold(self, token, position, reason="auto_recovery"):
         """Ensures a position gets sold even if first attempt fails - with database tracking"""
         global wallet
@@ -3835,10 +4909,14 @@ class AdaptiveAlphaTrader:
     def is_token_safe(self, token_address):
         """Basic safety check - not too strict"""
         try:
+            if rejection_cache.check(token_address):
+                return False
+            
             # CRITICAL: Can we sell it?
             can_sell = self.simulate_sell_transaction(token_address)
             if can_sell == False:
                 logging.error(f"🚨 NO SELL ROUTE - BLOCKING {token_address[:8]}")
+                rejection_cache.reject(token_address, 'NO_SELL_ROUTE')
                 return False
         
             # Get data
@@ -3848,10 +4926,12 @@ class AdaptiveAlphaTrader:
             # ADJUSTED: More reasonable minimums
             if liquidity and liquidity < 1000:  # Only block VERY low liquidity
                 logging.warning(f"⚠️ Very low liquidity: ${liquidity}")
+                rejection_cache.reject(token_address, 'LOW_LIQUIDITY')
                 return False
             
             if holders and holders < 30:  # Keep this - 10 is reasonable minimum
                 logging.warning(f"⚠️ Very few holders: {holders}")
+                rejection_cache.reject(token_address, 'LOW_HOLDERS')
                 return False
         
             return True
@@ -3957,69 +5037,65 @@ class AdaptiveAlphaTrader:
     def track_skipped_trade(self, wallet_address, token_address, reason):
         """Track trades we didn't take to learn from them"""
         try:
-            # Monitor what happens to tokens we skipped
-            if not hasattr(self, 'skipped_trades'):
-                self.skipped_trades = {}
+            # Priced through get_token_prices, like the outcome check, so both ends share a source
+            entry_price = get_token_prices([token_address]).get(token_address)
+            if not entry_price:
+                return
             
-            self.skipped_trades[token_address] = {
+            # Check skipped trades after 30 minutes
+            deferred_checks.schedule('skipped_trade', 1800, {
+                'token': token_address,
                 'wallet': wallet_address,
                 'skip_time': time.time(),
                 'skip_reason': reason,
-                'entry_price': get_token_price(token_address)
-            }
-        
-            # Check skipped trades after 30 minutes
-            threading.Timer(1800, self.analyze_skipped_trades).start()
+                'entry_price': entry_price
+            }, key=f"skipped_trade:{token_address}")
         
         except Exception as e:
             logging.error(f"Error tracking skipped trade: {e}")
 
-    def analyze_skipped_trades(self):
-        """See if we made the right decision skipping trades"""
-        for token, data in list(self.skipped_trades.items()):
-            if time.time() - data['skip_time'] > 1800:  # 30 minutes old
-                current_price = get_token_price(token)
-                if current_price and data['entry_price']:
-                    profit_pct = ((current_price - data['entry_price']) / data['entry_price']) * 100
-                
-                    if profit_pct > 20:
-                        logging.warning(f"😭 MISSED PROFIT: Skipped {token[:8]} - would have made {profit_pct:.1f}%")
-                    elif profit_pct < -10:
-                        logging.info(f"✅ GOOD SKIP: Avoided {token[:8]} - would have lost {abs(profit_pct):.1f}%")
-                    
-                del self.skipped_trades[token]
+    def analyze_skipped_trades(self, skipped):
+        """See if we made the right decision skipping trades (one price batch for every check due)"""
+        current_prices = get_token_prices([data['token'] for data in skipped])
+        for data in skipped:
+            token = data['token']
+            current_price = current_prices.get(token)
+            if current_price and data['entry_price']:
+                profit_pct = ((current_price - data['entry_price']) / data['entry_price']) * 100
+            
+                if profit_pct > 20:
+                    logging.warning(f"😭 MISSED PROFIT: Skipped {token[:8]} - would have made {profit_pct:.1f}%")
+                elif profit_pct < -10:
+                    logging.info(f"✅ GOOD SKIP: Avoided {token[:8]} - would have lost {abs(profit_pct):.1f}%")
 
     def track_wallet_trade_outcome(self, wallet_address, token_address):
         """Track what happens to tokens wallets buy, even if we don't copy"""
         try:
-            entry_price = get_token_price(token_address)
+            # Priced through get_token_prices, like the outcome check, so both ends share a source
+            entry_price = get_token_prices([token_address]).get(token_address)
             if not entry_price:
                 return
                 
-            # Store for monitoring
-            tracking_key = f"{wallet_address}_{token_address}"
-            self.wallet_trade_tracking[tracking_key] = {
+            # Check outcome after 30 minutes (persisted, so a restart keeps the label)
+            deferred_checks.schedule('wallet_trade_outcome', 1800, {
                 'wallet_address': wallet_address,
                 'token_address': token_address,
                 'entry_price': entry_price,
                 'entry_time': time.time()
-            }
-            
-            # Check outcome after 30 minutes
-            threading.Timer(1800, self.check_wallet_trade_outcome, args=[tracking_key]).start()
+            }, key=f"wallet_trade_outcome:{wallet_address}_{token_address}")
             
         except Exception as e:
             logging.error(f"Error tracking wallet trade: {e}")
 
-    def check_wallet_trade_outcome(self, tracking_key):
-        """Check if wallet's trade was profitable"""
+    def check_wallet_trade_outcomes(self, trades):
+        """Check if wallets' trades were profitable (one price batch for every check due)"""
         try:
-            trade = self.wallet_trade_tracking.get(tracking_key)
-            if not trade:
-                return
-                
-            current_price = get_token_price(trade['token_address'])
-            if current_price:
+            current_prices = get_token_prices([trade['token_address'] for trade in trades])
+            
+            for trade in trades:
+                current_price = current_prices.get(trade['token_address'])
+                if not current_price:
+                    continue
                 profit_pct = ((current_price - trade['entry_price']) / trade['entry_price']) * 100
                 
                 # Log the outcome
@@ -4045,8 +5121,6 @@ class AdaptiveAlphaTrader:
                 if profit_pct > 0:
                     self.wallet_learning_data[trade['wallet_address']]['tracked_wins'] += 1
                 self.wallet_learning_data[trade['wallet_address']]['tracked_profit'] += profit_pct
-                    
-            del self.wallet_trade_tracking[tracking_key]
             
         except Exception as e:
             logging.error(f"Error checking trade outcome: {e}")
@@ -4091,23 +5165,20 @@ class AdaptiveAlphaTrader:
             
             # Step 1: Find tokens that pumped hard recently
             logging.info("🔍 Searching for recent 100%+ pumps...")
-            tokens = enhanced_find_newest_tokens_with_free_apis()[:200]
+            universe = current_market_universe()
+            market = universe.market(200)
+            
+            # Priced tokens at least 6 hours old
+            market = market.select((market.price > 0) & (market.age >= 360))
             
             pumped_tokens = []
-            for token in tokens:
+            for i in range(len(market)):
                 try:
-                    # Get current price and price 24h ago
-                    current_price = get_token_price(token)
-                    if not current_price:
-                        continue
-                        
-                    # Check age - we want tokens at least 6 hours old
-                    age = get_token_age_minutes(token)
-                    if age < 360:  # Less than 6 hours
-                        continue
+                    token = market.tokens[i]
+                    current_price = float(market.price[i])
                     
                     # Calculate price change
-                    price_24h_ago = get_price_minutes_ago(token, 1440)  # 24 hours
+                    price_24h_ago = universe.metric(token, 'price_24h_ago', lambda t: get_price_minutes_ago(t, 1440))
                     if price_24h_ago and price_24h_ago > 0:
                         price_change = ((current_price - price_24h_ago) / price_24h_ago) * 100
                         
@@ -4145,114 +5216,47 @@ class AdaptiveAlphaTrader:
             logging.error(f"Error finding winning wallets: {e}")
             return []
 
+    @with_request_priority(HostRateLimiter.PRIORITY_SCAN)
     def detect_momentum_explosion(self):
         """Find tokens with explosive momentum using stricter criteria and scoring"""
         logging.warning("🔍 MOMENTUM SCAN TRIGGERED!")
         
         try:
-            tokens = enhanced_find_newest_tokens_with_free_apis()[:100]
-            tokens_checked = 0
+            universe = current_market_universe()
             momentum_candidates = []
             
-            for token in tokens:
-                try:
-                    tokens_checked += 1
-                    # Get current data
-                    current_price = get_token_price(token)
-                    liquidity = get_token_liquidity(token)
-                    volume = get_24h_volume(token)
-                    holders = get_holder_count(token)
-                    age = get_token_age_minutes(token)
-                    
-                    if not all([current_price, liquidity, volume]):
-                        continue
-                    
-                    # ADD DEBUG LINES HERE - RIGHT AFTER GETTING DATA
-                    logging.debug(f"DEBUG - Token: {token[:8]}")
-                    logging.debug(f"  Price: ${current_price} (real: {current_price not in [0.00001, 1.0, 0.001]})")
-                    logging.debug(f"  Liquidity: ${liquidity} (real: {liquidity != 5000})")
-                    logging.debug(f"  Volume: ${volume} (real: {volume not in [10000, 25000]})")
-                    logging.debug(f"  Holders: {holders} (real: {holders not in [150, 100, 75]})")
-                    logging.debug(f"  Age: {age}m (real: {age not in [45, 60]})")
-                    
-                    # Calculate momentum score
-                    momentum_score = 0
-                    volume_liq_ratio = volume / liquidity
-                    
-                    # Log tokens with decent activity
-                    if volume_liq_ratio > 1:
-                        logging.info(f"📊 Active token {token[:8]}: Vol/Liq={volume_liq_ratio:.1f}, Liq=${liquidity:,.0f}, Age={age}m, Holders={holders}")
-                    
-                    # 1. Volume/Liquidity Ratio (most important - 40 points max)
-                    if volume_liq_ratio > 5:
-                        momentum_score += 40
-                    elif volume_liq_ratio > 3:
-                        momentum_score += 25
-                    elif volume_liq_ratio > 2:
-                        momentum_score += 10
-                    else:
-                        continue  # Skip low momentum
-                    
-                    # 2. Optimal Age (20 points max)
-                    if age:
-                        if 45 <= age <= 120:  # Sweet spot
-                            momentum_score += 20
-                        elif 30 <= age < 45:
-                            momentum_score += 15
-                        elif age < 30:
-                            momentum_score += 10  # Might be too early
-                        elif age > 360:  # 6 hours
-                            continue  # Too old
-                        else:
-                            momentum_score += 5
-                    
-                    # 3. Holder Count (20 points max) - JUNE 30TH WINNING LOGIC
-                    if holders:
-                        if holders > 500:
-                            logging.info(f"   ⚠️ Token {token[:8]} has {holders} holders - might be too late")
-                            continue
-                        elif 80 <= holders <= 300:  # Sweet spot
-                            momentum_score += 20
-                        elif 50 <= holders < 80:
-                            momentum_score += 15
-                        elif 30 <= holders < 50:
-                            momentum_score += 10
-                        elif holders < 30:
-                            continue  # Too early
-                        else:  # 300-500
-                            momentum_score += 5
-                    
-                    # 4. Holder Growth Rate (10 points max)
-                    if age and age > 0 and holders:
-                        holders_per_minute = holders / age
-                        if holders_per_minute > 2:  # Rapid adoption
-                            momentum_score += 10
-                        elif holders_per_minute > 1:
-                            momentum_score += 5
-                    
-                    # 5. Liquidity Quality (10 points max)
-                    if liquidity >= 5000:
-                        momentum_score += 10
-                    elif liquidity >= 3000:
-                        momentum_score += 5
-                    elif liquidity < 2000:
-                        momentum_score -= 10  # Penalty for low liquidity
-                    
-                    # Add to candidates if score is high enough
-                    if momentum_score >= 50:  # Minimum score to consider
-                        momentum_candidates.append({
-                            'token': token,
-                            'score': momentum_score,
-                            'volume_ratio': volume_liq_ratio,
-                            'age': age,
-                            'holders': holders,
-                            'liquidity': liquidity,
-                            'price': current_price,
-                            'holders_per_minute': holders / age if age > 0 else 0
-                        })
-                
-                except Exception as e:
-                    continue
+            # Price, liquidity, volume and age for the whole batch, shared with the other scanners this cycle
+            market = universe.market(100)
+            tokens_checked = len(market)
+            
+            # Vectorized pre-filter: needs price/liquidity/volume, Vol/Liq > 2, not older than 6 hours
+            volume_ratio = np.divide(market.volume, market.liquidity, out=np.zeros(len(market)), where=market.liquidity > 0)
+            active = (market.price > 0) & (market.liquidity > 0) & (market.volume > 0)
+            for i in np.flatnonzero(active & (volume_ratio > 1)):
+                logging.info(f"📊 Active token {market.tokens[i][:8]}: Vol/Liq={volume_ratio[i]:.1f}, "
+                             f"Liq=${market.liquidity[i]:,.0f}, Age={market.age[i]:.0f}m")
+            market = market.select(active & (volume_ratio > 2) & ~(market.age > 360))
+            volume_ratio = market.volume / market.liquidity if len(market) else np.zeros(0)
+            
+            # Holder counts only for the survivors, fetched concurrently
+            holders = universe.holders(market.tokens)
+            scores = score_momentum_batch(volume_ratio, market.age, holders, market.liquidity)
+            for i in np.flatnonzero(holders > 500):
+                logging.info(f"   ⚠️ Token {market.tokens[i][:8]} has {int(holders[i])} holders - might be too late")
+            
+            for i in np.flatnonzero(scores >= 50):  # Minimum score to consider (NaN never passes)
+                age = int(market.age[i]) if market.age[i] > 0 else 0
+                holders_count = int(holders[i])
+                momentum_candidates.append({
+                    'token': market.tokens[i],
+                    'score': int(scores[i]),
+                    'volume_ratio': float(volume_ratio[i]),
+                    'age': age,
+                    'holders': holders_count,
+                    'liquidity': float(market.liquidity[i]),
+                    'price': float(market.price[i]),
+                    'holders_per_minute': holders_count / age if age > 0 else 0
+                })
             
             # Sort by score and log top candidates
             momentum_candidates.sort(key=lambda x: x['score'], reverse=True)
@@ -4302,47 +5306,39 @@ class AdaptiveAlphaTrader:
         """Find tokens showing pre-pump patterns like MORI before it pumped"""
         try:
             candidates = []
-            tokens = enhanced_find_newest_tokens_with_free_apis()[:100]
+            universe = current_market_universe()
+            market = universe.market(100)
             
-            for token in tokens:
+            # Patterns 1 and 3 for the whole batch: 1-3 hours old, $5k+ liquidity, volume > 3x liquidity
+            volume_ratio = np.divide(market.volume, market.liquidity, out=np.zeros(len(market)), where=market.liquidity > 0)
+            market = market.select((market.age > 60) & (market.age < 180) & (market.liquidity >= 5000) & (volume_ratio > 3))
+            volume_ratio = market.volume / market.liquidity if len(market) else np.zeros(0)
+            
+            # Pattern 2: Check holder growth (survivors only)
+            holders = universe.holders(market.tokens)
+            
+            for i in np.flatnonzero(holders >= 50):
                 try:
-                    # Pattern 1: New token (1-3 hours) with growing volume
-                    age = get_token_age_minutes(token)
-                    if not (60 < age < 180):  # 1-3 hours old
-                        continue
-                        
-                    # Pattern 2: Check holder growth
-                    holders = get_holder_count(token)
-                    if not holders or holders < 50:
-                        continue
-                        
-                    # Pattern 3: Volume surge
-                    volume = get_24h_volume(token)
-                    liquidity = get_token_liquidity(token)
-                    
-                    if not liquidity or liquidity < 5000:
-                        continue
-                        
-                    volume_ratio = volume / liquidity
+                    token = market.tokens[i]
                     
                     # Pattern 4: Price starting to move
-                    current_price = get_token_price(token)
-                    price_30m_ago = get_price_minutes_ago(token, 30)
+                    current_price = market.price[i] if market.price[i] > 0 else get_token_price(token)
+                    price_30m_ago = universe.metric(token, 'price_30m_ago', lambda t: get_price_minutes_ago(t, 30))
                     
                     if current_price and price_30m_ago and price_30m_ago > 0:
                         price_change_30m = ((current_price - price_30m_ago) / price_30m_ago) * 100
                         
                         # Sweet spot: moving but not pumped yet
-                        if 10 < price_change_30m < 50 and volume_ratio > 3:
-                            score = (holders * 0.1) + (price_change_30m * 2) + (volume_ratio * 10)
+                        if 10 < price_change_30m < 50:
+                            score = (holders[i] * 0.1) + (price_change_30m * 2) + (volume_ratio[i] * 10)
                             
                             candidates.append({
                                 'token': token,
                                 'score': score,
-                                'holders': holders,
+                                'holders': int(holders[i]),
                                 'price_change': price_change_30m,
-                                'volume_ratio': volume_ratio,
-                                'liquidity': liquidity
+                                'volume_ratio': float(volume_ratio[i]),
+                                'liquidity': float(market.liquidity[i])
                             })
                             
                 except Exception as e:
@@ -4466,32 +5462,13 @@ class AdaptiveAlphaTrader:
 
     def track_volume_acceleration(self, token):
         """Track volume changes to catch surges early"""
-        if not hasattr(self, 'volume_history'):
-            self.volume_history = {}
-            
-        current_volume = get_24h_volume(token)
-        
-        if token not in self.volume_history:
-            self.volume_history[token] = []
-            
-        self.volume_history[token].append({
-            'time': time.time(),
-            'volume': current_volume
-        })
+        # Fetch records the sample into the tick store
+        get_24h_volume(token)
         
-        # Keep only last 30 minutes
-        cutoff = time.time() - 1800
-        self.volume_history[token] = [v for v in self.volume_history[token] if v['time'] > cutoff]
-        
-        # Detect acceleration
-        if len(self.volume_history[token]) >= 3:
-            recent_vol = self.volume_history[token][-1]['volume']
-            older_vol = self.volume_history[token][-3]['volume']
-            
-            if older_vol > 0:
-                vol_increase = (recent_vol - older_vol) / older_vol
-                if vol_increase > 3:  # 300% volume increase
-                    return True
+        # Detect acceleration: newest sample vs two samples earlier, within the last 30 minutes
+        vol_increase = token_ticks.volume_acceleration(token, minutes=30, lag=2)
+        if vol_increase is not None and vol_increase > 3:  # 300% volume increase
+            return True
         return False
 
     def detect_whale_accumulation(self, token):
@@ -4788,10 +5765,15 @@ class AdaptiveAlphaTrader:
     def is_honeypot(self, token_address):
         """BALANCED honeypot detection - protective but not paranoid"""
         try:
+            rejected_for = rejection_cache.check(token_address)
+            if rejected_for:
+                return True, 100, [rejected_for]
+            
             logging.info(f"🔍 Checking honeypot status for {token_address[:8]}...")
             
             # CRITICAL CHECK #1: Can we sell?
             if not self.verify_sell_route_exists(token_address):
+                rejection_cache.reject(token_address, 'NO_SELL_ROUTE')
                 return True, 100, ["NO_SELL_ROUTE"]
             
             # Get token data
@@ -4801,6 +5783,7 @@ class AdaptiveAlphaTrader:
             
             honeypot_score = 0
             reasons = []
+            reason_codes = []
             
             # CHECK #2: Extreme concentration only
             url = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
@@ -4811,7 +5794,7 @@ class AdaptiveAlphaTrader:
                 "params": [token_address]
             }
             
-            response = requests.post(url, json=payload, timeout=5)
+            response = HTTP_SESSION.post(url, json=payload, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if 'result' in data and 'value' in data['result']:
@@ -4822,10 +5805,12 @@ class AdaptiveAlphaTrader:
                             top_holder = float(accounts[0].get('amount', 0))
                             top_percent = (top_holder / total_supply) * 100
                             
-                            # ONLY block EXTREME cases
-                            if top_percent > 95:  # 95%+ is definitely a honeypot
+                            # ONLY block EXTREME cases - the top account can be the pool or bonding curve
+                            # vault of a fresh launch, so this verdict expires instead of standing forever
+                            if top_percent > 95:
                                 honeypot_score += 100
                                 reasons.append(f"Top holder owns {top_percent:.0f}%")
+                                reason_codes.append('CONCENTRATION')
                             elif top_percent > 80:  # 80-95% is suspicious
                                 honeypot_score += 30
                                 reasons.append(f"High concentration: {top_percent:.0f}%")
@@ -4834,10 +5819,12 @@ class AdaptiveAlphaTrader:
             if liquidity and liquidity < 500:  # Less than $500 liquidity
                 honeypot_score += 50
                 reasons.append(f"Tiny liquidity: ${liquidity}")
+                reason_codes.append('LOW_LIQUIDITY')
             
             if holders and holders < 10 and age and age > 30:  # Old with no holders
                 honeypot_score += 40
                 reasons.append(f"Dead token: {holders} holders after {age}m")
+                reason_codes.append('DEAD_TOKEN')
             
             # CHECK #4: Known scam patterns
             if holders and age and holders > 0 and age > 0:
@@ -4845,6 +5832,7 @@ class AdaptiveAlphaTrader:
                 if holders > 1000 and age < 5:
                     honeypot_score += 50
                     reasons.append(f"Bot buyers: {holders} in {age}m")
+                    reason_codes.append('BOT_ACTIVITY')
             
             # DECISION: Only block if score is HIGH
             is_honeypot = honeypot_score >= 70  # Raised from 50
@@ -4853,6 +5841,9 @@ class AdaptiveAlphaTrader:
                 logging.warning(f"🚨 HONEYPOT DETECTED! Score: {honeypot_score}")
                 for reason in reasons:
                     logging.warning(f"   - {reason}")
+                # Remember the longest-standing verdict among the reasons that added up
+                ttl_order = lambda code: float('inf') if RejectionCache.REASON_TTLS[code] is None else RejectionCache.REASON_TTLS[code]
+                rejection_cache.reject(token_address, max(reason_codes or ['HONEYPOT'], key=ttl_order))
             else:
                 logging.info(f"✅ Token passed checks. Score: {honeypot_score}")
                 
@@ -4877,7 +5868,7 @@ class AdaptiveAlphaTrader:
                 "params": [token_address]
             }
             
-            response = requests.post(url, json=payload, timeout=5)
+            response = HTTP_SESSION.post(url, json=payload, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if 'result' in data and 'value' in data['result']:
@@ -4913,33 +5904,18 @@ class AdaptiveAlphaTrader:
     def verify_sell_route_exists(self, token_address, amount_lamports=1000000):
         """BALANCED: Check if we can sell but don't over-block"""
         try:
-            quote_url = "https://quote-api.jup.ag/v6/quote"
-            
-            # Try with reasonable parameters
-            params = {
-                'inputMint': token_address,
-                'outputMint': 'So11111111111111111111111111111111111111112',
-                'amount': '10000000',  # 0.01 token
-                'slippageBps': '2000',  # 20% slippage
-                'onlyDirectRoutes': 'false'
-            }
-            
-            response = requests.get(quote_url, params=params, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('routePlan'):
-                    return True
-            
-            # Try once more with higher slippage
-            params['slippageBps'] = '5000'  # 50% slippage
-            response = requests.get(quote_url, params=params, timeout=5)
+            # Try with reasonable parameters: 0.01 token at 20% slippage
+            quote = get_jupiter_quote(token_address, SOL_TOKEN_ADDRESS, 10000000, 2000,
+                                      extra_params={'onlyDirectRoutes': 'false'}, timeout=5)
+            if quote and quote.get('routePlan'):
+                return True
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('routePlan'):
-                    logging.info(f"✅ Sell route exists (high slippage needed)")
-                    return True
+            # Try once more with higher slippage (50%)
+            quote = get_jupiter_quote(token_address, SOL_TOKEN_ADDRESS, 10000000, 5000,
+                                      extra_params={'onlyDirectRoutes': 'false'}, timeout=5)
+            if quote and quote.get('routePlan'):
+                logging.info(f"✅ Sell route exists (high slippage needed)")
+                return True
             
             logging.error(f"🚨 NO SELL ROUTE for {token_address[:8]}")
             return False
@@ -4998,6 +5974,11 @@ class AdaptiveAlphaTrader:
     def check_recent_price_spike(self, token_address):
         """Check if token had a price spike in last 5 minutes"""
         try:
+            # Recorded ticks answer this without any request when they cover the window
+            recent_change = token_ticks.rolling_return(token_address, 5)
+            if recent_change is not None:
+                return recent_change > 20
+            
             # Get recent transactions to analyze price action
             url = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
             
@@ -5011,7 +5992,7 @@ class AdaptiveAlphaTrader:
                 ]
             }
             
-            response = requests.post(url, json=payload, timeout=5)
+            response = HTTP_SESSION.post(url, json=payload, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if 'result' in data and data['result'] is not None and len(data['result']) > 10:
@@ -5039,7 +6020,7 @@ class AdaptiveAlphaTrader:
                         'x-api-key': birdeye_api_key
                     }
                     
-                    response = requests.get(birdeye_url, headers=headers, timeout=5)
+                    response = HTTP_SESSION.get(birdeye_url, headers=headers, timeout=5)
                     if response.status_code == 200:
                         data = response.json()
                         if data and 'data' in data and data['data'] is not None:
@@ -5067,6 +6048,10 @@ class AdaptiveAlphaTrader:
     def detect_vortex_scam(self, token_address):
         """Only block OBVIOUS scams - let potential winners through"""
         try:
+            rejected_for = rejection_cache.check(token_address)
+            if rejected_for:
+                return True, 100, [rejected_for]
+            
             scam_score = 0
             reasons = []
             
@@ -5078,10 +6063,12 @@ class AdaptiveAlphaTrader:
             if holders and age:
                 # 10,000+ holders in 5 minutes = definitely bots
                 if age < 5 and holders > 10000:
+                    rejection_cache.reject(token_address, 'VORTEX_SCAM')
                     return True, 100, ["Impossible growth: 10k+ holders in 5 min"]
                 
                 # 5,000+ holders in 10 minutes = very suspicious
                 if age < 10 and holders > 5000:
+                    rejection_cache.reject(token_address, 'VORTEX_SCAM')
                     return True, 100, [f"Extreme growth: {holders} holders in {age}m"]
                 
                 # Otherwise, popular tokens can grow fast!
@@ -5098,6 +6085,9 @@ class AdaptiveAlphaTrader:
     def detect_bot_activity(self, token_address, holders, age):
         """Detect bot activity based on holder patterns and transaction behavior"""
         try:
+            if rejection_cache.check(token_address) == 'BOT_ACTIVITY':
+                return 100
+            
             bot_score = 0
             
             # Check holder growth rate
@@ -5136,7 +6126,7 @@ class AdaptiveAlphaTrader:
                     ]
                 }
                 
-                response = requests.post(url, json=payload, timeout=5)
+                response = HTTP_SESSION.post(url, json=payload, timeout=5)
                 if response.status_code == 200:
                     data = response.json()
                     if 'result' in data and data['result'] is not None and len(data['result']) > 20:
@@ -5170,7 +6160,7 @@ class AdaptiveAlphaTrader:
                     "params": [token_address]
                 }
                 
-                response = requests.post(url, json=payload, timeout=5)
+                response = HTTP_SESSION.post(url, json=payload, timeout=5)
                 if response.status_code == 200:
                     data = response.json()
                     if 'result' in data and 'value' in data['result']:
@@ -5193,6 +6183,8 @@ class AdaptiveAlphaTrader:
             except:
                 pass
             
+            if bot_score >= 80:
+                rejection_cache.reject(token_address, 'BOT_ACTIVITY')
             return min(bot_score, 100)  # Cap at 100
             
         except Exception as e:
@@ -5200,100 +6192,68 @@ class AdaptiveAlphaTrader:
             return 0
             
 
+    @with_request_priority(HostRateLimiter.PRIORITY_SCAN)
+    def run_momentum_scan(self):
+        """Scanner job: trade an explosive setup, otherwise return candidates for bundling"""
+        if self.detect_momentum_explosion():
+            return []
+        return self.collect_momentum_opportunities()
+    
+    @with_request_priority(HostRateLimiter.PRIORITY_SCAN)
+    def scan_mori_setups(self):
+        """Scanner job: quick pass over the 20 newest tokens for MORI-like setups"""
+        for token in current_market_universe().tokens(20):
+            try:
+                # All signals must align
+                if (self.track_volume_acceleration(token) and 
+                    self.detect_whale_accumulation(token) and
+                    self.detect_breakout_pattern(token)):
+                    
+                    logging.error(f"🚨🚨🚨 MORI-LIKE SETUP DETECTED: {token[:8]}")
+                    self.execute_trade(
+                        token,
+                        'MORI_SETUP',
+                        0.1,  # Bigger position for high confidence
+                        get_token_price(token),
+                        source_wallet='MORI_PATTERN'
+                    )
+                    break
+            except:
+                continue
+    
     def collect_momentum_opportunities(self):
         """Collect momentum opportunities without trading - uses SAME logic that made 2.2 SOL"""
         opportunities = []
         
         try:
-            tokens = enhanced_find_newest_tokens_with_free_apis()[:100]  # Same as working version
-            
-            for token in tokens:
-                try:
-                    # EXACT SAME LOGIC AS YOUR WORKING detect_momentum_explosion
-                    current_price = get_token_price(token)
-                    liquidity = get_token_liquidity(token)
-                    volume = get_24h_volume(token)
-                    holders = get_holder_count(token)
-                    age = get_token_age_minutes(token)
-                    
-                    if not current_price:
-                        continue
-                    
-                    # USE DEFAULTS LIKE WHEN YOU MADE 2.2 SOL
-                    if not liquidity or liquidity <= 0:
-                        liquidity = 5000  # Default like before
-                    if not volume or volume <= 0:
-                        volume = liquidity * 2  # Assume 2x like before
-                    
-                    momentum_score = 0
-                    volume_liq_ratio = volume / liquidity
-                    
-                    # EXACT SAME SCORING AS YOUR WORKING VERSION
-                    if volume_liq_ratio > 5:
-                        momentum_score += 40
-                    elif volume_liq_ratio > 3:
-                        momentum_score += 25
-                    elif volume_liq_ratio > 2:
-                        momentum_score += 10
-                    else:
-                        continue
-                    
-                    if age:
-                        if 45 <= age <= 120:
-                            momentum_score += 20
-                        elif 30 <= age < 45:
-                            momentum_score += 15
-                        elif age < 30:
-                            momentum_score += 10
-                        elif age > 360:
-                            continue
-                        else:
-                            momentum_score += 5
-                    
-                    if holders:
-                        if holders > 500:
-                            continue  # Too late
-                        elif 80 <= holders <= 300:
-                            momentum_score += 20
-                        elif 50 <= holders < 80:
-                            momentum_score += 15
-                        elif 30 <= holders < 50:
-                            momentum_score += 10
-                        elif holders < 30:
-                            continue
-                        else:
-                            momentum_score += 5
-                    
-                    if age and age > 0 and holders:
-                        holders_per_minute = holders / age
-                        if holders_per_minute > 2:
-                            momentum_score += 10
-                        elif holders_per_minute > 1:
-                            momentum_score += 5
-                    
-                    if liquidity >= 5000:
-                        momentum_score += 10
-                    elif liquidity >= 3000:
-                        momentum_score += 5
-                    elif liquidity < 2000:
-                        momentum_score -= 10
-                    
-                    # Collect if score is good (but don't trade yet)
-                    if momentum_score >= 50:
-                        opportunities.append({
-                            'token': token,
-                            'score': momentum_score,
-                            'volume_ratio': volume_liq_ratio,
-                            'age': age,
-                            'holders': holders,
-                            'liquidity': liquidity,
-                            'price': current_price,
-                            'position_size': 0.05,
-                            'timestamp': time.time()
-                        })
-                
-                except Exception:
-                    continue
+            universe = current_market_universe()
+            market = universe.market(100)  # Same 100 tokens as detect_momentum_explosion, already fetched
+            market = market.select(market.price > 0)
+            
+            # USE DEFAULTS LIKE WHEN YOU MADE 2.2 SOL
+            liquidity = np.where(market.liquidity > 0, market.liquidity, 5000)
+            volume = np.where(market.volume > 0, market.volume, liquidity * 2)
+            volume_ratio = volume / liquidity
+            
+            # EXACT SAME SCORING AS detect_momentum_explosion - holders only for rows that can still pass
+            candidates = np.flatnonzero((volume_ratio > 2) & ~(market.age > 360))
+            holders = np.zeros(len(market))
+            holders[candidates] = universe.holders(market.tokens[candidates])
+            scores = score_momentum_batch(volume_ratio, market.age, holders, liquidity)
+            
+            # Collect if score is good (but don't trade yet)
+            for i in np.flatnonzero(scores >= 50):
+                opportunities.append({
+                    'token': market.tokens[i],
+                    'score': int(scores[i]),
+                    'volume_ratio': float(volume_ratio[i]),
+                    'age': int(market.age[i]) if market.age[i] > 0 else 0,
+                    'holders': int(holders[i]),
+                    'liquidity': float(liquidity[i]),
+                    'price': float(market.price[i]),
+                    'position_size': 0.05,
+                    'timestamp': time.time()
+                })
             
             return opportunities
             
@@ -5304,7 +6264,10 @@ class AdaptiveAlphaTrader:
     def get_market_condition(self):
         """Check if market is pumping or dumping based on SOL price"""
         try:
-            sol_price_now = get_token_price("So11111111111111111111111111111111111111112")
+            # get_token_price is SOL-denominated (always 1.0 for SOL), so the trend needs the USD price
+            sol_price_now = get_sol_price_usd()
+            if not sol_price_now:
+                return "NEUTRAL"
             
             if not hasattr(self, 'sol_price_history'):
                 self.sol_price_history = []
@@ -5339,9 +6302,10 @@ class AdaptiveAlphaTrader:
         try:
             if len(self.positions) > 2:
                 price_changes = {}
+                current_prices = get_token_prices(list(self.positions.keys()))
                 
                 for token, pos in self.positions.items():
-                    price = get_token_price(token)
+                    price = current_prices.get(token)
                     if price:
                         change = ((price - pos['entry_price']) / pos['entry_price']) * 100
                         price_changes[token] = change
@@ -5390,7 +6354,7 @@ class AdaptiveAlphaTrader:
                 'pageSize': 3
             }
             
-            response = requests.get(url, params=params, timeout=2)  # Short timeout
+            response = HTTP_SESSION.get(url, params=params, timeout=2)  # Short timeout
             
             if response.status_code == 200 and response.json().get('totalResults', 0) > 0:
                 # Found news - this is a BONUS
@@ -5513,30 +6477,73 @@ def import_sqlite_to_postgres():
 
 
 # Helper functions for wallet monitoring
-def get_wallet_recent_buys_helius(wallet_address):
-    """Get recent buys from a wallet using Helius API with DEBUG LOGGING"""
+# Newest processed signature per wallet, so polls ask only for what came after it
+class WalletSignatureCursors:
+    def __init__(self):
+        self.cursors = {}    # wallet -> (signature, slot)
+        self.db = None
+        self.lock = threading.Lock()
+    
+    def attach_database(self, db_manager):
+        """Load stored cursors and persist new positions from now on"""
+        try:
+            stored = db_manager.get_wallet_signature_cursors()
+            with self.lock:
+                for wallet, cursor in stored.items():
+                    self.cursors.setdefault(wallet, cursor)
+            self.db = db_manager
+            logging.info(f"🔖 Loaded {len(stored)} wallet signature cursors")
+        except Exception as e:
+            logging.warning(f"Could not load wallet signature cursors: {e}")
+    
+    def get(self, wallet):
+        """(signature, slot) of the newest processed transaction, or (None, None)"""
+        with self.lock:
+            return self.cursors.get(wallet, (None, None))
+    
+    def advance(self, wallet, signature, slot):
+        """Move the cursor forward; older slots (late notifications) never move it back"""
+        with self.lock:
+            current = self.cursors.get(wallet)
+            if current and (current[0] == signature or (slot or 0) < (current[1] or 0)):
+                return
+            self.cursors[wallet] = (signature, slot)
+        if self.db:
+            try:
+                self.db.save_wallet_signature_cursor(wallet, signature, slot)
+            except Exception as e:
+                logging.debug(f"Could not persist cursor for {wallet[:8]}: {e}")
+
+wallet_cursors = WalletSignatureCursors()
+
+def get_wallet_recent_buys_helius(wallet_address, since_cursor=False):
+    """Get recent buys from a wallet using Helius API with DEBUG LOGGING.
+    since_cursor=True (the alpha poller only) returns just signatures newer than the wallet's cursor and advances it;
+    every other caller gets the plain recent window and leaves the cursor alone."""
     
     try:
         # DEBUG: Log what we're checking
         logging.info(f"🔍 DEBUG: Getting recent buys for {wallet_address[:8]}...")
         
-        # Get recent signatures for the wallet
         headers = {"Content-Type": "application/json"}
+        options = {
+            "limit": 10,  # Reduced to 10 for faster processing
+            "commitment": "confirmed"
+        }
+        # Incremental polling: only signatures newer than the last one processed (all recent ones the first time)
+        if since_cursor:
+            last_signature, _ = wallet_cursors.get(wallet_address)
+            if last_signature:
+                options["until"] = last_signature
         
         payload = {
             "jsonrpc": "2.0",
             "id": "get-wallet-signatures",
             "method": "getSignaturesForAddress",
-            "params": [
-                wallet_address,
-                {
-                    "limit": 10,  # Reduced to 10 for faster processing
-                    "commitment": "confirmed"
-                }
-            ]
+            "params": [wallet_address, options]
         }
         
-        response = requests.post(HELIUS_RPC_URL, json=payload, headers=headers, timeout=30)
+        response = HTTP_SESSION.post(HELIUS_RPC_URL, json=payload, headers=headers, timeout=30)
         logging.info(f"🔍 DEBUG: Helius signatures response for {wallet_address[:8]}: status={response.status_code}")
         
         if response.status_code != 200:
@@ -5546,50 +6553,31 @@ def get_wallet_recent_buys_helius(wallet_address):
         signatures_data = response.json()
         
         if "result" not in signatures_data or not signatures_data["result"]:
-            logging.info(f"🔍 DEBUG: No signatures found for {wallet_address[:8]}")
+            logging.info(f"🔍 DEBUG: No new signatures for {wallet_address[:8]}")
             return []
         
-        logging.info(f"🔍 DEBUG: Found {len(signatures_data['result'])} signatures for {wallet_address[:8]}")
+        logging.info(f"🔍 DEBUG: Found {len(signatures_data['result'])} new signatures for {wallet_address[:8]}")
+        
+        # Everything up to the newest signature counts as seen, even what falls outside the top 5
+        if since_cursor:
+            newest = signatures_data["result"][0]
+            wallet_cursors.advance(wallet_address, newest["signature"], newest.get("slot"))
         
         recent_buys = []
-        signatures = signatures_data["result"][:5]  # Only check last 5 transactions
+        signatures = [sig_info for sig_info in signatures_data["result"][:5] if not sig_info.get("err")]  # Only check last 5 transactions
         
-        for i, sig_info in enumerate(signatures):
-            if sig_info.get("err"):
-                logging.info(f"🔍 DEBUG: Skipping failed tx {i+1}/5 for {wallet_address[:8]}")
-                continue
-                
-            logging.info(f"🔍 DEBUG: Processing tx {i+1}/5 for {wallet_address[:8]}: {sig_info['signature'][:8]}...")
-                
-            # Get transaction details
-            tx_payload = {
-                "jsonrpc": "2.0",
-                "id": "get-transaction",
-                "method": "getTransaction",
-                "params": [
-                    sig_info["signature"],
-                    {
-                        "encoding": "jsonParsed",
-                        "maxSupportedTransactionVersion": 0,
-                        "commitment": "confirmed"
-                    }
-                ]
-            }
-            
-            tx_response = requests.post(HELIUS_RPC_URL, json=tx_payload, headers=headers, timeout=30)
-            
-            if tx_response.status_code != 200:
-                logging.warning(f"🔍 DEBUG: Failed to get tx details for {sig_info['signature'][:8]}")
-                continue
-            
-            tx_data = tx_response.json()
+        # Get all transaction details in one batch
+        transactions = get_transactions_batch([sig_info["signature"] for sig_info in signatures], HELIUS_RPC_URL, HTTP_SESSION, timeout=30)
+        
+        for i, (sig_info, transaction) in enumerate(zip(signatures, transactions)):
+            logging.info(f"🔍 DEBUG: Processing tx {i+1}/{len(signatures)} for {wallet_address[:8]}: {sig_info['signature'][:8]}...")
             
-            if "result" not in tx_data or not tx_data["result"]:
+            if not transaction:
                 logging.info(f"🔍 DEBUG: No tx data for {sig_info['signature'][:8]}")
                 continue
                 
             # Parse transaction for buy signals
-            transaction = tx_data["result"]
+            holder_counter.observe_transaction(transaction)
             is_buy = is_buy_transaction(transaction, wallet_address)
             
             logging.info(f"🔍 DEBUG: Transaction {sig_info['signature'][:8]} is_buy: {is_buy}")
@@ -5617,6 +6605,378 @@ def get_wallet_recent_buys_helius(wallet_address):
         logging.error(f"Error getting wallet buys for {wallet_address[:8]}: {e}")
         return []
 
+# Alpha wallet activity over one websocket - a logsSubscribe per followed wallet, buys pushed to listeners
+class AlphaWalletStream:
+    def __init__(self, ws_url, rpc_url, resolve_workers=4):
+        self.ws_url = ws_url
+        self.rpc_url = rpc_url
+        self.ws = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.wallets = set()             # wallets that should be subscribed
+        self.subscriptions = {}          # subscription id -> wallet
+        self.pending = {}                # request id -> wallet
+        self.seen_signatures = OrderedDict()
+        self.listeners = []
+        self.next_request_id = 1
+        # Transactions are fetched off the websocket thread so one slow lookup doesn't stall the rest
+        self.resolver = ThreadPoolExecutor(max_workers=resolve_workers, thread_name_prefix='alpha-resolve')
+        self.stats = {'notifications': 0, 'buys': 0, 'reconnects': 0}
+    
+    def add_listener(self, listener):
+        """listener(wallet_address, buy) runs on a resolver thread"""
+        self.listeners.append(listener)
+    
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='alpha-wallet-stream', daemon=True)
+            self.thread.start()
+    
+    def _run(self):
+        """Keep the websocket connected, reconnecting with a short delay"""
+        while True:
+            try:
+                self.ws = websocket.WebSocketApp(
+                    self.ws_url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=lambda ws, error: logging.warning(f"Alpha wallet stream error: {error}"),
+                    on_close=lambda ws, code, msg: logging.info(f"Alpha wallet stream closed: {code}")
+                )
+                self.ws.run_forever(ping_interval=30, ping_timeout=10)
+            except Exception as e:
+                logging.error(f"Alpha wallet stream crashed: {e}")
+            
+            self.stats['reconnects'] += 1
+            time.sleep(2)
+    
+    def _send(self, method, params, wallet=None):
+        with self.lock:
+            request_id = self.next_request_id
+            self.next_request_id += 1
+            if wallet:
+                self.pending[request_id] = wallet
+        try:
+            self.ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        except Exception as e:
+            logging.debug(f"Alpha wallet stream send failed ({method}): {e}")
+    
+    def _subscribe(self, wallet):
+        if self.ws and self.ws.sock and self.ws.sock.connected:
+            self._send("logsSubscribe", [{"mentions": [wallet]}, {"commitment": "confirmed"}], wallet=wallet)
+    
+    def _on_open(self, ws):
+        """(Re)subscribe every followed wallet on a fresh connection"""
+        with self.lock:
+            self.subscriptions.clear()
+            self.pending.clear()
+            wallets = list(self.wallets)
+        logging.info(f"🔌 Alpha wallet stream connected - subscribing {len(wallets)} wallets")
+        for wallet in wallets:
+            self._subscribe(wallet)
+    
+    def sync(self, wallet_addresses):
+        """Follow exactly the given wallets"""
+        wanted = set(wallet_addresses)
+        with self.lock:
+            added = wanted - self.wallets
+            removed = self.wallets - wanted
+            self.wallets = wanted
+            stale = [sub_id for sub_id, wallet in self.subscriptions.items() if wallet in removed]
+            for sub_id in stale:
+                del self.subscriptions[sub_id]
+        
+        if wanted:
+            self.start()
+        for sub_id in stale:
+            self._send("logsUnsubscribe", [sub_id])
+        for wallet in added:
+            self._subscribe(wallet)
+    
+    def _on_message(self, ws, message):
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        
+        # Subscription confirmation
+        if 'id' in data and 'result' in data:
+            with self.lock:
+                wallet = self.pending.pop(data['id'], None)
+                if wallet and wallet in self.wallets:
+                    self.subscriptions[data['result']] = wallet
+            return
+        
+        if data.get('method') != 'logsNotification':
+            return
+        
+        params = data.get('params', {})
+        result = params.get('result', {})
+        value = result.get('value') or {}
+        signature = value.get('signature')
+        with self.lock:
+            wallet = self.subscriptions.get(params.get('subscription'))
+            if not wallet or not signature or value.get('err') is not None or signature in self.seen_signatures:
+                return
+            self.seen_signatures[signature] = True
+            while len(self.seen_signatures) > 5000:
+                self.seen_signatures.popitem(last=False)
+        
+        self.stats['notifications'] += 1
+        self.resolver.submit(self._resolve, wallet, signature, result.get('context', {}).get('slot'))
+    
+    def _resolve(self, wallet, signature, slot):
+        """Fetch the transaction and hand any buy to the listeners"""
+        # Fallback polling after an outage only needs what the stream didn't see
+        wallet_cursors.advance(wallet, signature, slot)
+        try:
+            with request_priority(HostRateLimiter.PRIORITY_TRADE):
+                transaction = get_transactions_batch([signature], self.rpc_url, HTTP_SESSION, timeout=10)[0]
+        except Exception as e:
+            logging.debug(f"Alpha transaction fetch failed for {signature[:8]}: {e}")
+            return
+        if not transaction:
+            return
+        
+        holder_counter.observe_transaction(transaction)
+        if not is_buy_transaction(transaction, wallet):
+            return
+        token = extract_token_from_transaction(transaction)
+        if not token:
+            return
+        
+        self.stats['buys'] += 1
+        buy = {'signature': signature, 'token': token, 'timestamp': transaction.block_time or 0, 'slot': slot}
+        for listener in self.listeners:
+            try:
+                listener(wallet, buy)
+            except Exception as e:
+                logging.error(f"Alpha buy listener error for {wallet[:8]}: {e}")
+    
+    def is_connected(self):
+        return bool(self.ws and self.ws.sock and self.ws.sock.connected and self.subscriptions)
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'subscribed': len(self.subscriptions), 'wallets': len(self.wallets)}
+
+alpha_wallet_stream = AlphaWalletStream(HELIUS_WEBSOCKET_URL, HELIUS_RPC_URL)
+
+# Wallet trading styles from the full recent history - buys paired with sells per mint, cached in Postgres
+class WalletStyleClassifier:
+    STATS_FIELDS = ('trade_count', 'round_trips', 'win_rate', 'median_hold_minutes', 'p90_hold_minutes',
+                    'median_size_sol', 'p90_size_sol', 'trades_per_day', 'transactions', 'days_covered')
+    QUOTE_MINTS = {
+        'So11111111111111111111111111111111111111112',  # WSOL
+        'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',  # USDC
+        'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',  # USDT
+    }
+    
+    def __init__(self, rpc_url, days=7, max_transactions=500, refresh_hours=24, fetch_workers=4):
+        self.rpc_url = rpc_url
+        self.days = days
+        self.max_transactions = max_transactions
+        self.refresh_seconds = refresh_hours * 3600
+        self.profiles = {}        # wallet -> {'style', 'stats', 'classified_at'}
+        self.wallets = set()      # wallets kept fresh by the refresh thread
+        self.queued = set()
+        self.listeners = []
+        self.db = None
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='wallet-classifier')
+        self.fetch_executor = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix='wallet-history')
+        self.thread = None
+        self.stats = {'classified': 0, 'failed': 0, 'transactions': 0}
+    
+    def attach_database(self, db_manager):
+        """Load stored profiles and persist new classifications from now on"""
+        try:
+            stored = db_manager.get_wallet_style_profiles()
+            with self.lock:
+                for row in stored:
+                    self.profiles.setdefault(row['wallet_address'], {
+                        'style': row['style'],
+                        'stats': {field: row[field] for field in self.STATS_FIELDS if row.get(field) is not None},
+                        'classified_at': row['classified_at']
+                    })
+            self.db = db_manager
+            logging.info(f"🏷️ Loaded {len(stored)} stored wallet style profiles")
+        except Exception as e:
+            logging.warning(f"Could not load wallet style profiles: {e}")
+    
+    def add_listener(self, listener):
+        """listener(wallet, style, stats) runs on the classifier thread after each classification"""
+        self.listeners.append(listener)
+    
+    def get(self, wallet):
+        """Stored profile, or None; a missing or stale one is queued for (re)classification"""
+        with self.lock:
+            self.wallets.add(wallet)
+            profile = self.profiles.get(wallet)
+        if profile is None or time.time() - profile['classified_at'] > self.refresh_seconds:
+            self.schedule(wallet)
+        self.start()
+        return profile
+    
+    def schedule(self, wallet):
+        """Classify a wallet in the background (once per wallet at a time)"""
+        with self.lock:
+            if wallet in self.queued:
+                return
+            self.queued.add(wallet)
+        self.executor.submit(self._classify_job, wallet)
+    
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='wallet-classifier-refresh', daemon=True)
+            self.thread.start()
+    
+    def _run(self):
+        """Requeue profiles as they pass the refresh age"""
+        while True:
+            time.sleep(600)
+            now = time.time()
+            with self.lock:
+                stale = [w for w in self.wallets
+                         if now - self.profiles.get(w, {}).get('classified_at', 0) > self.refresh_seconds]
+            for wallet in stale:
+                self.schedule(wallet)
+    
+    def _classify_job(self, wallet):
+        try:
+            with request_priority(HostRateLimiter.PRIORITY_SCAN):
+                style, stats = self.classify(wallet)
+            classified_at = time.time()
+            with self.lock:
+                self.profiles[wallet] = {'style': style, 'stats': stats, 'classified_at': classified_at}
+                self.stats['classified'] += 1
+            if self.db:
+                self.db.save_wallet_style_profile(wallet, style, stats)
+            for listener in self.listeners:
+                try:
+                    listener(wallet, style, stats)
+                except Exception as e:
+                    logging.error(f"Wallet style listener error for {wallet[:8]}: {e}")
+        except Exception as e:
+            self.stats['failed'] += 1
+            logging.warning(f"Wallet classification failed for {wallet[:8]}: {e}")
+        finally:
+            with self.lock:
+                self.queued.discard(wallet)
+    
+    def fetch_history(self, wallet):
+        """Signatures back to the window start (newest first, capped), then their transactions in parallel batches"""
+        since = time.time() - self.days * 86400
+        signatures = []
+        before = None
+        while len(signatures) < self.max_transactions:
+            options = {"limit": 1000, "commitment": "confirmed"}
+            if before:
+                options["before"] = before
+            page = rpc_batch([("getSignaturesForAddress", [wallet, options])], self.rpc_url, HTTP_SESSION, timeout=30)[0]
+            if not page:
+                break
+            in_window = [s for s in page if (s.get('blockTime') or 0) >= since]
+            signatures.extend(s['signature'] for s in in_window if not s.get('err'))
+            if len(in_window) < len(page) or len(page) < 1000:
+                break
+            before = page[-1]['signature']
+        signatures = signatures[:self.max_transactions]
+        
+        chunk_size = CONFIG['RPC_BATCH_SIZE']
+        chunks = [signatures[i:i + chunk_size] for i in range(0, len(signatures), chunk_size)]
+        futures = [submit_with_priority(self.fetch_executor, get_transactions_batch, chunk, self.rpc_url, HTTP_SESSION, 30)
+                   for chunk in chunks]
+        return [summary for future in futures for summary in future.result() if summary]
+    
+    def compute_stats(self, wallet, summaries):
+        """Trade statistics from decoded transactions the wallet signed"""
+        rows = [
+            (summary.block_time, mint, owners[wallet], summary.sol_delta)
+            for summary in summaries
+            if not summary.failed and summary.signer == wallet and summary.block_time
+            for mint, owners in summary.token_deltas.items()
+            if mint not in self.QUOTE_MINTS and owners.get(wallet)
+        ]
+        stats = {'trade_count': 0, 'round_trips': 0, 'transactions': len(summaries)}
+        if not rows:
+            return stats
+        
+        trades = pd.DataFrame(rows, columns=['time', 'mint', 'token_delta', 'sol_delta'])
+        buys = trades[trades['token_delta'] > 0]
+        sells = trades[trades['token_delta'] < 0]
+        
+        # One row per mint: first buy to last sell, what went in and what came out
+        per_mint = pd.DataFrame({
+            'first_buy': buys.groupby('mint')['time'].min(),
+            'bought': buys.groupby('mint')['token_delta'].sum(),
+            'spent': -buys.groupby('mint')['sol_delta'].sum(),
+            'last_sell': sells.groupby('mint')['time'].max(),
+            'sold': -sells.groupby('mint')['token_delta'].sum(),
+            'received': sells.groupby('mint')['sol_delta'].sum(),
+        }).dropna()
+        # A round trip is a position bought inside the window and (mostly) sold again
+        closed = per_mint[per_mint['sold'] >= 0.9 * per_mint['bought']]
+        hold_minutes = ((closed['last_sell'] - closed['first_buy']) / 60).clip(lower=0).to_numpy()
+        sizes = (-buys['sol_delta']).clip(lower=0).to_numpy()
+        days_covered = max((time.time() - trades['time'].min()) / 86400, 1 / 24)
+        
+        stats.update({
+            'trade_count': int(len(buys)),
+            'round_trips': int(len(closed)),
+            'trades_per_day': float(len(buys) / days_covered),
+            'days_covered': float(days_covered),
+        })
+        if len(sizes):
+            stats['median_size_sol'] = float(np.median(sizes))
+            stats['p90_size_sol'] = float(np.percentile(sizes, 90))
+        if len(hold_minutes):
+            stats['median_hold_minutes'] = float(np.median(hold_minutes))
+            stats['p90_hold_minutes'] = float(np.percentile(hold_minutes, 90))
+        if len(closed) >= 5:
+            stats['win_rate'] = float((closed['received'] > closed['spent']).mean() * 100)
+        return stats
+    
+    @staticmethod
+    def style_for(stats):
+        """Style from hold times and frequency (bands follow the styles' max_hold_time)"""
+        if stats.get('trade_count', 0) < 3:
+            return 'UNKNOWN'
+        hold = stats.get('median_hold_minutes')
+        if stats.get('trades_per_day', 0) >= 50 and (hold is None or hold <= 10):
+            return 'BOT_TRADER'
+        if hold is None:
+            return 'HOLDER'     # buys but never sells inside the window
+        if hold <= 15:
+            return 'SNIPER'
+        if hold <= 30:
+            return 'SCALPER'
+        if hold <= 60:
+            return 'SWINGER'
+        return 'HOLDER'
+    
+    def classify(self, wallet):
+        """(style, stats) from the wallet's last `days` of history"""
+        summaries = self.fetch_history(wallet)
+        self.stats['transactions'] += len(summaries)
+        stats = self.compute_stats(wallet, summaries)
+        return self.style_for(stats), stats
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'profiles': len(self.profiles), 'queued': len(self.queued)}
+
+wallet_classifier = WalletStyleClassifier(
+    HELIUS_RPC_URL,
+    days=CONFIG['WALLET_CLASSIFY_DAYS'],
+    max_transactions=CONFIG['WALLET_CLASSIFY_MAX_TRANSACTIONS'],
+    refresh_hours=CONFIG['WALLET_CLASSIFY_REFRESH_HOURS']
+)
+
 def check_wallet_health():
     """Periodic wallet health check"""
     try:
@@ -5688,7 +7048,7 @@ class JitoBundler:
                 "params": [signed_txs]
             }
             
-            response = requests.post(self.jito_url, json=payload, headers=headers)
+            response = HTTP_SESSION.post(self.jito_url, json=payload, headers=headers)
             
             if response.status_code == 200:
                 result = response.json()
@@ -5757,6 +7117,8 @@ def run_adaptive_ai_system():
     # Initialize components
     trader = AdaptiveAlphaTrader(wallet)
     trader.load_wallet_status()
+    launch_stream.start()
+    alpha_wallet_stream.add_listener(trader.on_alpha_buy)
     
     check_apis_working()
 
@@ -5903,35 +7265,37 @@ def run_adaptive_ai_system():
             if iteration % 50 == 0:
                 check_wallet_health()
             
-            # 1. Check all alpha wallets for new buys
-           # trader.check_alpha_wallets()
+            # 1. Copy trading (opt-in): alpha buys arrive over the websocket, about one slot behind;
+            #    check_alpha_wallets polls the top wallets only while the stream is disconnected
+            if CONFIG['ALPHA_STREAM_ENABLED']:
+                alpha_wallet_stream.sync(w['address'] for w in trader.alpha_wallets if w.get('active', True))
+                trader.check_alpha_wallets()
             
-            # 2. Hunt for opportunities independently every 30 seconds
+            # One discovery + market fetch shared by every scanner in this pass
+            begin_market_cycle()
+            
+            # 2. Scanners run as concurrent jobs - this loop only submits them and merges what has finished
+            # Hunt for opportunities independently every 30 seconds
             if current_time - last_hunt_time > 30:
                 last_hunt_time = current_time
-                trader.find_opportunities_independently()
+                scanner_pool.submit('hunt', trader.find_opportunities_independently, deadline=30)
             
             # 2.5 AGGRESSIVE MOMENTUM CHECK - Every 15 seconds!
             momentum_interval = int(os.getenv('MOMENTUM_SCAN_INTERVAL', '8'))
             if current_time - last_momentum_check > momentum_interval:
                 last_momentum_check = current_time
                 
-                # KEEP YOUR ORIGINAL WORKING METHOD
-                found_trade = trader.detect_momentum_explosion()
-                
-                # ALSO collect opportunities for potential bundling
-                if not found_trade:  # Only collect if we didn't trade
-                    new_opportunities = trader.collect_momentum_opportunities()
-                    if new_opportunities:
-                        momentum_opportunities.extend(new_opportunities)
-                        momentum_opportunities.sort(key=lambda x: x['score'], reverse=True)
-                        momentum_opportunities = momentum_opportunities[:10]
-                        
-                        # Remove old opportunities
-                        momentum_opportunities = [
-                            opp for opp in momentum_opportunities 
-                            if current_time - opp.get('timestamp', 0) < 120
-                        ]
+                # KEEP YOUR ORIGINAL WORKING METHOD - the job also collects opportunities for potential bundling
+                scanner_pool.submit('momentum', trader.run_momentum_scan)
+            
+            # ULTRA AGGRESSIVE MODE - Check every 10 seconds for MORI-like setups
+            if os.getenv('AGGRESSIVE_MODE', 'false').lower() == 'true':
+                if iteration % 2 == 0:  # Every 10 seconds
+                    scanner_pool.submit('mori', trader.scan_mori_setups, deadline=10)
+            
+            # Merge every finished scanner's candidates into one ranked list
+            finished = [result for _, result in scanner_pool.collect(('hunt', 'momentum', 'mori')) if isinstance(result, list)]
+            momentum_opportunities = merge_opportunities(momentum_opportunities, [o for result in finished for o in result])
 
             # 2.6 EMERGENCY POSITION CHECK - Every 30 seconds
             if current_time - last_emergency_check > 5:
@@ -5944,30 +7308,6 @@ def run_adaptive_ai_system():
                 momentum_opportunities = momentum_opportunities[3:]
                 last_bundle_time = current_time
             
-            # ULTRA AGGRESSIVE MODE - Check every 10 seconds for MORI-like setups
-            if os.getenv('AGGRESSIVE_MODE', 'false').lower() == 'true':
-                if iteration % 2 == 0:  # Every 10 seconds
-                    # Quick scan top 20 newest tokens
-                    newest = enhanced_find_newest_tokens_with_free_apis()[:20]
-                    for token in newest:
-                        try:
-                            # All signals must align
-                            if (trader.track_volume_acceleration(token) and 
-                                trader.detect_whale_accumulation(token) and
-                                trader.detect_breakout_pattern(token)):
-                                
-                                logging.error(f"🚨🚨🚨 MORI-LIKE SETUP DETECTED: {token[:8]}")
-                                trader.execute_trade(
-                                    token,
-                                    'MORI_SETUP',
-                                    0.1,  # Bigger position for high confidence
-                                    get_token_price(token),
-                                    source_wallet='MORI_PATTERN'
-                                )
-                                break
-                        except:
-                            continue
-            
             # 3. Analyze monitored tokens for opportunities
             if trader.monitoring:
                 trader.analyze_and_execute()
@@ -6138,11 +7478,65 @@ def run_adaptive_ai_system():
                 if stats['trades'] > 0:
                     trader.brain.show_insights()
                 
+                # Show which price provider is serving us
+                price_oracle.log_stats()
+                price_cache.prune()
+                cache_stats = price_cache.get_stats()
+                logging.info(f"   🗃️ Price cache: {cache_stats['size']} entries, {cache_stats['hit_rate']:.0f}% hits "
+                             f"({cache_stats['stale_hits']} stale), {cache_stats['evictions']} evictions")
+                if raydium_pair_index.last_refresh:
+                    logging.info(f"   📚 Raydium index: {len(raydium_pair_index.pools_by_mint)} mints, "
+                                 f"{raydium_pair_index.get_age():.0f}s old, {raydium_pair_index.get_memory_size() / 1024 / 1024:.1f} MB")
+                quote_stats = jupiter_quote_cache.get_stats()
+                if quote_stats['fetched']:
+                    logging.info(f"   ♻️ Jupiter quotes: {quote_stats['reused']} reused / {quote_stats['fetched']} fetched "
+                                 f"({quote_stats['reuse_rate']:.0f}% reuse)")
+                rejection_stats = rejection_cache.get_stats()
+                if rejection_stats['skipped']:
+                    skipped = ', '.join(f"{reason} {count}" for reason, count in sorted(rejection_stats['skipped'].items(), key=lambda x: -x[1]))
+                    logging.info(f"   🚫 Rejections: {rejection_stats['size']} tokens held, skipped re-checks: {skipped}")
+                if CONFIG['ALPHA_STREAM_ENABLED']:
+                    alpha_stats = alpha_wallet_stream.get_stats()
+                    logging.info(f"   👛 Alpha stream: {alpha_stats['subscribed']}/{alpha_stats['wallets']} wallets subscribed, "
+                                 f"{alpha_stats['buys']} buys from {alpha_stats['notifications']} transactions")
+                holding_stats = alpha_holding_stream.get_stats()
+                logging.info(f"   🚪 Alpha exit watch: {holding_stats['pairs']} positions, {holding_stats['subscribed']} accounts subscribed, "
+                             f"{holding_stats['refreshes']} batch reads, {holding_stats['exits']} streamed exits")
+                style_stats = wallet_classifier.get_stats()
+                logging.info(f"   🏷️ Wallet styles: {style_stats['profiles']} profiles, {style_stats['queued']} queued, "
+                             f"{style_stats['classified']} classified this run")
+                deferred_stats = deferred_checks.get_stats()
+                logging.info(f"   ⏰ Deferred checks: {deferred_stats['pending']} pending, {deferred_stats['completed']} done "
+                             f"in {deferred_stats['batches']} batches")
+                tx_stats = tx_cache.get_stats()
+                logging.info(f"   🧾 Transaction cache: {tx_stats['entries']} in memory, {tx_stats['memory_hits']} memory / "
+                             f"{tx_stats['disk_hits']} disk hits, {tx_stats['fetched']} fetched")
+                if CONFIG['SWAP_WORKER_ENABLED']:
+                    worker_stats = swap_workers.get_stats()
+                    logging.info(f"   ⚙️ Swap workers: {worker_stats['ready']}/{worker_stats['workers']} ready, {worker_stats['requests']} swaps, "
+                                 f"{worker_stats['fallbacks']} cold spawns, {worker_stats['restarts']} restarts")
+                scan_stats = scanner_pool.get_stats()
+                logging.info(f"   🧵 Scanners: {scan_stats['running']} running, {scan_stats['completed']} done, "
+                             f"{scan_stats['late']} late, {scan_stats['failed']} failed, {scan_stats['skipped']} skipped (still busy)")
+                launch_stats = launch_stream.get_stats()
+                logging.info(f"   🛰️ Launch stream: {'connected' if launch_stream.is_connected() else 'DOWN'}, "
+                             f"{launch_stats['pump_fun']} pump.fun / {launch_stats['raydium']} Raydium launches, "
+                             f"{launch_stats['reconnects']} reconnects")
+                store_stats = token_store.get_stats()
+                logging.info(f"   🏷️ Token store: {store_stats['static_tokens']} tokens, {store_stats['memory_hits']} hits / "
+                             f"{store_stats['misses']} misses, {store_stats['db_loads']} loaded, {store_stats['rows_written']} written")
+                for host, limiter in HOST_RATE_LIMITERS.items():
+                    limiter_stats = limiter.get_stats()
+                    if limiter_stats['acquired']:
+                        logging.info(f"   🚦 {limiter.name}: {limiter_stats['rate_per_min']:.0f}/{limiter_stats['max_rate_per_min']:.0f} req/min, "
+                                     f"{limiter_stats['throttled']} throttled, {limiter_stats['wait_seconds']:.0f}s waited")
+                
                 # Show top performing positions
                 if trader.positions:
                     top_performers = []
+                    current_prices = get_token_prices(list(trader.positions.keys()))
                     for token, pos in trader.positions.items():
-                        current_price = get_token_price(token)
+                        current_price = current_prices.get(token)
                         if current_price and pos['entry_price']:
                             pnl_pct = ((current_price - pos['entry_price']) / pos['entry_price']) * 100
                             top_performers.append((token[:8], pnl_pct))
@@ -6203,9 +7597,10 @@ def run_adaptive_ai_system():
                         # Prepare positions data for Discord charts
                         positions_data = {}
                         if trader.positions:
+                            current_prices = get_token_prices(list(trader.positions.keys()))
                             for token, pos in trader.positions.items():
                                 try:
-                                    current_price = get_token_price(token)
+                                    current_price = current_prices.get(token)
                                     if current_price:
                                         pnl_pct = ((current_price - pos['entry_price']) / pos['entry_price']) * 100
                                         pnl_sol = pos['size'] * (current_price - pos['entry_price'])
@@ -6253,35 +7648,124 @@ def run_adaptive_ai_system():
             logging.error(traceback.format_exc())
             time.sleep(30)
 
-# Global rate limiter for Jupiter
-class RateLimiter:
-    def __init__(self, max_requests=50, time_window=60):  # 50 requests per 60 seconds (leaving buffer)
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.requests = deque()
+
+# Hedged price oracle - races the price sources instead of trying them one after another
+class PriceOracle:
+    def __init__(self, sources, hedge_delay=0.25, timeout=8.0, max_workers=8):
+        self.sources = sources  # list of (name, price_function) in hedge order
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        # Own pool so price lookups from inside REQUEST_EXECUTOR jobs can never deadlock
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='price-oracle')
+        self.lock = threading.Lock()
+        self.stats = {
+            name: {'requests': 0, 'valid': 0, 'wins': 0, 'errors': 0, 'total_latency': 0.0}
+            for name, _ in sources
+        }
     
-    def wait_if_needed(self):
-        """Wait if we've hit the rate limit"""
-        now = time.time()
+    def _timed_call(self, name, price_function, token_address, priority):
+        """Run one source and record its latency"""
+        start = time.time()
+        try:
+            with request_priority(priority):
+                price = price_function(token_address)
+        except Exception as e:
+            logging.debug(f"Price source {name} failed for {token_address[:8]}: {e}")
+            price = None
+            with self.lock:
+                self.stats[name]['errors'] += 1
+        
+        with self.lock:
+            self.stats[name]['requests'] += 1
+            self.stats[name]['total_latency'] += time.time() - start
+            if price and price > 0:
+                self.stats[name]['valid'] += 1
         
-        # Remove old requests outside the time window
-        while self.requests and self.requests[0] < now - self.time_window:
-            self.requests.popleft()
+        return name, price
+    
+    def get_price(self, token_address):
+        """Return the first valid price, starting a new source every hedge_delay seconds.
+        
+        Every source answers in SOL per whole token, and only the winner is written to price_cache.
+        """
+        cached_price = price_cache.get(token_address)
+        if cached_price is not None:
+            return cached_price
         
-        # If at limit, wait
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.requests[0] + self.time_window - now + 1
-            if sleep_time > 0:
-                logging.warning(f"⏳ Rate limit reached, waiting {sleep_time:.1f}s...")
-                time.sleep(sleep_time)
-                # Clear old requests after waiting
-                self.wait_if_needed()
+        deadline = time.time() + self.timeout
+        pending = set()
+        next_source = 0
+        # Hedges run on executor threads, so carry the caller's priority across
+        priority = current_request_priority()
         
-        # Record this request
-        self.requests.append(now)
+        try:
+            while True:
+                # Launch the next hedge, or wait out the deadline once all sources are running
+                if next_source < len(self.sources):
+                    name, price_function = self.sources[next_source]
+                    next_source += 1
+                    pending.add(self.executor.submit(self._timed_call, name, price_function, token_address, priority))
+                    wait_time = self.hedge_delay
+                else:
+                    wait_time = deadline - time.time()
+                
+                if not pending:
+                    return None
+                
+                wait_time = min(wait_time, deadline - time.time())
+                if wait_time <= 0:
+                    logging.warning(f"⏱️ Price oracle timed out for {token_address[:8]}")
+                    return None
+                
+                done, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, price = future.result()
+                    if price and price > 0:
+                        with self.lock:
+                            self.stats[name]['wins'] += 1
+                        store_token_price(token_address, price)
+                        return price
+        finally:
+            # Queued hedges are dropped; requests already in flight finish in the background
+            for future in pending:
+                future.cancel()
+    
+    def get_stats(self):
+        """Per-source latency and win rate"""
+        with self.lock:
+            total_wins = sum(s['wins'] for s in self.stats.values())
+            report = {}
+            for name, s in self.stats.items():
+                report[name] = {
+                    'requests': s['requests'],
+                    'wins': s['wins'],
+                    'errors': s['errors'],
+                    'avg_latency_ms': (s['total_latency'] / s['requests']) * 1000 if s['requests'] else 0,
+                    'valid_rate': (s['valid'] / s['requests']) * 100 if s['requests'] else 0,
+                    'win_share': (s['wins'] / total_wins) * 100 if total_wins else 0
+                }
+            return report
+    
+    def log_stats(self):
+        """Log which price provider is actually serving us"""
+        logging.info("   💱 Price sources:")
+        for name, s in self.get_stats().items():
+            logging.info(
+                f"      {name}: {s['win_share']:.0f}% wins, {s['avg_latency_ms']:.0f}ms avg, "
+                f"{s['valid_rate']:.0f}% valid ({s['requests']} calls, {s['errors']} errors)"
+            )
 
-# Create global rate limiter
-jupiter_limiter = RateLimiter(max_requests=50, time_window=60)
+# Create global price oracle (sources resolve at call time, so later definitions are used)
+price_oracle = PriceOracle(
+    sources=[
+        ('jupiter_quote', lambda token: get_token_price_standard(token)),
+        ('dexscreener', lambda token: get_token_price_dexscreener(token)),
+        ('jupiter_alternative', lambda token: get_token_price_alternative(token)),
+        ('jupiter_aggressive', lambda token: get_token_price_aggressive(token)),
+    ],
+    hedge_delay=CONFIG['PRICE_HEDGE_DELAY_MS'] / 1000,
+    timeout=CONFIG['PRICE_ORACLE_TIMEOUT']
+)
 
 def decode_transaction_blob(blob_str: str) -> bytes:
     """Try to decode a transaction blob using multiple formats."""
@@ -6428,7 +7912,7 @@ class SolanaWallet:
             
         headers = {"Content-Type": "application/json"}
         try:
-            response = requests.post(self.rpc_url, json=payload, headers=headers, timeout=15)
+            response = HTTP_SESSION.post(self.rpc_url, json=payload, headers=headers, timeout=15)
         
             if response.status_code == 200:
                 response_data = response.json()
@@ -6609,7 +8093,7 @@ class SolanaWallet:
                     "slippageBps": "5000"  # 50% slippage
                 }
                 
-                quote_response = requests.get(quote_url, params=params, timeout=15)
+                quote_response = HTTP_SESSION.get(quote_url, params=params, timeout=15)
                 
                 if quote_response.status_code != 200:
                     logging.error(f"Quote failed for account creation: {quote_response.status_code}")
@@ -6689,39 +8173,615 @@ class SolanaWallet:
 wallet = None
 
 def get_token_price(token_address: str) -> Optional[float]:
-    """Get token price in SOL using Jupiter API with multiple fallback methods."""
-    # Implement multiple attempts with different strategies
-    for attempt in range(3):
-        try:
-            # ATTEMPT 1: Try the standard method first
-            if attempt == 0:
-                price = get_token_price_standard(token_address)
-                if price and price > 0:
-                    return price
-                    
-            # ATTEMPT 2: Try with a different amount and approach
-            elif attempt == 1:
-                price = get_token_price_alternative(token_address)
-                if price and price > 0:
-                    return price
-                    
-            # ATTEMPT 3: Try with a more aggressive method
-            elif attempt == 2:
-                price = get_token_price_aggressive(token_address)
-                if price and price > 0:
-                    return price
-                    
-            # Add delay between attempts
-            time.sleep(1)
-        except Exception as e:
-            logging.error(f"Error in price check attempt {attempt+1}: {str(e)}")
-            time.sleep(1)
+    """Get token price in SOL by racing all price sources through the hedged oracle."""
+    try:
+        price = price_oracle.get_price(token_address)
+        if price and price > 0:
+            return price
+    except Exception as e:
+        logging.error(f"Error in price oracle for {token_address}: {str(e)}")
     
-    # If all methods fail, log error and try one last fallback
+    # If all sources fail, log error and try one last fallback
     logging.error(f"All price retrieval methods failed for {token_address}")
     return get_token_price_fallback(token_address)
 
 
+def get_token_prices(token_addresses, allow_stale=False) -> Dict[str, float]:
+    """Get SOL prices for many tokens with batched Jupiter and DexScreener requests.
+    
+    Prices are SOL per whole token, the same unit as get_token_price. Sources differ
+    between the two, so record and re-check a price through the same function.
+    
+    With allow_stale=True, recently expired prices are returned immediately and
+    refreshed in the background (stale-while-revalidate).
+    """
+    prices = {}
+    missing = []
+    stale = []
+    
+    # Serve cache entries and SOL itself without any request
+    for token_address in dict.fromkeys(token_addresses):
+        if token_address == SOL_TOKEN_ADDRESS:
+            prices[token_address] = 1.0
+            continue
+        
+        cached_price, is_fresh = price_cache.lookup(token_address)
+        if cached_price is not None and (is_fresh or allow_stale):
+            prices[token_address] = cached_price
+            if not is_fresh:
+                stale.append(token_address)
+        else:
+            missing.append(token_address)
+    
+    if stale:
+        price_cache.refresh_async(stale, get_token_prices)
+    
+    if not missing:
+        return prices
+    
+    # ROUND TRIP 1: Jupiter price endpoint accepts a comma-separated id list
+    try:
+        for i in range(0, len(missing), 100):
+            chunk = missing[i:i + 100]
+            response = HTTP_SESSION.get(
+                f"{CONFIG['JUPITER_API_URL']}/v6/price",
+                params={"ids": ",".join(chunk), "vsToken": SOL_TOKEN_ADDRESS},
+                timeout=10
+            )
+            if response.status_code != 200:
+                logging.debug(f"Jupiter batch price failed: {response.status_code}")
+                continue
+            
+            data = response.json()
+            data = data.get('data', data) if isinstance(data, dict) else {}
+            for token_address in chunk:
+                entry = data.get(token_address)
+                # Only SOL-quoted entries are in our unit
+                if isinstance(entry, dict) and entry.get('vsToken', SOL_TOKEN_ADDRESS) == SOL_TOKEN_ADDRESS:
+                    price = float(entry.get('price', 0) or 0)
+                    if price > 0:
+                        prices[token_address] = price
+    except Exception as e:
+        logging.error(f"Error in Jupiter batch price retrieval: {str(e)}")
+    
+    # ROUND TRIP 2: DexScreener takes up to 30 comma-separated token addresses
+    still_missing = [t for t in missing if t not in prices]
+    try:
+        for i in range(0, len(still_missing), 30):
+            chunk = still_missing[i:i + 30]
+            response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{','.join(chunk)}", timeout=10)
+            if response.status_code != 200:
+                logging.debug(f"DexScreener batch price failed: {response.status_code}")
+                continue
+            
+            # Keep the most liquid SOL-quoted pair per token (priceNative is then in SOL)
+            best_liquidity = {}
+            for pair in response.json().get('pairs') or []:
+                token_address = pair.get('baseToken', {}).get('address')
+                if token_address not in chunk or pair.get('quoteToken', {}).get('address') != SOL_TOKEN_ADDRESS:
+                    continue
+                liquidity = float(pair.get('liquidity', {}).get('usd', 0) or 0)
+                price = float(pair.get('priceNative', 0) or 0)
+                if price > 0 and liquidity >= best_liquidity.get(token_address, -1):
+                    best_liquidity[token_address] = liquidity
+                    prices[token_address] = price
+    except Exception as e:
+        logging.error(f"Error in DexScreener batch price retrieval: {str(e)}")
+    
+    # Fill the shared cache so get_token_price calls in the same pass are free
+    for token_address in missing:
+        if token_address in prices:
+            store_token_price(token_address, prices[token_address])
+    
+    # Anything neither batch endpoint knows goes through the single-token oracle
+    for token_address in missing:
+        if token_address not in prices:
+            price = get_token_price(token_address)
+            if price:
+                prices[token_address] = price
+    
+    if ULTRA_DIAGNOSTICS:
+        logging.info(f"Batch priced {len(prices)}/{len(dict.fromkeys(token_addresses))} tokens ({len(missing)} not cached)")
+    
+    return prices
+
+
+# Columnar market data for scan loops - one NumPy array per field, one row per token
+class MarketDataTable:
+    FIELDS = ('price', 'liquidity', 'volume', 'change_m5', 'change_h1', 'change_h6', 'change_h24', 'age')
+    
+    def __init__(self, tokens, columns):
+        self.tokens = np.array(tokens, dtype=object)
+        for field in self.FIELDS:
+            setattr(self, field, columns[field])
+    
+    def __len__(self):
+        return len(self.tokens)
+    
+    def select(self, mask):
+        """Rows where mask is True, as a new table"""
+        return MarketDataTable(self.tokens[mask], {field: getattr(self, field)[mask] for field in self.FIELDS})
+    
+    def concat(self, other):
+        """This table followed by the rows of another"""
+        return MarketDataTable(
+            np.concatenate([self.tokens, other.tokens]),
+            {field: np.concatenate([getattr(self, field), getattr(other, field)]) for field in self.FIELDS}
+        )
+    
+    def row(self, index):
+        """One token as a plain dict (NaN for unknown fields)"""
+        return {'token': self.tokens[index], **{field: float(getattr(self, field)[index]) for field in self.FIELDS}}
+
+def fetch_market_data(token_addresses):
+    """DexScreener market data for many tokens, 30 addresses per request.
+    
+    Unknown values are NaN so scanners can filter the whole batch with vectorized comparisons.
+    Tokens without a SOL-quoted pair get their price from the batched get_token_prices.
+    """
+    tokens = list(dict.fromkeys(t for t in token_addresses if t))
+    index = {token: i for i, token in enumerate(tokens)}
+    columns = {field: np.full(len(tokens), np.nan) for field in MarketDataTable.FIELDS}
+    now = time.time()
+    
+    for i in range(0, len(tokens), 30):
+        chunk = tokens[i:i + 30]
+        try:
+            response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{','.join(chunk)}", timeout=10)
+            if response.status_code != 200:
+                logging.debug(f"DexScreener batch market data failed: {response.status_code}")
+                continue
+            
+            pairs_by_token = defaultdict(list)
+            for pair in response.json().get('pairs') or []:
+                token_address = pair.get('baseToken', {}).get('address')
+                if token_address in index:
+                    pairs_by_token[token_address].append(pair)
+            
+            for token_address, pairs in pairs_by_token.items():
+                row = index[token_address]
+                summary = summarize_dexscreener_pairs(token_address, pairs)
+                for field in ('liquidity', 'volume', 'change_m5', 'change_h1', 'change_h6', 'change_h24'):
+                    columns[field][row] = summary[field]
+                if summary['price'] > 0:
+                    columns['price'][row] = summary['price']
+                token_store.set(
+                    token_address,
+                    symbol=summary['symbol'],
+                    pool_address=summary['pool_address'],
+                    liquidity=summary['liquidity'] or None,
+                    volume=summary['volume'] or None,
+                    price_change_5m=summary['change_m5'],
+                    price_change_1h=summary['change_h1']
+                )
+                
+                created_at = mint_creation_times.peek(token_address)
+                if created_at is None and summary['created_ms']:
+                    created_at = summary['created_ms'] / 1000
+                if created_at is not None:
+                    columns['age'][row] = max(0, int((now - created_at) / 60))
+        except Exception as e:
+            logging.debug(f"DexScreener batch market data error: {e}")
+    
+    # Later per-token lookups in the same pass are served from cache (market attributes went through token_store)
+    for token_address, row in index.items():
+        if columns['price'][row] > 0:
+            store_token_price(token_address, float(columns['price'][row]))
+    
+    # Tokens DexScreener listed without a SOL pair still need a SOL price
+    unpriced = [t for t, row in index.items() if not columns['price'][row] > 0 and columns['liquidity'][row] > 0]
+    if unpriced:
+        for token_address, price in get_token_prices(unpriced).items():
+            columns['price'][index[token_address]] = price
+    
+    return MarketDataTable(tokens, columns)
+
+def score_momentum_batch(volume_ratio, age, holders, liquidity):
+    """Momentum score for every row at once; NaN marks rows the scoring rules reject.
+    
+    Unknown (NaN or 0) age and holder values score nothing, like the old per-token `if age:` checks.
+    """
+    score = np.select([volume_ratio > 5, volume_ratio > 3, volume_ratio > 2], [40.0, 25.0, 10.0], default=np.nan)
+    
+    has_age = np.nan_to_num(age) > 0
+    age_score = np.select(
+        [(age >= 45) & (age <= 120), (age >= 30) & (age < 45), age < 30, age > 360],
+        [20.0, 15.0, 10.0, np.nan], default=5.0
+    )
+    score = score + np.where(has_age, age_score, 0)
+    
+    has_holders = np.nan_to_num(holders) > 0
+    holder_score = np.select(
+        [holders > 500, (holders >= 80) & (holders <= 300), (holders >= 50) & (holders < 80),
+         (holders >= 30) & (holders < 50), holders < 30],
+        [np.nan, 20.0, 15.0, 10.0, np.nan], default=5.0
+    )
+    score = score + np.where(has_holders, holder_score, 0)
+    
+    holders_per_minute = np.where(has_age & has_holders, np.nan_to_num(holders) / np.where(has_age, age, 1), 0)
+    score = score + np.select([holders_per_minute > 2, holders_per_minute > 1], [10.0, 5.0], default=0)
+    
+    score = score + np.select([liquidity >= 5000, liquidity >= 3000, liquidity < 2000], [10.0, 5.0, -10.0], default=0)
+    return score
+
+def fetch_holder_counts(token_addresses):
+    """Holder counts for several tokens concurrently (array aligned with the input)"""
+    futures = [submit_with_priority(REQUEST_EXECUTOR, get_holder_count, t) for t in token_addresses]
+    counts = np.zeros(len(futures))
+    for i, future in enumerate(futures):
+        try:
+            counts[i] = future.result(timeout=15) or 0
+        except Exception as e:
+            logging.debug(f"Holder count failed for {token_addresses[i][:8]}: {e}")
+    return counts
+
+# Per-cycle candidate universe - discovery runs once and each metric is fetched once per token, whichever scanner asks
+class MarketUniverse:
+    def __init__(self, discover, max_tokens=200):
+        self.discover = discover
+        self.max_tokens = max_tokens
+        self.created_at = time.time()
+        self.values = {}            # memo key -> value
+        self.key_locks = {}         # memo key -> lock, so concurrent scanners wait instead of refetching
+        self.holder_counts = {}     # token -> holders
+        self.market_table = MarketDataTable([], {field: np.zeros(0) for field in MarketDataTable.FIELDS})   # leading tokens, grown on demand
+        self.market_lock = threading.Lock()
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'loads': 0}
+    
+    def _memo(self, key, loader):
+        with self.lock:
+            if key in self.values:
+                self.stats['hits'] += 1
+                return self.values[key]
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            with self.lock:
+                if key in self.values:
+                    self.stats['hits'] += 1
+                    return self.values[key]
+            value = loader()
+            with self.lock:
+                self.values[key] = value
+                self.stats['loads'] += 1
+        return value
+    
+    def get_age(self):
+        return time.time() - self.created_at
+    
+    def tokens(self, limit=None):
+        """Discovered token addresses for this cycle"""
+        def load():
+            discovered = self.discover()[:self.max_tokens]
+            tokens = dict.fromkeys(t if isinstance(t, str) else t.get('address', '') for t in discovered if t)
+            # Known honeypots / dead tokens are dropped before any scanner prices them
+            return rejection_cache.filter(tokens)
+        tokens = self._memo('tokens', load)
+        return tokens[:limit] if limit else list(tokens)
+    
+    def market(self, limit=None):
+        """MarketDataTable for the first `limit` discovered tokens; only rows not fetched yet this cycle are fetched"""
+        tokens = self.tokens()
+        wanted = min(limit or len(tokens), len(tokens))
+        with self.market_lock:
+            fetched = len(self.market_table)
+            if fetched < wanted:
+                self.market_table = self.market_table.concat(fetch_market_data(tokens[fetched:wanted]))
+                with self.lock:
+                    self.stats['loads'] += wanted - fetched
+            table = self.market_table
+        with self.lock:
+            self.stats['hits'] += min(fetched, wanted)
+        if len(table) == wanted:
+            return table
+        return table.select(np.arange(len(table)) < wanted)
+    
+    def holders(self, token_addresses):
+        """Holder counts aligned with token_addresses; each token is counted once per cycle"""
+        token_addresses = list(token_addresses)
+        with self.lock:
+            missing = [t for t in dict.fromkeys(token_addresses) if t not in self.holder_counts]
+            self.stats['hits'] += len(token_addresses) - len(missing)
+        if missing:
+            counts = fetch_holder_counts(missing)
+            with self.lock:
+                self.holder_counts.update(zip(missing, counts))
+                self.stats['loads'] += len(missing)
+        with self.lock:
+            return np.array([self.holder_counts.get(t, 0) for t in token_addresses], dtype=float)
+    
+    def metric(self, token_address, name, loader):
+        """Any other per-token value (e.g. a price history lookup), loaded once per cycle"""
+        return self._memo((name, token_address), lambda: loader(token_address))
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'tokens': len(self.values.get('tokens') or []), 'age': self.get_age()}
+
+market_universe = None
+market_universe_lock = threading.Lock()
+
+def begin_market_cycle():
+    """Start a fresh universe - called once per main-loop pass"""
+    global market_universe
+    with market_universe_lock:
+        market_universe = MarketUniverse(enhanced_find_newest_tokens_with_free_apis)
+        return market_universe
+
+def current_market_universe():
+    """This cycle's universe; scanners running outside the main loop get a new one once it is too old"""
+    global market_universe
+    with market_universe_lock:
+        if market_universe is None or market_universe.get_age() > CONFIG['MARKET_UNIVERSE_MAX_AGE']:
+            market_universe = MarketUniverse(enhanced_find_newest_tokens_with_free_apis)
+        return market_universe
+
+# Tokens we already turned down - dropped before any network call until the verdict expires
+class RejectionCache:
+    # Reason code -> seconds the verdict stands (None = permanent)
+    REASON_TTLS = {
+        'HONEYPOT': None,
+        'VORTEX_SCAM': None,
+        'DEAD_TOKEN': 6 * 3600,
+        'BOT_ACTIVITY': 3600,
+        'NO_SELL_ROUTE': 900,
+        'CONCENTRATION': 900,
+        'LOW_LIQUIDITY': 600,
+        'LOW_HOLDERS': 600
+    }
+    
+    def __init__(self, max_size=20000):
+        self.max_size = max_size
+        self.entries = OrderedDict()      # mint -> (reason, expires_at); permanent verdicts expire at inf
+        self.lock = threading.Lock()
+        self.rejected = defaultdict(int)  # reason -> verdicts recorded
+        self.skipped = defaultdict(int)   # reason -> evaluations avoided
+    
+    def reject(self, mint, reason):
+        ttl = self.REASON_TTLS[reason]
+        expires_at = float('inf') if ttl is None else time.time() + ttl
+        with self.lock:
+            current = self.entries.get(mint)
+            if current and current[1] >= expires_at:
+                return   # keep the longer verdict
+            self.entries[mint] = (reason, expires_at)
+            self.entries.move_to_end(mint)
+            self.rejected[reason] += 1
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+    
+    def check(self, mint):
+        """Reason code if the mint is still rejected (counted as a skipped evaluation), else None"""
+        with self.lock:
+            entry = self.entries.get(mint)
+            if entry is None:
+                return None
+            reason, expires_at = entry
+            if time.time() >= expires_at:
+                del self.entries[mint]
+                return None
+            self.skipped[reason] += 1
+            return reason
+    
+    def filter(self, mints):
+        """Mints without a standing rejection, order kept"""
+        return [mint for mint in mints if self.check(mint) is None]
+    
+    def get_stats(self):
+        with self.lock:
+            return {'size': len(self.entries), 'rejected': dict(self.rejected), 'skipped': dict(self.skipped)}
+
+rejection_cache = RejectionCache()
+
+# One thread for every deferred check - a heap ordered by due time; checks that come due together run as one batch per kind
+class DeferredCheckScheduler:
+    def __init__(self, coalesce_seconds=10, unhandled_retry_seconds=60):
+        self.coalesce_seconds = coalesce_seconds
+        self.unhandled_retry_seconds = unhandled_retry_seconds
+        self.heap = []            # (due_at, sequence, key)
+        self.checks = {}          # key -> (kind, due_at, payload)
+        self.handlers = {}        # kind -> handler(list of payloads)
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.db = None
+        self.thread = None
+        self.stats = {'scheduled': 0, 'completed': 0, 'batches': 0, 'failed': 0}
+    
+    def register(self, kind, handler):
+        """handler(payloads) gets every payload of this kind that came due in the same window"""
+        with self.condition:
+            self.handlers[kind] = handler
+            self.condition.notify_all()
+        self.start()
+    
+    def attach_database(self, db_manager):
+        """Reload checks still pending from an earlier run and persist new ones from now on"""
+        try:
+            stored = db_manager.get_deferred_checks()
+            with self.condition:
+                for row in stored:
+                    self._push(row['check_key'], row['kind'], row['due_at'], json.loads(row['payload']))
+                self.condition.notify_all()
+            self.db = db_manager
+            if stored:
+                logging.info(f"⏰ Reloaded {len(stored)} pending deferred checks")
+        except Exception as e:
+            logging.warning(f"Could not load deferred checks: {e}")
+        self.start()
+    
+    def _push(self, key, kind, due_at, payload):
+        self.checks[key] = (kind, due_at, payload)
+        heapq.heappush(self.heap, (due_at, next(self.sequence), key))
+    
+    def schedule(self, kind, delay_seconds, payload, key=None):
+        """Run a check after delay_seconds; scheduling an existing key again replaces it"""
+        key = key or f"{kind}:{time.time_ns()}:{next(self.sequence)}"
+        due_at = time.time() + delay_seconds
+        if self.db:
+            try:
+                self.db.save_deferred_check(key, kind, due_at, json.dumps(payload))
+            except Exception as e:
+                logging.debug(f"Could not persist deferred check {key}: {e}")
+        with self.condition:
+            self._push(key, kind, due_at, payload)
+            self.stats['scheduled'] += 1
+            self.condition.notify_all()
+        self.start()
+        return key
+    
+    def start(self):
+        with self.condition:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='deferred-checks', daemon=True)
+            self.thread.start()
+    
+    def _take_due(self):
+        """Block until something is due, then pop it and everything due within the coalesce window"""
+        with self.condition:
+            while True:
+                # Entries replaced by a later schedule() of the same key are skipped
+                while self.heap and self.checks.get(self.heap[0][2], (None, None))[1] != self.heap[0][0]:
+                    heapq.heappop(self.heap)
+                if not self.heap:
+                    self.condition.wait()
+                    continue
+                now = time.time()
+                if self.heap[0][0] > now:
+                    self.condition.wait(self.heap[0][0] - now)
+                    continue
+                
+                batches = defaultdict(list)
+                unhandled = []
+                horizon = now + self.coalesce_seconds
+                while self.heap and self.heap[0][0] <= horizon:
+                    due_at, _, key = heapq.heappop(self.heap)
+                    entry = self.checks.get(key)
+                    if not entry or entry[1] != due_at:
+                        continue
+                    kind, _, payload = entry
+                    if kind not in self.handlers:
+                        unhandled.append((key, kind, payload))
+                        continue
+                    del self.checks[key]
+                    batches[kind].append((key, payload))
+                # Reloaded before its handler was registered - look again shortly
+                for key, kind, payload in unhandled:
+                    self._push(key, kind, now + self.unhandled_retry_seconds, payload)
+                if batches:
+                    return batches
+    
+    def _run(self):
+        while True:
+            for kind, items in self._take_due().items():
+                try:
+                    with request_priority(HostRateLimiter.PRIORITY_SCAN):
+                        self.handlers[kind]([payload for _, payload in items])
+                    self.stats['completed'] += len(items)
+                except Exception as e:
+                    self.stats['failed'] += len(items)
+                    logging.error(f"Deferred {kind} checks failed: {e}")
+                self.stats['batches'] += 1
+                
+                with self.condition:
+                    finished = [key for key, _ in items if key not in self.checks]   # not rescheduled meanwhile
+                if self.db and finished:
+                    try:
+                        self.db.delete_deferred_checks(finished)
+                    except Exception as e:
+                        logging.debug(f"Could not clear deferred checks: {e}")
+    
+    def get_stats(self):
+        with self.condition:
+            return {**self.stats, 'pending': len(self.checks)}
+
+deferred_checks = DeferredCheckScheduler()
+
+# Scanners run as concurrent jobs so the loop that monitors positions never waits on discovery
+class ScannerPool:
+    def __init__(self, max_workers=4, default_deadline=20):
+        # Separate from REQUEST_EXECUTOR: scanners fan out into it, and nesting in one pool can deadlock
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scanner')
+        self.default_deadline = default_deadline
+        self.jobs = {}    # name -> (future, started_at, deadline)
+        self.lock = threading.Lock()
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'late': 0, 'skipped': 0}
+    
+    def submit(self, name, func, *args, deadline=None, **kwargs):
+        """Start a job unless the previous run of the same job is still going"""
+        with self.lock:
+            running = self.jobs.get(name)
+            if running and not running[0].done():
+                self.stats['skipped'] += 1
+                return False
+            deadline = deadline or self.default_deadline
+            # The deadline runs from submission, like collect() measures it
+            future = self.executor.submit(self._run, time.time() + deadline, func, *args, **kwargs)
+            self.jobs[name] = (future, time.time(), deadline)
+            self.stats['submitted'] += 1
+            return True
+    
+    def _run(self, deadline_at, func, *args, **kwargs):
+        # Discovery yields to exits, trades and monitoring on every rate-limited host;
+        # execute_trade refuses to buy for a job past its deadline
+        with request_priority(HostRateLimiter.PRIORITY_SCAN), scanner_deadline(deadline_at):
+            return func(*args, **kwargs)
+    
+    def is_running(self, name):
+        with self.lock:
+            job = self.jobs.get(name)
+            return bool(job and not job[0].done())
+    
+    def collect(self, names=None):
+        """(name, result) for every job (of names, if given) that finished since the last call - never blocks.
+        
+        A job that finished past its deadline has its result dropped: its opportunities are stale.
+        """
+        finished = []
+        now = time.time()
+        with self.lock:
+            for name, (future, started_at, deadline) in list(self.jobs.items()):
+                if names is not None and name not in names:
+                    continue
+                if not future.done():
+                    if now - started_at > deadline and not getattr(future, 'overdue_logged', False):
+                        future.overdue_logged = True
+                        logging.warning(f"⏱️ Scanner {name} past its {deadline:.0f}s deadline")
+                    continue
+                del self.jobs[name]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.stats['failed'] += 1
+                    logging.error(f"Scanner {name} failed: {e}")
+                    continue
+                if getattr(future, 'overdue_logged', False):
+                    self.stats['late'] += 1
+                    continue
+                self.stats['completed'] += 1
+                finished.append((name, result))
+        return finished
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'running': sum(1 for future, _, _ in self.jobs.values() if not future.done())}
+
+scanner_pool = ScannerPool(CONFIG['SCANNER_WORKERS'], CONFIG['SCANNER_DEADLINE_SECONDS'])
+
+def merge_opportunities(current, new, max_age=120, limit=10):
+    """One ranked list: best score per token, newest-first on ties, expired entries dropped"""
+    now = time.time()
+    best = {}
+    for opportunity in list(current) + list(new):
+        if now - opportunity.get('timestamp', 0) >= max_age:
+            continue
+        token = opportunity['token']
+        if token not in best or opportunity['score'] > best[token]['score']:
+            best[token] = opportunity
+    ranked = sorted(best.values(), key=lambda o: (o['score'], o.get('timestamp', 0)), reverse=True)
+    return ranked[:limit]
+
 def get_wallet_balance_sol():
     """Get current wallet SOL balance"""
     try:
@@ -6781,20 +8841,345 @@ def fast_rpc_call(method, params=None):
 # Usage example:
 # result = fast_rpc_call("getBalance", [wallet_address])
 
-
-def verify_all_functions_exist():
-    """Verify all required functions exist before trading"""
-    required_functions = [
-        'execute_optimized_transaction',
-        'execute_optimized_sell',
-        'monitor_positions',
-        'record_trade_result',
-        'check_alpha_exits',
-        'get_token_balance',
-        'execute_via_javascript'
-    ]
+def rpc_batch(calls, url=None, session=None, timeout=10, max_batch=None):
+    """Send (method, params) calls as JSON-RPC batch arrays; results come back in call order, None on error"""
+    url = url or HELIUS_RPC_URL
+    session = session or RPC_SESSION
+    max_batch = max_batch or CONFIG['RPC_BATCH_SIZE']
+    results = [None] * len(calls)
+    pending = [(list(range(i, min(i + max_batch, len(calls)))), 0) for i in range(0, len(calls), max_batch)]
+    limiter = get_host_limiter(url)
+    
+    def resubmit(chunk, attempt, reason, retry_after=None):
+        """Put a rate limited or dropped chunk back at the front, after backing off"""
+        if attempt >= CONFIG['RETRY_ATTEMPTS']:
+            logging.debug(f"RPC batch of {len(chunk)} gave up after {attempt + 1} attempts: {reason}")
+            return
+        # A throttled host limiter already holds the next send back; elsewhere sleep it off here
+        if reason != 429 or not limiter:
+            try:
+                delay = min(float(retry_after), 60) if retry_after else 0.5 * 2 ** attempt
+            except (TypeError, ValueError):
+                delay = 0.5 * 2 ** attempt
+            time.sleep(delay)
+        pending.insert(0, (chunk, attempt + 1))
+    
+    while pending:
+        chunk, attempt = pending.pop(0)
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": calls[i][0], "params": calls[i][1]}
+            for i in chunk
+        ]
+        if len(chunk) == 1:
+            payload = payload[0]
+        
+        # Providers meter each call in a batch, so the batch draws one token per call
+        # (the adapter takes the last one when the request goes out)
+        if limiter:
+            for _ in range(len(chunk) - 1):
+                limiter.acquire()
+        
+        try:
+            response = session.post(url, json=payload, timeout=timeout)
+        except Exception as e:
+            resubmit(chunk, attempt, e)
+            continue
+        
+        if response.status_code == 429:
+            resubmit(chunk, attempt, 429, response.headers.get('Retry-After'))
+            continue
+        
+        try:
+            data = response.json() if response.status_code == 200 else None
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and len(chunk) == 1:
+            data = [data]
+        
+        # Batch too large for this provider - halve it and send the halves
+        if not isinstance(data, list):
+            if len(chunk) > 1 and response.status_code in (200, 400, 413):
+                middle = len(chunk) // 2
+                pending[:0] = [(chunk[:middle], attempt), (chunk[middle:], attempt)]
+            else:
+                logging.debug(f"RPC batch of {len(chunk)} returned HTTP {response.status_code}")
+            continue
+        
+        for item in data:
+            call_id = item.get('id') if isinstance(item, dict) else None
+            if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+                continue
+            if 'error' in item:
+                logging.debug(f"RPC {calls[call_id][0]} error: {item['error']}")
+                continue
+            results[call_id] = item.get('result')
+    
+    return results
+
+# Decoded view of a getTransaction result - what every transaction parser reads instead of walking the JSON
+class TransactionSummary:
+    __slots__ = ('signature', 'slot', 'block_time', 'failed', 'signer', 'sol_delta', 'account_keys',
+                 'token_balances', 'dex_programs', 'dex_accounts', 'instruction_mints', 'minted',
+                 'token_deltas', 'raw')
+    
+    # Swap programs - an instruction to one of these that lists a wallet marks a trade by it
+    DEX_PROGRAMS = {
+        'JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4',  # Jupiter V6
+        'JUP4Fb2cqiRUcaTHdrPC8h2gNsA2ETXiPDD33WcGuJB',  # Jupiter V4
+        '675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8', # Raydium AMM
+        '9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM', # Raydium CLMM
+        'whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc',  # Orca Whirlpool
+        'DjVE6JNiYqPL2QXyCUUh8rNjHrbz9hXHNYt99MQ59qw1', # Orca V1
+        '9qvG1zUp8xF1Bi4m6UdRNby1BAAuaDrUxSpv4CmRRMjL', # Orca V2
+    }
     
-    missing = []
+    def __init__(self, signature, slot=None, block_time=None, failed=False, signer=None, sol_delta=0.0,
+                 account_keys=(), token_balances=(), dex_programs=(), dex_accounts=(),
+                 instruction_mints=(), minted=(), raw=None):
+        self.signature = signature
+        self.slot = slot
+        self.block_time = block_time
+        self.failed = failed
+        self.signer = signer
+        self.sol_delta = sol_delta                      # signer's native SOL change, fee included
+        self.account_keys = list(account_keys)
+        self.token_balances = [tuple(b) for b in token_balances]  # (account_index, mint, owner, pre_raw, post_raw, decimals); None = no account
+        self.dex_programs = list(dex_programs)
+        self.dex_accounts = set(dex_accounts)           # accounts passed to top-level DEX instructions
+        self.instruction_mints = list(instruction_mints)
+        self.minted = list(minted)                      # mints from inner mintTo / initializeMint
+        self.raw = raw                                  # full getTransaction result (memory only)
+        
+        self.token_deltas = defaultdict(lambda: defaultdict(float))   # mint -> owner -> UI amount change
+        for _, mint, owner, pre, post, decimals in self.token_balances:
+            self.token_deltas[mint][owner] += ((post or 0) - (pre or 0)) / 10 ** decimals
+    
+    @classmethod
+    def from_transaction(cls, transaction):
+        """Decode a jsonParsed getTransaction result"""
+        tx = transaction.get('transaction') or {}
+        message = tx.get('message') or {}
+        meta = transaction.get('meta') or {}
+        account_keys = [key.get('pubkey') if isinstance(key, dict) else key for key in message.get('accountKeys') or []]
+        
+        pre_lamports = meta.get('preBalances') or [0]
+        post_lamports = meta.get('postBalances') or [0]
+        
+        balances = {}
+        for column, token_balances in ((3, meta.get('preTokenBalances')), (4, meta.get('postTokenBalances'))):
+            for balance in token_balances or []:
+                amount = balance.get('uiTokenAmount') or {}
+                entry = balances.setdefault(balance['accountIndex'], [
+                    balance['accountIndex'], balance['mint'], balance.get('owner'), None, None, amount.get('decimals', 0)
+                ])
+                entry[column] = int(amount.get('amount', 0))
+        
+        instructions = message.get('instructions') or []
+        inner = [ins for group in meta.get('innerInstructions') or [] for ins in group.get('instructions', [])]
+        
+        dex_accounts = set()
+        instruction_mints = []
+        for instruction in instructions:
+            if not isinstance(instruction, dict):
+                continue
+            if instruction.get('programId') in cls.DEX_PROGRAMS:
+                dex_accounts.update(instruction.get('accounts', []))
+            parsed = instruction.get('parsed')
+            mint = (parsed.get('info') or {}).get('mint') if isinstance(parsed, dict) else None
+            if mint and len(mint) > 40 and mint not in instruction_mints:
+                instruction_mints.append(mint)
+        
+        minted = [
+            ins['parsed']['info']['mint'] for ins in inner
+            if isinstance(ins.get('parsed'), dict) and ins['parsed'].get('type') in ('mintTo', 'initializeMint')
+            and 'mint' in (ins['parsed'].get('info') or {})
+        ]
+        
+        return cls(
+            signature=tx['signatures'][0],
+            slot=transaction.get('slot'),
+            block_time=transaction.get('blockTime'),
+            failed=meta.get('err') is not None,
+            signer=account_keys[0] if account_keys else None,
+            sol_delta=(post_lamports[0] - pre_lamports[0]) / 1e9,
+            account_keys=account_keys,
+            token_balances=balances.values(),
+            dex_programs=list(dict.fromkeys(
+                ins.get('programId') for ins in instructions + inner
+                if isinstance(ins, dict) and ins.get('programId') in cls.DEX_PROGRAMS
+            )),
+            dex_accounts=dex_accounts,
+            instruction_mints=instruction_mints,
+            minted=minted,
+            raw=transaction
+        )
+    
+    def to_dict(self):
+        return {
+            field: sorted(self.dex_accounts) if field == 'dex_accounts' else getattr(self, field)
+            for field in self.__slots__ if field not in ('raw', 'token_deltas')
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+# Confirmed transactions never change - each signature is fetched and decoded once, in memory first, then on disk
+class TransactionCache:
+    GET_TRANSACTION_OPTIONS = {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0, "commitment": "confirmed"}
+    
+    def __init__(self, path, max_entries=5000, disk_max_entries=50000):
+        self.path = path
+        self.max_entries = max_entries
+        self.disk_max_entries = disk_max_entries
+        self.entries = OrderedDict()    # signature -> TransactionSummary
+        self.lock = threading.Lock()
+        self.db = None
+        self.db_lock = threading.Lock()
+        self.disk_writes = 0
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'fetched': 0, 'decoded': 0, 'disk_errors': 0}
+    
+    def _connect(self):
+        if self.db is None:
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            self.db.execute('PRAGMA journal_mode=WAL')
+            self.db.execute('PRAGMA synchronous=NORMAL')
+            self.db.execute('CREATE TABLE IF NOT EXISTS tx_summaries (signature TEXT PRIMARY KEY, summary TEXT NOT NULL)')
+        return self.db
+    
+    def _remember(self, summary):
+        with self.lock:
+            self.entries[summary.signature] = summary
+            self.entries.move_to_end(summary.signature)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def _load(self, signature):
+        try:
+            with self.db_lock:
+                row = self._connect().execute('SELECT summary FROM tx_summaries WHERE signature = ?', (signature,)).fetchone()
+        except Exception as e:
+            self.stats['disk_errors'] += 1
+            logging.debug(f"Transaction cache read failed: {e}")
+            return None
+        return TransactionSummary.from_dict(json.loads(row[0])) if row else None
+    
+    def _persist(self, summaries):
+        if not summaries:
+            return
+        try:
+            with self.db_lock:
+                db = self._connect()
+                db.executemany(
+                    'INSERT OR IGNORE INTO tx_summaries (signature, summary) VALUES (?, ?)',
+                    [(summary.signature, json.dumps(summary.to_dict())) for summary in summaries]
+                )
+                self.disk_writes += len(summaries)
+                if self.disk_writes >= 1000:
+                    # Oldest rows go first once the file holds more than disk_max_entries
+                    db.execute('DELETE FROM tx_summaries WHERE rowid <= (SELECT MAX(rowid) FROM tx_summaries) - ?',
+                               (self.disk_max_entries,))
+                    self.disk_writes = 0
+                db.commit()
+        except Exception as e:
+            self.stats['disk_errors'] += 1
+            logging.debug(f"Transaction cache write failed: {e}")
+    
+    def get(self, signature):
+        """Cached summary for a signature, or None"""
+        with self.lock:
+            summary = self.entries.get(signature)
+            if summary is not None:
+                self.entries.move_to_end(signature)
+                self.stats['memory_hits'] += 1
+                return summary
+        summary = self._load(signature)
+        if summary is not None:
+            self.stats['disk_hits'] += 1
+            self._remember(summary)
+        return summary
+    
+    def add(self, transaction):
+        """Summary for a getTransaction result, decoding it only the first time its signature is seen"""
+        try:
+            signature = transaction['transaction']['signatures'][0]
+        except (KeyError, IndexError, TypeError):
+            return None
+        summary = self.get(signature)
+        if summary is None:
+            summary = TransactionSummary.from_transaction(transaction)
+            self.stats['decoded'] += 1
+            self._remember(summary)
+            self._persist([summary])
+        return summary
+    
+    def fetch(self, signatures, url=None, session=None, timeout=10):
+        """Summaries for signatures in order (None where unavailable); only misses go to the RPC, in one batch"""
+        results = [self.get(signature) for signature in signatures]
+        missing = [i for i, summary in enumerate(results) if summary is None]
+        if not missing:
+            return results
+        
+        transactions = rpc_batch(
+            [("getTransaction", [signatures[i], self.GET_TRANSACTION_OPTIONS]) for i in missing],
+            url, session, timeout
+        )
+        decoded = []
+        for i, transaction in zip(missing, transactions):
+            if not transaction:
+                continue    # not available at this commitment yet - try again next time
+            try:
+                summary = TransactionSummary.from_transaction(transaction)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logging.debug(f"Could not decode transaction {signatures[i][:8]}: {e}")
+                continue
+            self._remember(summary)
+            decoded.append(summary)
+            results[i] = summary
+        
+        self.stats['fetched'] += len(missing)
+        self.stats['decoded'] += len(decoded)
+        self._persist(decoded)
+        return results
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'entries': len(self.entries)}
+
+tx_cache = TransactionCache(
+    CONFIG['TX_CACHE_PATH'],
+    max_entries=CONFIG['TX_CACHE_SIZE'],
+    disk_max_entries=CONFIG['TX_CACHE_DISK_ENTRIES']
+)
+
+def transaction_summary(transaction):
+    """Summary for a getTransaction result (summaries pass through), None if it can't be read"""
+    if transaction is None or isinstance(transaction, TransactionSummary):
+        return transaction
+    try:
+        return tx_cache.add(transaction)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        logging.debug(f"Could not decode transaction: {e}")
+        return None
+
+def get_transactions_batch(signatures, url=None, session=None, timeout=10):
+    """Transaction summaries for a list of signatures - cached ones free, the rest in one round trip (None where missing)"""
+    return tx_cache.fetch(signatures, url, session, timeout)
+
+
+def verify_all_functions_exist():
+    """Verify all required functions exist before trading"""
+    required_functions = [
+        'execute_optimized_transaction',
+        'execute_optimized_sell',
+        'monitor_positions',
+        'record_trade_result',
+        'check_alpha_exits',
+        'get_token_balance',
+        'execute_via_javascript'
+    ]
+    
+    missing = []
     for func_name in required_functions:
         if func_name not in globals() and not hasattr(AdaptiveAlphaTrader, func_name):
             missing.append(func_name)
@@ -6932,15 +9317,115 @@ def pre_flight_checklist():
         logging.error("Bot will NOT trade until all issues are resolved!")
         return False
 
+# Short-lived Jupiter quote cache so a swap can reuse the quote from the check just before it
+class JupiterQuoteCache:
+    def __init__(self, max_age_ms=500, max_size=256):
+        self.max_age = max_age_ms / 1000
+        self.max_size = max_size
+        self.quotes = OrderedDict()   # key -> (fetched_at, quote)
+        self.lock = threading.Lock()
+        self.stats = {'reused': 0, 'fetched': 0, 'expired': 0}
+    
+    @staticmethod
+    def amount_bucket(amount):
+        """Round to 3 significant figures so near-identical sizes share a quote"""
+        amount = int(amount)
+        if amount <= 0:
+            return 0
+        scale = 10 ** max(len(str(amount)) - 3, 0)
+        return (amount + scale // 2) // scale * scale
+    
+    def make_key(self, input_mint, output_mint, amount, slippage_bps, extra_params=None):
+        extra = tuple(sorted((extra_params or {}).items()))
+        return (input_mint, output_mint, self.amount_bucket(amount), int(slippage_bps), extra)
+    
+    def get(self, key, max_age=None):
+        max_age = self.max_age if max_age is None else max_age
+        with self.lock:
+            entry = self.quotes.get(key)
+            if not entry:
+                return None
+            fetched_at, quote = entry
+            if time.time() - fetched_at > max_age:
+                self.stats['expired'] += 1
+                return None
+            self.stats['reused'] += 1
+            return quote
+    
+    def set(self, key, quote):
+        with self.lock:
+            self.quotes[key] = (time.time(), quote)
+            self.quotes.move_to_end(key)
+            self.stats['fetched'] += 1
+            while len(self.quotes) > self.max_size:
+                self.quotes.popitem(last=False)
+    
+    def get_stats(self):
+        with self.lock:
+            total = self.stats['reused'] + self.stats['fetched']
+            return {
+                **self.stats,
+                'size': len(self.quotes),
+                'reuse_rate': (self.stats['reused'] / total) * 100 if total else 0
+            }
+
+jupiter_quote_cache = JupiterQuoteCache(max_age_ms=CONFIG['JUPITER_QUOTE_REUSE_MS'])
+
+def get_jupiter_quote(input_mint, output_mint, amount, slippage_bps, extra_params=None, max_age=None, timeout=10,
+                      exact_amount=False):
+    """Jupiter /v6/quote response, reused if an equivalent quote is younger than max_age seconds.
+    
+    Amounts share a cache bucket; quotes that will be swapped pass exact_amount=True so only
+    a cached quote for exactly this inAmount is reused.
+    """
+    key = jupiter_quote_cache.make_key(input_mint, output_mint, amount, slippage_bps, extra_params)
+    quote = jupiter_quote_cache.get(key, max_age)
+    if quote is not None and (not exact_amount or str(quote.get('inAmount')) == str(int(amount))):
+        return quote
+    
+    params = {
+        "inputMint": input_mint,
+        "outputMint": output_mint,
+        "amount": str(int(amount)),
+        "slippageBps": str(int(slippage_bps))
+    }
+    if extra_params:
+        params.update(extra_params)
+    
+    try:
+        response = HTTP_SESSION.get(f"{CONFIG['JUPITER_API_URL']}/v6/quote", params=params, timeout=timeout)
+        if response.status_code == 429:
+            # The Jupiter limiter has already backed off, so one more attempt waits its turn
+            response = HTTP_SESSION.get(f"{CONFIG['JUPITER_API_URL']}/v6/quote", params=params, timeout=timeout)
+        
+        if response.status_code == 400 and "TOKEN_NOT_TRADABLE" in response.text:
+            logging.warning(f"Token {output_mint[:8]} not tradable on Jupiter - might be too new")
+            return None
+        if response.status_code != 200:
+            logging.debug(f"Jupiter quote failed: {response.status_code}")
+            return None
+        
+        quote = response.json()
+        if "data" in quote and "outAmount" not in quote:
+            quote = quote["data"]
+        if "outAmount" not in quote:
+            return None
+        
+        jupiter_quote_cache.set(key, quote)
+        return quote
+    except Exception as e:
+        logging.debug(f"Jupiter quote error: {e}")
+        return None
+
+def sol_per_token_from_quote(token_address, lamports, token_base_units):
+    """SOL per whole token from a SOL/token quote, or None while the mint's decimals are unknown"""
+    decimals = get_token_decimals(token_address)
+    if decimals is None or not token_base_units:
+        return None
+    return (lamports / 1e9) / (token_base_units / 10 ** decimals)
+
 def get_token_price_standard(token_address: str) -> Optional[float]:
     """Standard method for getting token price - your original implementation."""
-    # Check cache first if it's recent (less than 30 seconds old)
-    if token_address in price_cache and token_address in price_cache_time:
-        if time.time() - price_cache_time[token_address] < 30:  # 30 second cache
-            if ULTRA_DIAGNOSTICS:
-                logging.info(f"Using cached price for {token_address}: {price_cache[token_address]} SOL")
-            return price_cache[token_address]
-    
     # For SOL token, price is always 1 SOL
     if token_address == SOL_TOKEN_ADDRESS:
         return 1.0
@@ -6953,150 +9438,35 @@ def get_token_price_standard(token_address: str) -> Optional[float]:
     
     # For other tokens, try Jupiter API
     try:
-        # Use Jupiter v6 quote API
-        quote_url = f"{CONFIG['JUPITER_API_URL']}/v6/quote"
-        params = {
-            "inputMint": SOL_TOKEN_ADDRESS,
-            "outputMint": token_address,
-            "amount": "1000000000",  # 1 SOL in lamports
-            "slippageBps": "500"
-        }
-        
         logging.info(f"Getting price for {token_address} using Jupiter API...")
         
-        # Rate limiting
-        global last_api_call_time, api_call_delay
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            sleep_time = api_call_delay - time_since_last_call
-            if ULTRA_DIAGNOSTICS:
-                logging.info(f"Rate limiting: Sleeping for {sleep_time:.2f}s before Jupiter API call")
-            time.sleep(sleep_time)
-        
-        # Make API call
-        last_api_call_time = time.time()
-        response = requests.get(quote_url, params=params, timeout=10)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            logging.warning(f"Rate limited by Jupiter API (429). Waiting and retrying...")
-            time.sleep(2)
-            last_api_call_time = time.time()
-            response = requests.get(quote_url, params=params, timeout=10)
-            
-            if response.status_code == 429:
-                api_call_delay += 0.5
-                logging.warning(f"Still rate limited. Increased delay to {api_call_delay}s")
-        
-        # Process successful response
-        if response.status_code == 200:
-            data = response.json()
-            if "outAmount" in data:
-                out_amount = int(data["outAmount"])
-                token_price = 1.0 / (out_amount / 1000000000)
-                
-                logging.info(f"Got price for {token_address}: {token_price} SOL (1 SOL = {out_amount} tokens)")
-                
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
-                
-                # Mark as tradable
-                for token in KNOWN_TOKENS:
-                    if token["address"] == token_address:
-                        token["tradable"] = True
-                        break
-                
-                return token_price
-            elif "data" in data and "outAmount" in data["data"]:
-                out_amount = int(data["data"]["outAmount"])
-                token_price = 1.0 / (out_amount / 1000000000)
-                
-                logging.info(f"Got price for {token_address}: {token_price} SOL (1 SOL = {out_amount} tokens)")
-                
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
-                
-                # Mark as tradable
-                for token in KNOWN_TOKENS:
-                    if token["address"] == token_address:
-                        token["tradable"] = True
-                        break
-                
-                return token_price
-            else:
-                logging.warning(f"Invalid quote response for {token_address}")
-        
-        # Try reverse direction
-        logging.info(f"Trying reverse direction for {token_address} price...")
-        reverse_params = {
-            "inputMint": token_address,
-            "outputMint": SOL_TOKEN_ADDRESS,
-            "amount": "1000000000",
-            "slippageBps": "500"
-        }
-        
-        # Rate limiting for reverse call
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            sleep_time = api_call_delay - time_since_last_call
-            if ULTRA_DIAGNOSTICS:
-                logging.info(f"Rate limiting: Sleeping for {sleep_time:.2f}s before Jupiter API call")
-            time.sleep(sleep_time)
-        
-        # Make reverse API call
-        last_api_call_time = time.time()
-        response = requests.get(quote_url, params=reverse_params, timeout=10)
+        # Jupiter v6 quote for 1 SOL (reused if the same quote was just fetched)
+        quote = get_jupiter_quote(SOL_TOKEN_ADDRESS, token_address, 1000000000, 500)
+        if quote and int(quote["outAmount"]) > 0:
+            out_amount = int(quote["outAmount"])
+            token_price = sol_per_token_from_quote(token_address, 1000000000, out_amount)
+            if not token_price:
+                return None
+            logging.info(f"Got price for {token_address}: {token_price} SOL (1 SOL = {out_amount} tokens)")
+        else:
+            # Try reverse direction
+            logging.info(f"Trying reverse direction for {token_address} price...")
+            quote = get_jupiter_quote(token_address, SOL_TOKEN_ADDRESS, 1000000000, 500)
+            if not quote:
+                return None
+            out_amount = int(quote["outAmount"])
+            token_price = sol_per_token_from_quote(token_address, out_amount, 1000000000)
+            if not token_price:
+                return None
+            logging.info(f"Got reverse price for {token_address}: {token_price} SOL ({out_amount} lamports per 1e9 base units)")
         
-        # Handle rate limiting
-        if response.status_code == 429:
-            logging.warning(f"Rate limited by Jupiter API (429). Waiting and retrying...")
-            time.sleep(2)
-            last_api_call_time = time.time()
-            response = requests.get(quote_url, params=reverse_params, timeout=10)
-            
-            if response.status_code == 429:
-                api_call_delay += 0.5
-                logging.warning(f"Still rate limited. Increased delay to {api_call_delay}s")
+        # Mark as tradable
+        for token in KNOWN_TOKENS:
+            if token["address"] == token_address:
+                token["tradable"] = True
+                break
         
-        # Process successful reverse response
-        if response.status_code == 200:
-            data = response.json()
-            if "outAmount" in data:
-                out_amount = int(data["outAmount"])
-                token_price = out_amount / 1000000000
-                
-                logging.info(f"Got reverse price for {token_address}: {token_price} SOL (1 token = {out_amount} lamports)")
-                
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
-                
-                # Mark as tradable
-                for token in KNOWN_TOKENS:
-                    if token["address"] == token_address:
-                        token["tradable"] = True
-                        break
-                
-                return token_price
-            elif "data" in data and "outAmount" in data["data"]:
-                out_amount = int(data["data"]["outAmount"])
-                token_price = out_amount / 1000000000
-                
-                logging.info(f"Got reverse price for {token_address}: {token_price} SOL (1 token = {out_amount} lamports)")
-                
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
-                
-                # Mark as tradable
-                for token in KNOWN_TOKENS:
-                    if token["address"] == token_address:
-                        token["tradable"] = True
-                        break
-                
-                return token_price
+        return token_price
                 
     except Exception as e:
         logging.error(f"Error in standard price retrieval: {str(e)}")
@@ -7255,7 +9625,7 @@ def validate_token_still_tradeable(token_address):
     """Final check before trading to ensure token is still valid"""
     try:
         # Quick Jupiter quote check
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://quote-api.jup.ag/v6/quote",
             params={
                 "inputMint": "So11111111111111111111111111111111111111112",
@@ -7426,18 +9796,9 @@ def calculate_profitable_position_size(wallet_balance_sol, estimated_fees_sol=0.
 
 def meets_liquidity_requirements(token_address):
     """OPTIMIZED Enhanced anti-rug protection - $50k liquidity threshold - RATE LIMITED"""
-    global last_jupiter_call
-    
     try:
         logging.info(f"🛡️ Enhanced anti-rug check for {token_address[:8]}...")
         
-        # RATE LIMITING: Prevent Jupiter API overload
-        now = time.time()
-        if now - last_jupiter_call < JUPITER_CALL_DELAY:
-            sleep_time = JUPITER_CALL_DELAY - (now - last_jupiter_call)
-            logging.info(f"⏳ Rate limiting Jupiter calls - waiting {sleep_time:.1f}s")
-            time.sleep(sleep_time)
-        
         # LAYER 0: Blacklist check – Block known problematic tokens immediately
         BLACKLISTED_TOKENS = {
             "6z8HNowwV6eRnMZfC8Gu7QzBiG8orYgKoJEbqo5pqT": "Wallet crasher honeypot – confirmed unsafe",
@@ -7451,11 +9812,10 @@ def meets_liquidity_requirements(token_address):
         # LAYER 1: Jupiter buy tradability test
         logging.info(f"⚠️ Layer 1: Testing Jupiter buy quote...")
         try:
-            buy_response = requests.get(
+            buy_response = HTTP_SESSION.get(
                 f"https://quote-api.jup.ag/v6/quote?inputMint=So11111111111111111111111111111111111111112&outputMint={token_address}&amount=100000000&slippageBps=300",
                 timeout=8
             )
-            last_jupiter_call = time.time()  # Update timestamp after call
             
             if buy_response.status_code == 429:
                 logging.warning(f"🔄 Jupiter rate limited for {token_address[:8]} - skipping for now")
@@ -7486,18 +9846,11 @@ def meets_liquidity_requirements(token_address):
         # LAYER 2: Jupiter sell tradability test (CRITICAL for honeypot detection)
         logging.info(f"⚠️ Layer 2: Testing Jupiter sell quote...")
         
-        # Add rate limiting before second Jupiter call
-        now = time.time()
-        if now - last_jupiter_call < JUPITER_CALL_DELAY:
-            sleep_time = JUPITER_CALL_DELAY - (now - last_jupiter_call)
-            time.sleep(sleep_time)
-        
         try:
-            sell_response = requests.get(
+            sell_response = HTTP_SESSION.get(
                 f"https://quote-api.jup.ag/v6/quote?inputMint={token_address}&outputMint=So11111111111111111111111111111111111111112&amount=100000&slippageBps=500",
                 timeout=8
             )
-            last_jupiter_call = time.time()  # Update timestamp after call
             
             if sell_response.status_code == 429:
                 logging.warning(f"🔄 Jupiter rate limited for {token_address[:8]} - skipping for now")
@@ -7529,7 +9882,7 @@ def meets_liquidity_requirements(token_address):
         # LAYER 3: DexScreener verification with enhanced checks
         try:
             logging.info(f"⚠️ Layer 3: DexScreener verification...")
-            dex_response = requests.get(
+            dex_response = HTTP_SESSION.get(
                 f"https://api.dexscreener.com/latest/dex/tokens/{token_address}",
                 timeout=10
             )
@@ -7691,7 +10044,7 @@ def get_wallet_recent_trades(wallet_address: str) -> List[Dict]:
             'type': 'SWAP'  # Only swap transactions
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = HTTP_SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             transactions = response.json()
@@ -7722,6 +10075,25 @@ def parse_helius_transaction(tx: Dict) -> Optional[Dict]:
     Parse Helius transaction data to extract trade information
     """
     try:
+        # Already decoded from getTransaction elsewhere - read the signer's own balance changes
+        summary = tx_cache.get(tx['signature']) if tx.get('signature') else None
+        if summary and not summary.failed:
+            signer_deltas = {
+                mint: owners.get(summary.signer, 0) for mint, owners in summary.token_deltas.items()
+                if mint != "So11111111111111111111111111111111111111112"
+            }
+            signer_deltas = {mint: delta for mint, delta in signer_deltas.items() if delta}
+            if not signer_deltas:
+                return None
+            mint = max(signer_deltas, key=lambda m: abs(signer_deltas[m]))
+            return {
+                'token_address': mint,
+                'amount_sol': abs(summary.sol_delta),
+                'trade_type': 'buy' if signer_deltas[mint] > 0 else 'sell',
+                'timestamp': summary.block_time or tx.get('timestamp', time.time()),
+                'signature': summary.signature
+            }
+        
         # Look for token transfers in the transaction
         token_transfers = tx.get('tokenTransfers', [])
         
@@ -7978,68 +10350,18 @@ def close_copy_trade_position(token_address: str):
 def is_buy_transaction(transaction, wallet_address):
     """Check if a transaction represents a buy (swap from SOL/USDC to another token)"""
     try:
-        if not transaction or 'transaction' not in transaction:
-            return False
-            
-        tx = transaction['transaction']
-        if 'message' not in tx or 'instructions' not in tx['message']:
+        summary = transaction_summary(transaction)
+        if not summary:
             return False
-            
-        instructions = tx['message']['instructions']
         
-        # Look for swap instructions
-        for instruction in instructions:
-            if not isinstance(instruction, dict):
-                continue
-                
-            # Check for Jupiter/Raydium/Orca swap programs
-            program_id = instruction.get('programId', '')
-            
-            # Common Solana DEX program IDs
-            swap_programs = [
-                'JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4',  # Jupiter V6
-                'JUP4Fb2cqiRUcaTHdrPC8h2gNsA2ETXiPDD33WcGuJB',  # Jupiter V4
-                '675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8', # Raydium AMM
-                '9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM', # Raydium CLMM
-                'whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc',  # Orca Whirlpool
-                'DjVE6JNiYqPL2QXyCUUh8rNjHrbz9hXHNYt99MQ59qw1', # Orca V1
-                '9qvG1zUp8xF1Bi4m6UdRNby1BAAuaDrUxSpv4CmRRMjL', # Orca V2
-            ]
-            
-            if program_id in swap_programs:
-                # This is likely a swap instruction
-                # Check if it involves the wallet address
-                accounts = instruction.get('accounts', [])
-                if wallet_address in accounts:
-                    # Additional check: look for token account changes
-                    if 'parsed' in instruction:
-                        parsed = instruction['parsed']
-                        if parsed.get('type') in ['swap', 'swapV2', 'swapBaseIn', 'swapBaseOut']:
-                            return True
-                    
-                    # If no parsed data, assume it's a buy if wallet is involved
-                    return True
+        # A Jupiter/Raydium/Orca swap instruction that lists the wallet
+        if wallet_address in summary.dex_accounts:
+            return True
         
-        # Alternative method: Check account changes (pre/post balances)
-        meta = transaction.get('meta', {})
-        if 'preTokenBalances' in meta and 'postTokenBalances' in meta:
-            pre_balances = meta['preTokenBalances']
-            post_balances = meta['postTokenBalances']
-            
-            # Look for the wallet's token balance changes
-            for pre_bal in pre_balances:
-                if pre_bal.get('owner') == wallet_address:
-                    # Find corresponding post balance
-                    for post_bal in post_balances:
-                        if (post_bal.get('owner') == wallet_address and 
-                            post_bal.get('mint') == pre_bal.get('mint')):
-                            
-                            pre_amount = float(pre_bal.get('uiTokenAmount', {}).get('uiAmount', 0))
-                            post_amount = float(post_bal.get('uiTokenAmount', {}).get('uiAmount', 0))
-                            
-                            # If token balance increased, it's likely a buy
-                            if post_amount > pre_amount:
-                                return True
+        # Alternative method: one of the wallet's existing token balances increased
+        for _, _, owner, pre_amount, post_amount, _ in summary.token_balances:
+            if owner == wallet_address and pre_amount is not None and post_amount is not None and post_amount > pre_amount:
+                return True
         
         return False
         
@@ -8050,75 +10372,22 @@ def is_buy_transaction(transaction, wallet_address):
 def extract_token_from_transaction(transaction):
     """Extract the token address that was bought in the transaction"""
     try:
-        if not transaction or 'transaction' not in transaction:
-            return None
-            
-        meta = transaction.get('meta', {})
-        
-        # Method 1: Check post token balances for new tokens
-        if 'postTokenBalances' in meta:
-            post_balances = meta['postTokenBalances']
-            
-            # Look for the largest token balance change (likely the bought token)
-            largest_increase = 0
-            target_mint = None
-            
-            for balance in post_balances:
-                ui_amount = balance.get('uiTokenAmount', {}).get('uiAmount', 0)
-                if ui_amount and ui_amount > largest_increase:
-                    mint = balance.get('mint')
-                    if mint and mint != 'So11111111111111111111111111111111111111112':  # Not WSOL
-                        largest_increase = ui_amount
-                        target_mint = mint
-            
-            if target_mint:
-                return target_mint
-        
-        # Method 2: Parse swap instructions
-        tx = transaction['transaction']
-        if 'message' not in tx or 'instructions' not in tx['message']:
+        summary = transaction_summary(transaction)
+        if not summary:
             return None
-            
-        instructions = tx['message']['instructions']
         
-        for instruction in instructions:
-            if not isinstance(instruction, dict):
+        # Look for the largest token balance after the transaction (likely the bought token)
+        largest_increase = 0
+        target_mint = None
+        for _, mint, _, _, post_amount, decimals in summary.token_balances:
+            if post_amount is None or mint == 'So11111111111111111111111111111111111111112':  # Not WSOL
                 continue
-                
-            # Look for parsed swap data
-            if 'parsed' in instruction:
-                parsed = instruction['parsed']
-                if 'info' in parsed:
-                    info = parsed['info']
-                    
-                    # Common patterns for token swaps
-                    if 'destination' in info:
-                        # This might be the destination token account
-                        dest_account = info['destination']
-                        # We'd need to resolve this to a mint address
-                        
-                    if 'tokenSwap' in info:
-                        return info.get('tokenSwap')
-        
-        # Method 3: Look at account keys for mints
-        if 'accountKeys' in tx['message']:
-            account_keys = tx['message']['accountKeys']
-            
-            # Token mints are typically 44 characters and start with specific patterns
-            for key in account_keys:
-                if isinstance(key, str) and len(key) == 44:
-                    # Skip well-known addresses
-                    if key not in [
-                        'So11111111111111111111111111111111111111112',  # WSOL
-                        'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',  # USDC
-                        'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',  # USDT
-                        '11111111111111111111111111111111',             # System Program
-                        'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',   # Token Program
-                    ]:
-                        # This could be a token mint
-                        return key
+            ui_amount = post_amount / 10 ** decimals
+            if ui_amount > largest_increase:
+                largest_increase = ui_amount
+                target_mint = mint
         
-        return None
+        return target_mint
         
     except Exception as e:
         logging.debug(f"Error in extract_token_from_transaction: {e}")
@@ -8137,20 +10406,6 @@ def get_trending_social_tokens():
     # This is a placeholder - implement with social APIs
     return []
 
-def get_token_price(token_address):
-    """Get current token price"""
-    try:
-        # Use Jupiter API or DexScreener for price
-        response = requests.get(f"https://api.dexscreener.com/latest/dex/tokens/{token_address}")
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('pairs'):
-                return float(data['pairs'][0]['priceUsd'])
-    except:
-        pass
-    return 0
-
-
 # ADD THE CAPITAL PRESERVATION SYSTEM CLASS
 class CapitalPreservationSystem:
     def __init__(self):
@@ -8306,35 +10561,43 @@ def check_jeet_exit(token_address, position, config):
         return True, "ERROR"
 
 def get_detailed_price_history(token_address, timeframe='1h'):
-    """Get price history with 1-minute candles for jeet pattern detection"""
+    """Get recorded price ticks for jeet pattern detection"""
+    minutes = {'5m': 5, '15m': 15, '30m': 30, '1h': 60, '4h': 240, '24h': 1440}.get(timeframe, 60)
+    history = token_ticks.history(token_address, minutes)
+    
+    # Nothing recorded yet - take one live sample so the caller still gets the current point
+    if not history:
+        price = get_token_price(token_address)
+        if price:
+            history = [{'price': price, 'timestamp': time.time()}]
+    return history
+
+def get_price_minutes_ago(token_address, minutes):
+    """Token price in SOL N minutes ago from the tick store, or DexScreener's change windows"""
+    price = token_ticks.price_minutes_ago(token_address, minutes)
+    if price:
+        return price
+    
+    # DexScreener publishes percent change for fixed windows - back the old price out of it
+    window = {5: 'm5', 60: 'h1', 360: 'h6', 1440: 'h24'}.get(minutes)
+    if not window:
+        return None
     try:
-        # Use DexScreener API for price history
-        response = requests.get(
-            f"https://api.dexscreener.com/latest/dex/tokens/{token_address}",
-            timeout=10
-        )
-        
+        response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{token_address}", timeout=5)
         if response.status_code == 200:
-            data = response.json()
-            if data.get('pairs'):
-                pair = data['pairs'][0]
-                # Simplified - in production you'd want actual price history
-                return [
-                    {'price': float(pair.get('priceUsd', 0)), 'timestamp': time.time()}
-                ]
-        return []
+            pairs = response.json().get('pairs') or []
+            if pairs:
+                change = float(pairs[0].get('priceChange', {}).get(window, 0) or 0)
+                current_price = get_token_price(token_address)
+                if current_price and change > -100:
+                    return current_price / (1 + change / 100)
     except Exception as e:
-        logging.error(f"Error getting price history: {e}")
-        return []
+        logging.debug(f"Error getting price {minutes}m ago: {e}")
+    return None
 
 def get_token_creation_time(token_address):
-    """Get when a token was created"""
-    try:
-        # This is simplified - you'd need to check actual creation time
-        # For now, return current time minus a random age
-        return time.time() - (random.randint(10, 120) * 60)  # 10-120 minutes ago
-    except:
-        return time.time()
+    """Get when a token was created (unix time), or None if it can't be resolved"""
+    return mint_creation_times.get(token_address)
 
 def get_token_holder_count(token_address):
     """Get number of token holders"""
@@ -8345,18 +10608,22 @@ def get_token_holder_count(token_address):
     except:
         return 0
 
-def analyze_token_for_jeet_pattern(token_address):
-    """Analyze if token shows classic jeet dump pattern"""
+def analyze_token_for_jeet_pattern(token_address, market_row=None):
+    """Analyze if token shows classic jeet dump pattern (market_row: a MarketDataTable row already fetched)"""
     try:
-        # Get current metrics using your existing functions
-        current_price = get_token_price(token_address) or 0.000001
-        volume_24h = get_token_volume_24h(token_address)
-        liquidity = get_token_liquidity(token_address)
+        # Get current metrics using your existing functions, unless the batch scan already has them
+        if market_row and market_row['price'] > 0:
+            current_price = market_row['price']
+            volume_24h = market_row['volume']
+            liquidity = market_row['liquidity']
+        else:
+            current_price = get_token_price(token_address) or 0.000001
+            volume_24h = get_token_volume_24h(token_address)
+            liquidity = get_token_liquidity(token_address)
         holders = get_token_holder_count(token_address)
         
-        # Simulate price history for jeet pattern
-        # In production, use actual price history
-        ath_price = current_price * random.uniform(1.8, 3.0)  # Simulate ATH
+        # Use recorded ATH when we have ticks, otherwise simulate price history for jeet pattern
+        ath_price = token_ticks.max_price_since(token_address, 0) or current_price * random.uniform(1.8, 3.0)
         price_from_ath = ((current_price - ath_price) / ath_price) * 100
         
         return {
@@ -8489,7 +10756,7 @@ def get_wallet_recent_transactions(wallet_address, limit=50):
             "type": "SWAP"  # Focus on swap transactions
         }
         
-        response = requests.get(url, params=params)
+        response = HTTP_SESSION.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -8518,30 +10785,18 @@ def get_wallet_transactions_rpc(wallet_address, limit=50):
             ]
         }
         
-        response = requests.post(HELIUS_RPC_URL, json=payload, headers=headers)
+        response = HTTP_SESSION.post(HELIUS_RPC_URL, json=payload, headers=headers)
         
         if response.status_code == 200:
             signatures = response.json().get('result', [])
             transactions = []
             
-            # Get transaction details for each signature
-            for sig_info in signatures[:10]:  # Limit to recent 10
-                sig = sig_info['signature']
-                tx_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getTransaction",
-                    "params": [
-                        sig,
-                        {"encoding": "jsonParsed", "commitment": "confirmed"}
-                    ]
-                }
-                
-                tx_response = requests.post(HELIUS_RPC_URL, json=tx_payload, headers=headers)
-                if tx_response.status_code == 200:
-                    tx_data = tx_response.json().get('result')
-                    if tx_data:
-                        transactions.append(tx_data)
+            # Get transaction details for the recent 10 in one batch
+            batch = get_transactions_batch([sig_info['signature'] for sig_info in signatures[:10]], HELIUS_RPC_URL, HTTP_SESSION)
+            for tx_data in batch:
+                if tx_data:
+                    holder_counter.observe_transaction(tx_data)
+                    transactions.append(tx_data)
                         
             return transactions
             
@@ -8557,35 +10812,27 @@ def parse_wallet_buys(wallet_address, transactions):
     
     for tx in transactions:
         try:
-            # Handle both API and RPC response formats
-            if isinstance(tx, dict):
-                # Check if transaction is recent (within last 5 minutes)
-                block_time = tx.get('blockTime', 0)
-                if current_time - block_time > 300:  # 5 minutes
-                    continue
-                
-                # Parse transaction instructions
-                if 'meta' in tx and tx['meta'].get('err') is None:
-                    # Look for token transfers in the transaction
-                    pre_balances = tx['meta'].get('preTokenBalances', [])
-                    post_balances = tx['meta'].get('postTokenBalances', [])
-                    
-                    # Find new tokens acquired
-                    for post in post_balances:
-                        is_new = True
-                        for pre in pre_balances:
-                            if post['mint'] == pre['mint']:
-                                is_new = False
-                                break
-                                
-                        if is_new and post['owner'] == wallet_address:
-                            # This is a new token the wallet acquired
-                            new_buys.append({
-                                'token': post['mint'],
-                                'amount': float(post['uiTokenAmount']['uiAmount']),
-                                'timestamp': block_time,
-                                'signature': tx.get('transaction', {}).get('signatures', [''])[0]
-                            })
+            # Helius API records have no getTransaction body and are skipped
+            summary = transaction_summary(tx) if isinstance(tx, (dict, TransactionSummary)) else None
+            if not summary or summary.failed:
+                continue
+            
+            # Check if transaction is recent (within last 5 minutes)
+            block_time = summary.block_time or 0
+            if current_time - block_time > 300:  # 5 minutes
+                continue
+            
+            # Find new tokens acquired - mints with no balance anywhere before the transaction
+            held_before = {mint for _, mint, _, pre_amount, _, _ in summary.token_balances if pre_amount is not None}
+            for _, mint, owner, _, post_amount, decimals in summary.token_balances:
+                if post_amount is not None and mint not in held_before and owner == wallet_address:
+                    # This is a new token the wallet acquired
+                    new_buys.append({
+                        'token': mint,
+                        'amount': post_amount / 10 ** decimals,
+                        'timestamp': block_time,
+                        'signature': summary.signature
+                    })
                             
         except Exception as e:
             logging.debug(f"Error parsing transaction: {e}")
@@ -9151,7 +11398,7 @@ def get_dexscreener_new_tokens() -> List[str]:
     """
     try:
         url = "https://api.dexscreener.com/latest/dex/tokens/"
-        response = requests.get(url, timeout=10)
+        response = HTTP_SESSION.get(url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -9179,7 +11426,7 @@ def get_pumpfun_new_launches() -> List[str]:
     try:
         # Pump.fun API endpoint for new tokens
         url = "https://api.pump.fun/coins"
-        response = requests.get(url, timeout=10)
+        response = HTTP_SESSION.get(url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -9284,7 +11531,7 @@ def is_snipeable_token(token_address: str) -> bool:
             return False
         
         # Quick Jupiter tradability test (2 second timeout)
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://quote-api.jup.ag/v6/quote",
             params={
                 "inputMint": "So11111111111111111111111111111111111111112",
@@ -9826,7 +12073,7 @@ def enhanced_token_filter(token_address):
     """Enhanced token filtering to avoid obvious rug pulls."""
     try:
         # Quick Jupiter validation
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://quote-api.jup.ag/v6/quote?inputMint=So11111111111111111111111111111111111111112&outputMint={token_address}&amount=100000000",
             timeout=8
         )
@@ -9902,7 +12149,7 @@ def get_token_price_for_profit_calc(token_address):
     """Get token price for profit calculation."""
     try:
         # Method 1: Jupiter quote for price
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://quote-api.jup.ag/v6/quote?inputMint={token_address}&outputMint=So11111111111111111111111111111111111111112&amount=1000000",
             timeout=5
         )
@@ -9917,7 +12164,7 @@ def get_token_price_for_profit_calc(token_address):
                 return price_usd
         
         # Method 2: DexScreener fallback
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://api.dexscreener.com/latest/dex/tokens/{token_address}",
             timeout=5
         )
@@ -9970,8 +12217,8 @@ def enhanced_token_filter_with_liquidity(potential_tokens):
             holder_count = get_holder_count(token)
             
             # SAFETY FILTERS
-            # 1. Age filter: 30 minutes to 2 hours (sweet spot)
-            if not (30 <= token_age_minutes <= 120):
+            # 1. Age filter: 30 minutes to 2 hours (sweet spot) - unknown age can't qualify
+            if token_age_minutes is None or not (30 <= token_age_minutes <= 120):
                 continue
                 
             # 2. Minimum liquidity filter  
@@ -10095,7 +12342,7 @@ def get_market_volatility_index():
             "method": "getBlockHeight"
         }
         
-        response = requests.post(url, json=payload, timeout=3)
+        response = HTTP_SESSION.post(url, json=payload, timeout=3)
         if response.status_code == 200:
             # If we can get block height, network is stable
             return 0.4  # Default medium-low volatility
@@ -10123,7 +12370,7 @@ def get_recent_trade_history(token_address, hours=2):
             ]
         }
         
-        response = requests.post(url, json=payload, timeout=5)
+        response = HTTP_SESSION.post(url, json=payload, timeout=5)
         if response.status_code == 200:
             data = response.json()
             # FIX: Check that result exists AND is not None
@@ -10153,47 +12400,189 @@ def get_recent_trade_history(token_address, hours=2):
         logging.debug(f"Error getting trade history: {e}")
         return []
 
-def get_token_age_minutes(token_address):
-    """Get actual token age in minutes using Helius"""
-    try:
-        url = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
+# Mint creation times - resolved once by paging signatures back to the first one, then kept in memory and Postgres
+class MintCreationTimeStore:
+    PAGE_SIZE = 1000
+    # Past every age window the filters use (the widest is 24 hours) - older mints needn't be paged further
+    AGE_HORIZON_SECONDS = 48 * 60 * 60
+    
+    def __init__(self, rpc_url, max_pages=10, max_total_pages=50):
+        self.rpc_url = rpc_url
+        self.max_pages = max_pages      # background pages per mint per pass; deeper mints go back in the queue
+        self.max_total_pages = max_total_pages  # pages per mint before settling for the oldest time seen
+        self.created_at = {}            # mint -> unix time of its first transaction (or a lower bound, see _page_back)
+        self.partial = {}               # mint -> (oldest block time seen, before cursor, pages read) while paging back
+        self.deep_queue = deque()       # busy mints the background resolver is still paging
+        self.db = None
+        self.lock = threading.Condition()
+        self.thread = None
+        self.stats = {'hits': 0, 'resolved': 0, 'pages': 0, 'deferred': 0, 'bounded': 0}
+    
+    def attach_database(self, db_manager):
+        """Load every stored creation time and persist new ones from now on"""
+        try:
+            stored = db_manager.get_mint_creation_times()
+            with self.lock:
+                self.created_at.update(stored)
+            self.db = db_manager
+            logging.info(f"📅 Loaded {len(stored)} mint creation times")
+        except Exception as e:
+            logging.warning(f"Could not load mint creation times: {e}")
+    
+    def peek(self, mint):
+        """Creation time if already known - never hits the network"""
+        with self.lock:
+            return self.created_at.get(mint)
+    
+    def get(self, mint):
+        """Creation time of the mint, or None while it is unknown.
+        Costs at most one signature page; busy mints are paged back in the background."""
+        with self.lock:
+            created_at = self.created_at.get(mint)
+            if created_at is not None:
+                self.stats['hits'] += 1
+                return created_at
+            if mint in self.partial:
+                return None
+        
+        created_at, oldest, before = self._page_back(mint, None, None, 1)
+        if created_at is not None or not before:
+            return created_at
+        
+        # More than a page of history - the oldest time seen is not the creation time
+        with self.lock:
+            if mint not in self.partial and mint not in self.created_at:
+                self.partial[mint] = (oldest, before, 1)
+                self.deep_queue.append(mint)
+                self.stats['deferred'] += 1
+                self.lock.notify()
+        self._start()
+        return None
+    
+    def _page_back(self, mint, oldest, before, max_pages):
+        """Page older signatures from `before`; (created_at, oldest, before).
         
-        # Get all transactions for this token
+        created_at is set once the first page is reached, or once history reaches past
+        AGE_HORIZON_SECONDS - then the oldest time seen is stored as a lower bound, which
+        every age filter treats the same as the real creation time.
+        """
+        for _ in range(max_pages):
+            page = self._fetch_page(mint, before)
+            if page is None:
+                break
+            
+            with self.lock:
+                self.stats['pages'] += 1
+            
+            if page:
+                before = page[-1]['signature']
+                block_time = page[-1].get('blockTime')
+                if block_time:
+                    oldest = block_time
+            
+            if len(page) < self.PAGE_SIZE:
+                # Reached the first transaction - this is the creation time
+                if oldest is not None:
+                    self._store(mint, oldest)
+                return oldest, oldest, None
+            
+            if oldest is not None and time.time() - oldest > self.AGE_HORIZON_SECONDS:
+                with self.lock:
+                    self.stats['bounded'] += 1
+                self._store(mint, oldest)
+                return oldest, oldest, None
+        return None, oldest, before
+    
+    def _start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._resolve_loop, name='mint-age-resolver', daemon=True)
+            self.thread.start()
+    
+    def _resolve_loop(self):
+        """Page busy mints back to their first transaction, a few pages per mint per turn"""
+        while True:
+            with self.lock:
+                while not self.deep_queue:
+                    self.lock.wait()
+                mint = self.deep_queue.popleft()
+                oldest, before, pages = self.partial.get(mint, (None, None, 0))
+            if not before:
+                continue
+            
+            turn_pages = min(self.max_pages, self.max_total_pages - pages)
+            try:
+                created_at, oldest, before = self._page_back(mint, oldest, before, turn_pages)
+            except Exception as e:
+                logging.debug(f"Creation time paging failed for {mint[:8]}: {e}")
+                created_at = None
+            pages += turn_pages
+            
+            if created_at is None and before and pages >= self.max_total_pages:
+                # Page budget spent - settle for the oldest time seen (the mint is at least that old)
+                if oldest is not None:
+                    with self.lock:
+                        self.stats['bounded'] += 1
+                    self._store(mint, oldest)
+                else:
+                    with self.lock:
+                        self.partial.pop(mint, None)
+                continue
+            
+            if created_at is None:
+                with self.lock:
+                    if before and mint not in self.created_at:
+                        self.partial[mint] = (oldest, before, pages)
+                        self.deep_queue.append(mint)
+                    else:
+                        self.partial.pop(mint, None)
+                if before:
+                    time.sleep(1)   # page failed or still deep - let other RPC traffic through
+    
+    def _fetch_page(self, mint, before=None):
+        options = {"limit": self.PAGE_SIZE}
+        if before:
+            options["before"] = before
         payload = {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "getSignaturesForAddress",
-            "params": [
-                token_address,
-                {"limit": 1000}  # Get max transactions
-            ]
+            "params": [mint, options]
         }
-        
-        response = requests.post(url, json=payload, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            if 'result' in data and len(data['result']) > 0:
-                # The last transaction is the oldest (mint transaction)
-                oldest_tx = data['result'][-1]
-                block_time = oldest_tx.get('blockTime')
-                
-                if block_time:
-                    current_time = int(time.time())
-                    age_seconds = current_time - block_time
-                    age_minutes = int(age_seconds / 60)
-                    
-                    # Sanity check
-                    if 0 < age_minutes < 100000:  # Less than ~69 days
-                        return age_minutes
-        
-        # Fallback: estimate from holder count
-        holders = get_holder_count(token_address)
-        if holders and holders > 0:
-            # New tokens get 1-3 holders per minute typically
-            estimated_age = int(holders / 2)
-            return min(estimated_age, 1440)  # Cap at 24 hours
-            
+        try:
+            response = HTTP_SESSION.post(self.rpc_url, json=payload, timeout=10)
+            if response.status_code == 200:
+                return response.json().get('result')
+        except Exception as e:
+            logging.debug(f"Signature page failed for {mint[:8]}: {e}")
         return None
+    
+    def record(self, mint, created_at):
+        """Store a creation time observed directly (e.g. the create transaction itself)"""
+        if self.peek(mint) is None:
+            self._store(mint, created_at)
+    
+    def _store(self, mint, created_at):
+        with self.lock:
+            self.created_at[mint] = created_at
+            self.partial.pop(mint, None)
+            self.stats['resolved'] += 1
+        if self.db:
+            try:
+                self.db.save_mint_creation_time(mint, created_at)
+            except Exception as e:
+                logging.debug(f"Could not persist creation time for {mint[:8]}: {e}")
+
+mint_creation_times = MintCreationTimeStore(HELIUS_RPC_URL)
+
+def get_token_age_minutes(token_address):
+    """Get actual token age in minutes from its first on-chain transaction"""
+    try:
+        created_at = mint_creation_times.get(token_address)
+        if created_at is None:
+            return None
+        return max(0, int((time.time() - created_at) / 60))
         
     except Exception as e:
         logging.debug(f"Error getting token age: {e}")
@@ -10203,6 +12592,11 @@ def get_token_age_minutes(token_address):
 def get_token_liquidity(token_address):
     """Get token liquidity using multiple methods with smart fallbacks"""
     try:
+        # Recent snapshot or stored row already has it
+        cached_liquidity = token_store.get(token_address, 'liquidity')
+        if cached_liquidity:
+            return cached_liquidity
+        
         # Track rate limits
         if not hasattr(get_token_liquidity, 'rate_limits'):
             get_token_liquidity.rate_limits = {}
@@ -10210,7 +12604,7 @@ def get_token_liquidity(token_address):
         # Method 1: DexScreener FIRST (it's free and reliable)
         try:
             dexscreener_url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-            response = requests.get(dexscreener_url, timeout=3)
+            response = HTTP_SESSION.get(dexscreener_url, timeout=3)
             
             if response.status_code == 200:
                 data = response.json()
@@ -10223,6 +12617,7 @@ def get_token_liquidity(token_address):
                     
                     if max_liquidity > 0:
                         logging.debug(f"✅ DexScreener liquidity: ${max_liquidity:,.0f}")
+                        token_store.set(token_address, liquidity=max_liquidity)
                         return max_liquidity
         except:
             pass
@@ -10234,7 +12629,7 @@ def get_token_liquidity(token_address):
                 birdeye_url = f"https://public-api.birdeye.so/defi/token/overview?address={token_address}"
                 headers = {'accept': 'application/json', 'x-api-key': birdeye_api_key}
                 
-                response = requests.get(birdeye_url, headers=headers, timeout=3)
+                response = HTTP_SESSION.get(birdeye_url, headers=headers, timeout=3)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -10242,6 +12637,7 @@ def get_token_liquidity(token_address):
                         liquidity = data['data'].get('liquidity', 0)
                         if liquidity > 0:
                             logging.debug(f"✅ Birdeye liquidity: ${liquidity:,.0f}")
+                            token_store.set(token_address, liquidity=float(liquidity))
                             return float(liquidity)
                 elif response.status_code == 429:
                     logging.warning("Birdeye rate limited - pausing for 60s")
@@ -10266,7 +12662,7 @@ def get_token_liquidity(token_address):
                 "params": {"id": token_address}
             }
             
-            response = requests.post(url, json=payload, timeout=3)
+            response = HTTP_SESSION.post(url, json=payload, timeout=3)
             if response.status_code == 200:
                 asset_data = response.json()
                 
@@ -10285,7 +12681,7 @@ def get_token_liquidity(token_address):
                     }
                 }
                 
-                response = requests.post(url, json=payload, timeout=3)
+                response = HTTP_SESSION.post(url, json=payload, timeout=3)
                 if response.status_code == 200:
                     search_data = response.json()
                     # Process pool data if found
@@ -10340,7 +12736,6 @@ def get_token_liquidity(token_address):
 def verify_wallet_setup():
     """Verify wallet is properly configured for real transactions"""
     try:
-        import requests
         import traceback
         
         logging.info("🔍 === WALLET VERIFICATION ===")
@@ -10390,7 +12785,7 @@ def verify_wallet_setup():
         
         # Test Jupiter API connectivity
         try:
-            test_quote_response = requests.get(
+            test_quote_response = HTTP_SESSION.get(
                 "https://quote-api.jup.ag/v6/quote",
                 params={
                     "inputMint": "So11111111111111111111111111111111111111112",
@@ -10413,54 +12808,112 @@ def verify_wallet_setup():
         logging.error(traceback.format_exc())
         
 
-def get_holder_count(token_address):
-    """Get number of token holders using Helius - CORRECTED VERSION"""
-    try:
-        url = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
-        
-        # FIXED: Use getProgramAccounts to find all token accounts for this mint
+# Holder counts from a dataSlice scan (amount bytes only), kept current from observed transfers
+class HolderCounter:
+    TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+    AMOUNT_OFFSET = 64   # u64 amount inside the 165-byte SPL token account
+    
+    def __init__(self, rpc_url, cache):
+        self.rpc_url = rpc_url
+        self.cache = cache                     # counts live in the shared cache under 'holders'
+        self.scanned_at = {}                   # mint -> time of the last full scan
+        self.seen_signatures = OrderedDict()   # so a transaction seen twice only counts once
+        self.lock = threading.Lock()
+        self.stats = {'scans': 0, 'scan_errors': 0, 'incremental_updates': 0}
+    
+    def count(self, mint):
+        """Cached holder count; a stale count is served while a rescan runs in the background"""
+        holders = self.cache.get_or_refresh(mint, self.scan, 'holders')
+        return holders or 0
+    
+    def scan(self, mint):
+        """Fetch the amount of every token account for the mint and count the non-zero ones"""
         payload = {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "getProgramAccounts",
             "params": [
-                "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",  # Token program
+                self.TOKEN_PROGRAM,
                 {
-                    "encoding": "jsonParsed",
+                    "encoding": "base64",
+                    "dataSlice": {"offset": self.AMOUNT_OFFSET, "length": 8},
                     "filters": [
-                        {"dataSize": 165},  # Token account size
-                        {
-                            "memcmp": {
-                                "offset": 0,
-                                "bytes": token_address  # Filter by mint address
-                            }
-                        }
+                        {"dataSize": 165},
+                        {"memcmp": {"offset": 0, "bytes": mint}}
                     ]
                 }
             ]
         }
         
-        response = requests.post(url, json=payload, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            if 'result' in data and data['result']:
-                # Count accounts with balance > 0
-                holders = 0
-                for account in data['result']:
-                    try:
-                        parsed = account['account']['data'].get('parsed', {})
-                        info = parsed.get('info', {})
-                        amount = info.get('tokenAmount', {}).get('amount', '0')
-                        if int(amount) > 0:
-                            holders += 1
-                    except:
-                        continue
-                
-                return holders if holders > 0 else 0
+        scan_time = time.time()
+        try:
+            response = HTTP_SESSION.post(self.rpc_url, json=payload, timeout=10)
+            accounts = response.json().get('result') if response.status_code == 200 else None
+        except Exception as e:
+            logging.debug(f"Holder scan failed for {mint[:8]}: {e}")
+            accounts = None
         
-        # If API fails, return 0 (don't trade on unknown data)
-        return 0
+        if accounts is None:
+            # Don't cache failures - callers treat 0 as "unknown, don't trade"
+            with self.lock:
+                self.stats['scan_errors'] += 1
+            return 0
         
+        raw = b''.join(base64.b64decode(account['account']['data'][0]) for account in accounts)
+        amounts = np.frombuffer(raw, dtype='<u8')
+        holders = int(np.count_nonzero(amounts))
+        
+        with self.lock:
+            self.scanned_at[mint] = scan_time
+            self.stats['scans'] += 1
+            if len(self.scanned_at) > self.cache.max_size:
+                for tracked in [m for m in self.scanned_at if self.cache.peek(m, 'holders') is None]:
+                    del self.scanned_at[tracked]
+        token_store.set(mint, holders=holders)   # lands in self.cache and in token_data
+        return holders
+    
+    def observe_transaction(self, transaction):
+        """Apply holder changes (empty -> funded, funded -> empty) for mints we have counts for"""
+        try:
+            summary = transaction_summary(transaction)
+            if not summary or summary.failed:
+                return
+            
+            block_time = summary.block_time or 0
+            with self.lock:
+                if summary.signature in self.seen_signatures:
+                    return
+                self.seen_signatures[summary.signature] = True
+                while len(self.seen_signatures) > 5000:
+                    self.seen_signatures.popitem(last=False)
+            
+            deltas = defaultdict(int)
+            for _, mint, _, pre_amount, post_amount, _ in summary.token_balances:
+                deltas[mint] += ((post_amount or 0) > 0) - ((pre_amount or 0) > 0)
+            
+            for mint, delta in deltas.items():
+                # Transfers already reflected in the last scan must not be counted again
+                if not delta or block_time <= self.scanned_at.get(mint, float('inf')):
+                    continue
+                holders = self.cache.peek(mint, 'holders')
+                if holders is not None and self.cache.update(mint, max(0, holders + delta), 'holders'):
+                    with self.lock:
+                        self.stats['incremental_updates'] += 1
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logging.debug(f"Holder update skipped: {e}")
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'tracked_mints': len(self.scanned_at)}
+
+holder_counter = HolderCounter(HELIUS_RPC_URL, price_cache)
+
+def get_holder_count(token_address):
+    """Get number of token holders (cached; 0 means unknown - don't trade on it)"""
+    try:
+        # A count stored by an earlier run is served (stale-while-revalidate) instead of rescanning cold
+        token_store.preload(token_address)
+        return holder_counter.count(token_address)
     except Exception as e:
         logging.debug(f"Error getting holder count for {token_address[:8]}: {e}")
         return 0
@@ -10489,7 +12942,7 @@ def get_recent_volume(token_address):
             ]
         }
         
-        response = requests.post(url, json=payload, timeout=5)
+        response = HTTP_SESSION.post(url, json=payload, timeout=5)
         if response.status_code == 200:
             data = response.json()
             # FIX: Check that result exists AND is not None
@@ -10539,7 +12992,7 @@ def has_locked_liquidity(token_address):
             ]
         }
         
-        response = requests.post(url, json=payload, timeout=5)
+        response = HTTP_SESSION.post(url, json=payload, timeout=5)
         if response.status_code == 200:
             data = response.json()
             # FIX: Check that result exists AND is not None before using len()
@@ -10570,6 +13023,11 @@ def has_locked_liquidity(token_address):
 def get_24h_volume(token_address):
     """Get 24-hour trading volume using multiple methods"""
     try:
+        # Recent snapshot or stored row already has it
+        cached_volume = token_store.get(token_address, 'volume')
+        if cached_volume:
+            return cached_volume
+        
         # Method 1: Use Birdeye API if available
         birdeye_api_key = os.getenv('BIRDEYE_API_KEY')
         if birdeye_api_key:
@@ -10580,7 +13038,7 @@ def get_24h_volume(token_address):
             }
             
             try:
-                response = requests.get(birdeye_url, headers=headers, timeout=5)
+                response = HTTP_SESSION.get(birdeye_url, headers=headers, timeout=5)
                 if response.status_code == 200:
                     data = response.json()
                     if data and isinstance(data, dict) and 'data' in data:
@@ -10589,6 +13047,8 @@ def get_24h_volume(token_address):
                             volume_24h = token_data.get('v24hUSD', 0)
                             if volume_24h and volume_24h > 0:
                                 logging.debug(f"✅ Birdeye 24h volume for {token_address[:8]}: ${volume_24h:,.0f}")
+                                token_ticks.record(token_address, volume=float(volume_24h))
+                                token_store.set(token_address, volume=float(volume_24h))
                                 return float(volume_24h)
             except Exception as e:
                 logging.debug(f"Birdeye API error: {e}")
@@ -10596,7 +13056,7 @@ def get_24h_volume(token_address):
         # Method 2: Try DexScreener as backup
         try:
             dexscreener_url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-            response = requests.get(dexscreener_url, timeout=5)
+            response = HTTP_SESSION.get(dexscreener_url, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if data and isinstance(data, dict) and 'pairs' in data:
@@ -10612,6 +13072,8 @@ def get_24h_volume(token_address):
                         
                         if total_volume > 0:
                             logging.debug(f"✅ DexScreener 24h volume for {token_address[:8]}: ${total_volume:,.0f}")
+                            token_ticks.record(token_address, volume=total_volume)
+                            token_store.set(token_address, volume=total_volume)
                             return total_volume
         except Exception as e:
             logging.debug(f"DexScreener API error: {e}")
@@ -10967,7 +13429,7 @@ def get_helius_new_tokens(limit: int = 20) -> List[dict]:
         # This is a placeholder - adapt to your existing Helius integration
         url = f"https://api.helius.xyz/v0/tokens/new?api-key={api_key}"
         
-        response = requests.get(url, timeout=10)
+        response = HTTP_SESSION.get(url, timeout=10)
         if response.status_code == 200:
             tokens = response.json()
             
@@ -11002,7 +13464,14 @@ def enhanced_find_newest_tokens_with_free_apis():
         all_tokens = []
         helius_key = os.environ.get('HELIUS_API_KEY', '6e4e884f-d053-4682-81a5-3aeaa0b4c7dc')
         
-        if helius_key:
+        launch_stream.start()
+        if launch_stream.is_connected():
+            # Launches arrive over the websocket - no need to poll Helius for them
+            streamed = launch_stream.recent(max_age_seconds=300)
+            all_tokens.extend(streamed)
+            logging.info(f"🛰️ {len(streamed)} streamed launches from the last 5 minutes")
+        
+        elif helius_key:
             logging.info("🔥 Starting PREMIUM Helius DEVELOPER token discovery with your real API key...")
             
             # Method 1: Helius transaction analysis (using proven endpoints from your dashboard)
@@ -11014,69 +13483,30 @@ def enhanced_find_newest_tokens_with_free_apis():
                     "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT
                 ]
                 
-                for token_address in popular_tokens:
-                    try:
-                        # Use the exact RPC URL from your Helius dashboard
-                        rpc_url = f"https://mainnet.helius-rpc.com/?api-key={helius_key}"
-                        
-                        payload = {
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": "getSignaturesForAddress",
-                            "params": [
-                                token_address,
-                                {
-                                    "limit": 8,
-                                    "commitment": "confirmed"
-                                }
-                            ]
-                        }
-                        
-                        response = HELIUS_SESSION.post(rpc_url, json=payload, timeout=8)
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            if 'result' in data and data['result']:
-                                signatures = [tx['signature'] for tx in data['result'][:3]]  # Top 3 recent
-                                
-                                # Get transaction details to find new tokens
-                                for signature in signatures:
-                                    tx_payload = {
-                                        "jsonrpc": "2.0",
-                                        "id": 1,
-                                        "method": "getTransaction",
-                                        "params": [
-                                            signature,
-                                            {
-                                                "encoding": "jsonParsed",
-                                                "commitment": "confirmed",
-                                                "maxSupportedTransactionVersion": 0
-                                            }
-                                        ]
-                                    }
-                                    
-                                    tx_response = RPC_SESSION.post(rpc_url, json=tx_payload, timeout=5)
-
-                                    
-                                    if tx_response.status_code == 200:
-                                        tx_data = tx_response.json()
-                                        
-                                        if 'result' in tx_data and tx_data['result']:
-                                            tx_info = tx_data['result']
-                                            
-                                            # Extract token mints from postTokenBalances
-                                            if 'meta' in tx_info and 'postTokenBalances' in tx_info['meta']:
-                                                for balance in tx_info['meta']['postTokenBalances']:
-                                                    mint = balance.get('mint')
-                                                    if mint and mint not in popular_tokens and len(mint) > 40:
-                                                        all_tokens.append(mint)
-                                                        logging.info(f"🔥 Helius found token: {mint[:8]}...")
-                                
-                                logging.info(f"✅ Helius analyzed {len(signatures)} transactions for {token_address[:8]}")
-                                
-                    except Exception as e:
-                        logging.warning(f"Helius signature search failed for {token_address[:8]}: {str(e)}")
+                # Use the exact RPC URL from your Helius dashboard
+                rpc_url = f"https://mainnet.helius-rpc.com/?api-key={helius_key}"
+                
+                # One batch for the signature lists, one for every transaction behind them
+                signature_lists = rpc_batch(
+                    [("getSignaturesForAddress", [token_address, {"limit": 8, "commitment": "confirmed"}]) for token_address in popular_tokens],
+                    rpc_url, HELIUS_SESSION, timeout=8
+                )
+                signatures = []
+                for token_address, signature_list in zip(popular_tokens, signature_lists):
+                    if signature_list:
+                        signatures.extend(tx['signature'] for tx in signature_list[:3])  # Top 3 recent
+                        logging.info(f"✅ Helius analyzed {len(signature_list[:3])} transactions for {token_address[:8]}")
+                    else:
+                        logging.warning(f"Helius signature search failed for {token_address[:8]}")
+                
+                # Extract token mints from post-transaction token balances
+                for tx_info in get_transactions_batch(signatures, rpc_url, RPC_SESSION, timeout=5):
+                    if not tx_info:
                         continue
+                    for _, mint, _, _, post_amount, _ in tx_info.token_balances:
+                        if post_amount is not None and mint not in popular_tokens and len(mint) > 40:
+                            all_tokens.append(mint)
+                            logging.info(f"🔥 Helius found token: {mint[:8]}...")
                 
                 unique_helius_tokens = list(set(all_tokens))
                 
@@ -11107,7 +13537,7 @@ def enhanced_find_newest_tokens_with_free_apis():
                     ]
                 }
                 
-                response = requests.post(rpc_url, json=payload, timeout=15)
+                response = HTTP_SESSION.post(rpc_url, json=payload, timeout=15)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -11139,7 +13569,7 @@ def enhanced_find_newest_tokens_with_free_apis():
         # Method 3: DexScreener trending tokens (FREE)
         try:
             logging.info("📈 Fetching DexScreener trending tokens...")
-            response = requests.get("https://api.dexscreener.com/latest/dex/tokens/trending/solana", timeout=10)
+            response = HTTP_SESSION.get("https://api.dexscreener.com/latest/dex/tokens/trending/solana", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 for token in data.get('pairs', [])[:6]:
@@ -11152,7 +13582,7 @@ def enhanced_find_newest_tokens_with_free_apis():
         # Method 4: Pump.fun fresh launches (FREE)
         try:
             logging.info("🚀 Fetching fresh Pump.fun launches...")
-            response = requests.get("https://frontend-api.pump.fun/coins/king-of-the-hill?offset=0&limit=50&includeNsfw=false", timeout=10)
+            response = HTTP_SESSION.get("https://frontend-api.pump.fun/coins/king-of-the-hill?offset=0&limit=50&includeNsfw=false", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 for token in data[:6]:
@@ -11169,7 +13599,7 @@ def enhanced_find_newest_tokens_with_free_apis():
             
             if birdeye_key:
                 headers = {"X-API-KEY": birdeye_key}
-                response = requests.get(
+                response = HTTP_SESSION.get(
                     "https://public-api.birdeye.so/public/tokenlist?sort_by=v24hUSD&sort_type=desc&offset=0&limit=20",
                     headers=headers,
                     timeout=10
@@ -11187,8 +13617,8 @@ def enhanced_find_newest_tokens_with_free_apis():
         except Exception as e:
             logging.warning(f"Birdeye failed: {str(e)}")
         
-        # Remove duplicates and validate
-        unique_tokens = list(set(all_tokens))
+        # Remove duplicates (keeping newest launches first) and validate
+        unique_tokens = list(dict.fromkeys(all_tokens))
         validated_tokens = []
         
         logging.info(f"🔍 Validating {len(unique_tokens)} discovered tokens...")
@@ -11284,6 +13714,7 @@ def execute_sell_with_retries(token_address, amount, max_retries=3):
     
     return False, "All retry attempts failed"
 
+@with_request_priority(HostRateLimiter.PRIORITY_EXIT)
 def execute_optimized_sell(token_address, amount_sol):
     """Sell tokens using JavaScript swap implementation"""
     global wallet
@@ -11317,21 +13748,14 @@ def execute_optimized_sell(token_address, amount_sol):
         
         # ALWAYS USE JAVASCRIPT FOR SELLING!
         logging.info(f"🚀 Executing sell via JavaScript swap.js...")
-        success, output = execute_via_javascript(token_address, amount_sol, is_sell=True)
+        success, output, signature = execute_via_javascript(token_address, amount_sol, is_sell=True, with_signature=True)
         
         # Clean up environment variable
         if 'SMALL_TOKEN_SELL' in os.environ:
             del os.environ['SMALL_TOKEN_SELL']
         
         if success:
-            # Extract signature from output
-            signature = None
-            
-            # Look for Solscan link
-            if "https://solscan.io/tx/" in output:
-                start = output.find("https://solscan.io/tx/") + len("https://solscan.io/tx/")
-                end = output.find("\n", start) if "\n" in output[start:] else len(output)
-                signature = output[start:end].strip()
+            if signature:
                 logging.info(f"✅ SELL CONFIRMED: {token_address[:8]}")
                 logging.info(f"🔗 View on Solscan: https://solscan.io/tx/{signature}")
             else:
@@ -11362,6 +13786,7 @@ def execute_optimized_sell(token_address, amount_sol):
         logging.error(traceback.format_exc())
         return None
 
+@with_request_priority(HostRateLimiter.PRIORITY_EXIT)
 def execute_partial_sell(token_address: str, percentage: float) -> bool:
     """Execute partial sell - currently does full sell until swap.js supports partials"""
     try:
@@ -11381,15 +13806,10 @@ def execute_partial_sell(token_address: str, percentage: float) -> bool:
             return True  # Return True to avoid blocking other operations
         
         # Execute full sell via JavaScript
-        success, output = execute_via_javascript(token_address, 0, is_sell=True)
+        success, output, signature = execute_via_javascript(token_address, 0, is_sell=True, with_signature=True)
         
         if success:
-            # Extract signature if available
-            signature = None
-            if "https://solscan.io/tx/" in output:
-                start = output.find("https://solscan.io/tx/") + len("https://solscan.io/tx/")
-                end = output.find("\n", start) if "\n" in output[start:] else len(output)
-                signature = output[start:end].strip()
+            if signature:
                 logging.info(f"✅ SELL SUCCESS: {token_address[:8]}")
                 logging.info(f"🔗 View on Solscan: https://solscan.io/tx/{signature}")
             else:
@@ -11418,6 +13838,7 @@ def execute_partial_sell(token_address: str, percentage: float) -> bool:
         # Return True to avoid blocking - we'll remove from positions anyway
         return True
         
+@with_request_priority(HostRateLimiter.PRIORITY_EXIT)
 def force_sell_token(token_address):
     """Force sell a token even if balance checks fail"""
     try:
@@ -11430,6 +13851,7 @@ def force_sell_token(token_address):
         os.environ['FORCE_SELL'] = 'true'
         
         # Execute via JavaScript with force flag
+        HOST_RATE_LIMITERS['jupiter'].acquire(HostRateLimiter.PRIORITY_EXIT)
         result = subprocess.run([
             'node', 'swap.js',
             token_address,
@@ -11577,7 +13999,7 @@ def is_likely_rug_pull(token_address):
     """OPTIMIZED rug pull detection - $50k liquidity + less strict for profitable tokens"""
     try:
         # Check if token has locked liquidity (basic check)
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://api.dexscreener.com/latest/dex/tokens/{token_address}",
             timeout=5
         )
@@ -11788,7 +14210,7 @@ def get_token_price_estimate(token_address):
     """Get real token price from Jupiter API"""
     try:
         # Try to get price from Jupiter quote API (same as your bot uses)
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://quote-api.jup.ag/v6/quote?inputMint={token_address}&outputMint=So11111111111111111111111111111111111111112&amount=1000000",
             timeout=5
         )
@@ -12164,11 +14586,12 @@ def ultimate_500_dollar_trading_loop():
             if jeet_positions:
                 monitor_jeet_positions()
             
-            # Look for new jeet opportunities if we have capacity
+            # Look for new jeet opportunities if we have capacity - the scan runs as a job so monitoring never waits on it
             if len(jeet_positions) < max_positions:  # Use dynamic max_positions
-                jeet_opportunities = find_jeet_dumps()
-                
-                if jeet_opportunities:
+                scanner_pool.submit('jeet', find_jeet_dumps)
+            
+            for _, jeet_opportunities in scanner_pool.collect(('jeet',)):
+                if jeet_opportunities and len(jeet_positions) < max_positions:
                     best_opportunity = jeet_opportunities[0]  # Already sorted by score
                     
                     # Double-check we have enough balance for new position
@@ -12214,10 +14637,11 @@ def find_jeet_dumps():
     opportunities = []
     
     try:
-        # Get tokens from your existing discovery methods
-        all_tokens = enhanced_find_newest_tokens_with_free_apis()[:100]
+        # Tokens and market data from this cycle's shared universe
+        universe = current_market_universe()
+        market = universe.market(100)
         
-        logging.info(f"🔍 Scanning {len(all_tokens)} tokens for jeet patterns...")
+        logging.info(f"🔍 Scanning {len(market)} tokens for jeet patterns...")
         
         # Add counters for debugging
         tokens_checked = 0
@@ -12228,32 +14652,26 @@ def find_jeet_dumps():
         volume_failures = 0
         liquidity_failures = 0
         
-        for token in all_tokens:
+        tokens_checked = len(market)
+        
+        # Vectorized pre-filter on age, volume and liquidity for the whole batch
+        age_ok = (market.age >= JEET_CONFIG['MIN_AGE_MINUTES']) & (market.age <= JEET_CONFIG['MAX_AGE_MINUTES'])
+        volume_ok = market.volume >= JEET_CONFIG['MIN_VOLUME_USD']
+        liquidity_ok = market.liquidity >= JEET_CONFIG['MIN_LIQUIDITY_USD']
+        age_failures = int(np.count_nonzero(~age_ok))
+        volume_failures = int(np.count_nonzero(age_ok & ~volume_ok))
+        liquidity_failures = int(np.count_nonzero(age_ok & ~liquidity_ok))
+        market = market.select(age_ok & volume_ok & liquidity_ok)
+        
+        for i in range(len(market)):
+            token_address = market.tokens[i]
             try:
-                token_address = token if isinstance(token, str) else token.get('address', '')
-                if not token_address:
-                    continue
-                
-                tokens_checked += 1
-                
-                # Check token age
-                creation_time = get_token_creation_time(token_address)
-                if not creation_time:
-                    logging.debug(f"❌ {token_address[:8]}: No creation time found")
-                    continue
-                    
-                age_minutes = (time.time() - creation_time) / 60
-                
-                # Must be in sweet spot age range
-                if not (JEET_CONFIG['MIN_AGE_MINUTES'] <= age_minutes <= JEET_CONFIG['MAX_AGE_MINUTES']):
-                    age_failures += 1
-                    logging.debug(f"❌ {token_address[:8]}: Age {age_minutes:.1f}m (need {JEET_CONFIG['MIN_AGE_MINUTES']}-{JEET_CONFIG['MAX_AGE_MINUTES']}m)")
-                    continue
+                age_minutes = float(market.age[i])
                 
                 logging.info(f"✅ {token_address[:8]}: Age {age_minutes:.1f}m - checking pattern...")
                 
                 # Analyze for jeet pattern
-                metrics = analyze_token_for_jeet_pattern(token_address)
+                metrics = analyze_token_for_jeet_pattern(token_address, market.row(i))
                 if not metrics:
                     no_metrics += 1
                     logging.debug(f"❌ {token_address[:8]}: No metrics returned")
@@ -12310,7 +14728,7 @@ def find_jeet_dumps():
                                f"Score: {recovery_score:.1f}")
                     
             except Exception as e:
-                logging.debug(f"Error analyzing token {token}: {e}")
+                logging.debug(f"Error analyzing token {token_address}: {e}")
                 continue
         
         # Log summary statistics
@@ -12674,7 +15092,7 @@ def is_token_tradable_enhanced(token_address):
     """Enhanced token validation with rug pull detection."""
     try:
         # Existing Jupiter validation
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://quote-api.jup.ag/v6/quote?inputMint=So11111111111111111111111111111111111111112&outputMint={token_address}&amount=50000",  # Reduced test amount
             timeout=8
         )
@@ -12696,7 +15114,7 @@ def is_token_tradable_enhanced(token_address):
                 "params": [token_address, {"encoding": "base64"}]
             }
             
-            response = requests.post(rpc_url, json=payload, timeout=6)
+            response = HTTP_SESSION.post(rpc_url, json=payload, timeout=6)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('result', {}).get('value') is not None:
@@ -12771,7 +15189,7 @@ def is_token_tradable_enhanced(token_address):
     """Enhanced token validation using multiple methods including Helius."""
     try:
         # Method 1: Jupiter quote test (most reliable)
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://quote-api.jup.ag/v6/quote?inputMint=So11111111111111111111111111111111111111112&outputMint={token_address}&amount=100000",
             timeout=8
         )
@@ -12789,7 +15207,7 @@ def is_token_tradable_enhanced(token_address):
                 "params": [token_address, {"encoding": "base64"}]
             }
             
-            response = requests.post(rpc_url, json=payload, timeout=6)
+            response = HTTP_SESSION.post(rpc_url, json=payload, timeout=6)
             if response.status_code == 200:
                 data = response.json()
                 return data.get('result', {}).get('value') is not None
@@ -12811,7 +15229,7 @@ def is_token_tradable_jupiter(token_address):
     """
     try:
         # Quick Jupiter quote test - most reliable validation
-        response = requests.get(
+        response = HTTP_SESSION.get(
             f"https://quote-api.jup.ag/v6/quote"
             f"?inputMint=So11111111111111111111111111111111111111112"
             f"&outputMint={token_address}"
@@ -13126,7 +15544,7 @@ def test_helius_free_tier(helius_key):
                 ]
             }
             
-            response = requests.post(helius_rpc, json=sig_payload, headers=headers, timeout=10)
+            response = HTTP_SESSION.post(helius_rpc, json=sig_payload, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -13150,7 +15568,7 @@ def test_helius_free_tier(helius_key):
                         ]
                     }
                     
-                    tx_response = requests.post(helius_rpc, json=tx_payload, headers=headers, timeout=8)
+                    tx_response = HTTP_SESSION.post(helius_rpc, json=tx_payload, headers=headers, timeout=8)
                     
                     if tx_response.status_code == 200:
                         tx_data = tx_response.json()
@@ -13294,7 +15712,7 @@ def validate_token_before_trading(token_address: str) -> bool:
                 "slippageBps": "300"
             }
             
-            response = requests.get(quote_url, params=params, timeout=10)
+            response = HTTP_SESSION.get(quote_url, params=params, timeout=10)
             
             if response.status_code == 200 and response.json().get('outAmount'):
                 logging.info(f"✅ Token {token_address[:8]} passed Jupiter validation")
@@ -13341,7 +15759,7 @@ def get_newest_tokens_quicknode():
             
             logging.info("🔍 Fetching newest tokens via QuickNode new-pools...")
             
-            response = requests.get(
+            response = HTTP_SESSION.get(
                 new_pools_url, 
                 headers=headers, 
                 params=params,
@@ -13391,7 +15809,7 @@ def get_newest_tokens_quicknode():
                 try:
                     logging.info(f"🔍 Trying QuickNode pump.fun endpoint: {endpoint}")
                     
-                    response = requests.get(
+                    response = HTTP_SESSION.get(
                         endpoint,
                         headers={'Content-Type': 'application/json'},
                         params={'limit': 20},
@@ -13679,7 +16097,7 @@ def get_pump_fun_token_info_quicknode(token_address: str):
             }
         }
         
-        response = requests.post(
+        response = HTTP_SESSION.post(
             quicknode_endpoint,
             json=payload,
             headers=headers,
@@ -13757,7 +16175,7 @@ def validate_token_before_trading(token_address: str) -> bool:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
             
-            response = requests.get(quote_url, params=params, headers=headers, timeout=5)
+            response = HTTP_SESSION.get(quote_url, params=params, headers=headers, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
@@ -13825,7 +16243,7 @@ def get_newest_tokens_quicknode():
         
         logging.info("🚀 Fetching newest tokens from QuickNode pump.fun API...")
         
-        response = requests.post(
+        response = HTTP_SESSION.post(
             quicknode_endpoint,
             json=payload,
             headers=headers,
@@ -13912,7 +16330,7 @@ def get_trending_tokens_quicknode():
         
         logging.info("📈 Fetching trending tokens from QuickNode...")
         
-        response = requests.post(
+        response = HTTP_SESSION.post(
             quicknode_endpoint,
             json=payload,
             headers=headers,
@@ -13971,7 +16389,7 @@ def get_pump_fun_token_info_quicknode(token_address: str):
             }
         }
         
-        response = requests.post(
+        response = HTTP_SESSION.post(
             quicknode_endpoint,
             json=payload,
             headers=headers,
@@ -14017,41 +16435,27 @@ def get_token_price_alternative(token_address: str) -> Optional[float]:
         
         logging.info(f"Getting alternative price for {token_address} using Jupiter API...")
         
-        # Rate limiting
-        global last_api_call_time, api_call_delay
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            sleep_time = api_call_delay - time_since_last_call
-            time.sleep(sleep_time)
-        
         # Make API call with different User-Agent
-        last_api_call_time = time.time()
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        response = requests.get(quote_url, params=params, headers=headers, timeout=15)
+        response = HTTP_SESSION.get(quote_url, params=params, headers=headers, timeout=15)
         
         # Handle rate limiting
         if response.status_code == 429:
-            logging.warning(f"Rate limited by Jupiter API (429). Waiting and retrying...")
-            time.sleep(5)  # Longer delay
-            last_api_call_time = time.time()
-            response = requests.get(quote_url, params=params, headers=headers, timeout=15)
+            logging.warning(f"Rate limited by Jupiter API (429). Retrying once the limiter allows...")
+            response = HTTP_SESSION.get(quote_url, params=params, headers=headers, timeout=15)
         
         # Process successful response
         if response.status_code == 200:
             data = response.json()
             if "outAmount" in data:
                 out_amount = int(data["outAmount"])
-                token_price = 0.1 / (out_amount / 1000000000)  # Adjusted for 0.1 SOL
-                
-                logging.info(f"Got alternative price for {token_address}: {token_price} SOL")
+                token_price = sol_per_token_from_quote(token_address, 100000000, out_amount)  # 0.1 SOL in
                 
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
-                
-                return token_price
+                if token_price:
+                    logging.info(f"Got alternative price for {token_address}: {token_price} SOL")
+                    return token_price
         
         # Try Jupiter price endpoint as another alternative
         try:
@@ -14061,16 +16465,13 @@ def get_token_price_alternative(token_address: str) -> Optional[float]:
                 "vsToken": SOL_TOKEN_ADDRESS
             }
             
-            response = requests.get(price_url, params=price_params, headers=headers, timeout=10)
+            response = HTTP_SESSION.get(price_url, params=price_params, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
                 if data and token_address in data:
                     price = float(data[token_address].get("price", 0))
                     if price > 0:
-                        # Update cache
-                        price_cache[token_address] = price
-                        price_cache_time[token_address] = time.time()
                         return price
         except Exception as e:
             logging.error(f"Error in price endpoint: {str(e)}")
@@ -14088,27 +16489,11 @@ def get_token_price_aggressive(token_address: str) -> Optional[float]:
         if token_address == SOL_TOKEN_ADDRESS:
             return 1.0
             
-        # Try to get token from Raydium API
+        # Try Raydium pair index
         try:
-            raydium_url = "https://api.raydium.io/v2/main/pairs"
-            response = requests.get(raydium_url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                for pair in data:
-                    if pair.get("base_mint") == token_address or pair.get("quote_mint") == token_address:
-                        if pair.get("base_mint") == token_address and pair.get("quote_mint") == SOL_TOKEN_ADDRESS:
-                            price = float(pair.get("price", 0))
-                            if price > 0:
-                                price_cache[token_address] = price
-                                price_cache_time[token_address] = time.time()
-                                return price
-                        elif pair.get("quote_mint") == token_address and pair.get("base_mint") == SOL_TOKEN_ADDRESS:
-                            price = 1.0 / float(pair.get("price", 0))
-                            if price > 0:
-                                price_cache[token_address] = price
-                                price_cache_time[token_address] = time.time()
-                                return price
+            price = raydium_pair_index.get_price(token_address, SOL_TOKEN_ADDRESS)
+            if price and price > 0:
+                return price
         except Exception as e:
             logging.error(f"Error with Raydium API: {str(e)}")
             
@@ -14123,31 +16508,19 @@ def get_token_price_aggressive(token_address: str) -> Optional[float]:
         
         logging.info(f"Getting aggressive price for {token_address} using Jupiter API...")
         
-        # Rate limiting
-        global last_api_call_time, api_call_delay
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            sleep_time = api_call_delay - time_since_last_call
-            time.sleep(sleep_time)
-        
         # Make API call
-        last_api_call_time = time.time()
-        response = requests.get(quote_url, params=params, timeout=15)
+        response = HTTP_SESSION.get(quote_url, params=params, timeout=15)
         
         # Process successful response
         if response.status_code == 200:
             data = response.json()
             if "outAmount" in data:
                 out_amount = int(data["outAmount"])
-                token_price = 0.01 / (out_amount / 1000000000)  # Adjusted for 0.01 SOL
+                token_price = sol_per_token_from_quote(token_address, 10000000, out_amount)  # 0.01 SOL in
                 
-                logging.info(f"Got aggressive price for {token_address}: {token_price} SOL")
-                
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
-                
-                return token_price
+                if token_price:
+                    logging.info(f"Got aggressive price for {token_address}: {token_price} SOL")
+                    return token_price
                 
     except Exception as e:
         logging.error(f"Error in aggressive price retrieval: {str(e)}")
@@ -14159,9 +16532,10 @@ def get_token_price_fallback(token_address: str) -> Optional[float]:
     """Last resort fallback for token price."""
     try:
         # Try to use cached value even if older
-        if token_address in price_cache:
-            logging.warning(f"Using cached price for {token_address} as fallback: {price_cache[token_address]} SOL")
-            return price_cache[token_address]
+        cached_price = price_cache.peek(token_address)
+        if cached_price is not None:
+            logging.warning(f"Using cached price for {token_address} as fallback: {cached_price} SOL")
+            return cached_price
             
         # Check if we have a predefined price
         for token in KNOWN_TOKENS:
@@ -14172,8 +16546,7 @@ def get_token_price_fallback(token_address: str) -> Optional[float]:
         # In simulation mode, generate a random price
         if CONFIG['SIMULATION_MODE']:
             random_price = random.uniform(0.00000001, 0.001)
-            price_cache[token_address] = random_price
-            price_cache_time[token_address] = time.time()
+            price_cache.set(token_address, random_price)
             logging.warning(f"Using randomly generated price for {token_address} (simulation only): {random_price} SOL")
             return random_price
                 
@@ -14182,107 +16555,388 @@ def get_token_price_fallback(token_address: str) -> Optional[float]:
     
     return None
 
-def get_raydium_price(token_address: str) -> Optional[float]:
-    """Get token price from Raydium pools."""
+def get_token_price_dexscreener(token_address: str) -> Optional[float]:
+    """Get token price in SOL from the most liquid DexScreener SOL pair."""
     try:
-        # Raydium API has a list of all their pools
-        raydium_url = "https://api.raydium.io/v2/main/pairs"
+        if token_address == SOL_TOKEN_ADDRESS:
+            return 1.0
         
-        # Add header to prevent rate limiting
+        response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{token_address}", timeout=10)
+        if response.status_code != 200:
+            return None
+        
+        pairs = response.json().get('pairs') or []
+        
+        # priceNative is quoted in the pair's quote token, so only SOL-quoted pairs give a SOL price
+        sol_pairs = [
+            p for p in pairs
+            if p.get('baseToken', {}).get('address') == token_address
+            and p.get('quoteToken', {}).get('address') == SOL_TOKEN_ADDRESS
+        ]
+        if not sol_pairs:
+            return None
+        
+        best_pair = max(sol_pairs, key=lambda p: float(p.get('liquidity', {}).get('usd', 0) or 0))
+        price = float(best_pair.get('priceNative', 0) or 0)
+        if price > 0:
+            return price
+            
+    except Exception as e:
+        logging.error(f"Error in DexScreener price retrieval: {str(e)}")
+    
+    return None
+
+def get_sol_price_usd() -> Optional[float]:
+    """SOL/USD from the most liquid DexScreener pair with SOL as base token."""
+    cached_price = price_cache.get(SOL_TOKEN_ADDRESS, 'price_usd')
+    if cached_price is not None:
+        return cached_price
+    
+    try:
+        response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{SOL_TOKEN_ADDRESS}", timeout=10)
+        if response.status_code != 200:
+            return None
+        
+        sol_pairs = [
+            p for p in response.json().get('pairs') or []
+            if p.get('baseToken', {}).get('address') == SOL_TOKEN_ADDRESS and p.get('priceUsd')
+        ]
+        if not sol_pairs:
+            return None
+        
+        best_pair = max(sol_pairs, key=lambda p: float(p.get('liquidity', {}).get('usd', 0) or 0))
+        price = float(best_pair['priceUsd'])
+        if price > 0:
+            price_cache.set(SOL_TOKEN_ADDRESS, price, 'price_usd')
+            return price
+    except Exception as e:
+        logging.debug(f"Error getting SOL/USD price: {e}")
+    
+    return None
+
+# Compact per-token metrics record; supports dict-style reads so existing callers keep working
+class TokenSnapshot:
+    __slots__ = ('token_address', 'price', 'liquidity', 'holders', 'volume', 'age',
+                 'price_change_5m', 'price_change_1h', 'fallback', 'perfect_bot_override', 'emergency_fallback')
+    
+    def __init__(self, token_address, price=0, liquidity=0, holders=0, volume=0, age=0,
+                 price_change_5m=0, price_change_1h=0, fallback=False, perfect_bot_override=False,
+                 emergency_fallback=False):
+        self.token_address = token_address
+        self.price = price
+        self.liquidity = liquidity
+        self.holders = holders
+        self.volume = volume
+        self.age = age
+        self.price_change_5m = price_change_5m
+        self.price_change_1h = price_change_1h
+        self.fallback = fallback
+        self.perfect_bot_override = perfect_bot_override
+        self.emergency_fallback = emergency_fallback
+    
+    def get(self, field, default=None):
+        value = getattr(self, field, None) if field in self.__slots__ else None
+        return default if value is None else value
+    
+    def __getitem__(self, field):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+    
+    def __contains__(self, field):
+        return field in self.__slots__
+    
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+def summarize_dexscreener_pairs(token_address, pairs):
+    """Collapse a token's DexScreener pairs into one record.
+    
+    Liquidity is the deepest pair, volume is summed across pairs, price changes come
+    from the deepest pair, and price is priceNative of the deepest SOL-quoted pair (0 if none).
+    pool_address is the deepest Raydium SOL pair (None if none).
+    """
+    liquidity_of = lambda p: float((p.get('liquidity') or {}).get('usd', 0) or 0)
+    best_pair = max(pairs, key=liquidity_of)
+    price_change = best_pair.get('priceChange') or {}
+    
+    sol_pairs = [
+        p for p in pairs
+        if p.get('baseToken', {}).get('address') == token_address
+        and p.get('quoteToken', {}).get('address') == SOL_TOKEN_ADDRESS
+    ]
+    raydium_pairs = [p for p in sol_pairs if p.get('dexId') == 'raydium']
+    created = [p['pairCreatedAt'] for p in pairs if p.get('pairCreatedAt')]
+    
+    return {
+        'symbol': (best_pair.get('baseToken') or {}).get('symbol') if best_pair.get('baseToken', {}).get('address') == token_address else None,
+        'pool_address': max(raydium_pairs, key=liquidity_of).get('pairAddress') if raydium_pairs else None,
+        'price': float(max(sol_pairs, key=liquidity_of).get('priceNative', 0) or 0) if sol_pairs else 0.0,
+        'liquidity': liquidity_of(best_pair),
+        'volume': sum(float((p.get('volume') or {}).get('h24', 0) or 0) for p in pairs),
+        'change_m5': float(price_change.get('m5', 0) or 0),
+        'change_h1': float(price_change.get('h1', 0) or 0),
+        'change_h6': float(price_change.get('h6', 0) or 0),
+        'change_h24': float(price_change.get('h24', 0) or 0),
+        'created_ms': min(created) if created else None
+    }
+
+def fetch_token_snapshot(token_address):
+    """Price, liquidity, volume and pair age from one DexScreener request; holders fetched alongside.
+    
+    Anything DexScreener can't provide falls back to the usual lookups, run concurrently.
+    """
+    holders_future = submit_with_priority(REQUEST_EXECUTOR, get_holder_count, token_address)
+    snapshot = TokenSnapshot(token_address)
+    
+    try:
+        response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{token_address}", timeout=5)
+        pairs = (response.json().get('pairs') or []) if response.status_code == 200 else []
+    except Exception as e:
+        logging.debug(f"DexScreener snapshot failed for {token_address[:8]}: {e}")
+        pairs = []
+    
+    pair_created_ms = None
+    if pairs:
+        summary = summarize_dexscreener_pairs(token_address, pairs)
+        snapshot.price = summary['price']
+        snapshot.liquidity = summary['liquidity']
+        snapshot.volume = summary['volume']
+        snapshot.price_change_5m = summary['change_m5']
+        snapshot.price_change_1h = summary['change_h1']
+        pair_created_ms = summary['created_ms']
+        token_store.set(
+            token_address,
+            symbol=summary['symbol'],
+            pool_address=summary['pool_address'],
+            liquidity=summary['liquidity'] or None,
+            volume=summary['volume'] or None,
+            price_change_5m=summary['change_m5'],
+            price_change_1h=summary['change_h1']
+        )
+    
+    # A known mint creation time beats pair creation; otherwise the oldest pair is close enough
+    created_at = mint_creation_times.peek(token_address)
+    if created_at is None and pair_created_ms:
+        created_at = pair_created_ms / 1000
+    if created_at is not None:
+        snapshot.age = max(0, int((time.time() - created_at) / 60))
+    
+    # Fill whatever DexScreener didn't have, all at once
+    fallbacks = {}
+    if not snapshot.price:
+        fallbacks['price'] = submit_with_priority(REQUEST_EXECUTOR, get_token_price, token_address)
+    if not snapshot.liquidity:
+        fallbacks['liquidity'] = submit_with_priority(REQUEST_EXECUTOR, get_token_liquidity, token_address)
+    if not snapshot.volume:
+        fallbacks['volume'] = submit_with_priority(REQUEST_EXECUTOR, get_24h_volume, token_address)
+    if created_at is None:
+        fallbacks['age'] = submit_with_priority(REQUEST_EXECUTOR, get_token_age_minutes, token_address)
+    
+    for field, future in fallbacks.items():
+        try:
+            setattr(snapshot, field, future.result(timeout=15) or 0)
+        except Exception as e:
+            logging.debug(f"Snapshot {field} lookup failed for {token_address[:8]}: {e}")
+    try:
+        snapshot.holders = holders_future.result(timeout=15) or 0
+    except Exception as e:
+        logging.debug(f"Snapshot holder lookup failed for {token_address[:8]}: {e}")
+    
+    # Later lookups for the same token are served from cache (DexScreener attributes went through token_store above)
+    if snapshot.price and 'price' not in fallbacks:
+        store_token_price(token_address, snapshot.price)
+    if snapshot.volume:
+        token_ticks.record(token_address, volume=snapshot.volume)
+    
+    return snapshot
+
+# In-memory Raydium pair index - the full pairs list is downloaded once per refresh, not per lookup
+class RaydiumPairIndex:
+    def __init__(self, url="https://api.raydium.io/v2/main/pairs", refresh_interval=300):
+        self.url = url
+        self.refresh_interval = refresh_interval
+        self.pair_prices = {}     # (mint, other_mint) -> (price of mint in other_mint, liquidity, amm_id)
+        self.pools_by_mint = {}   # mint -> tuple of amm ids
+        self.etag = None
+        self.last_modified = None
+        self.last_refresh = 0
+        self.last_build_time = 0
+        self.memory_bytes = 0
+        self.stats = {'refreshes': 0, 'not_modified': 0, 'failures': 0, 'lookups': 0, 'hits': 0}
+        self.lock = threading.Lock()
+        self.refresh_thread = None
+    
+    def start(self):
+        """Start the background refresh thread (safe to call repeatedly)"""
+        with self.lock:
+            if self.refresh_thread and self.refresh_thread.is_alive():
+                return
+            self.refresh_thread = threading.Thread(target=self._refresh_loop, name='raydium-index', daemon=True)
+            self.refresh_thread.start()
+    
+    def _refresh_loop(self):
+        """Owns every download - failures retry with backoff instead of on the lookup path"""
+        retry_delay = 5
+        while True:
+            try:
+                ok = self.refresh()
+            except Exception as e:
+                self.stats['failures'] += 1
+                logging.error(f"Raydium index refresh error: {e}")
+                ok = False
+            
+            if ok:
+                retry_delay = 5
+                time.sleep(self.refresh_interval)
+            else:
+                time.sleep(min(retry_delay, self.refresh_interval))
+                retry_delay = min(retry_delay * 2, self.refresh_interval)
+    
+    def refresh(self):
+        """Download the pairs list only if it changed since the last refresh"""
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
         
-        logging.info(f"Getting Raydium price for {token_address}...")
+        response = HTTP_SESSION.get(self.url, headers=headers, timeout=30)
         
-        # Make API call with retries
-        for retry in range(3):
+        if response.status_code == 304:
+            self.last_refresh = time.time()
+            self.stats['not_modified'] += 1
+            return True
+        
+        if response.status_code != 200:
+            self.stats['failures'] += 1
+            logging.warning(f"Raydium index refresh failed: {response.status_code}")
+            return False
+        
+        self._build(response.json())
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.last_refresh = time.time()
+        self.stats['refreshes'] += 1
+        return True
+    
+    def _build(self, pairs):
+        """Build fresh lookup dicts and swap them in, so readers never see a partial index"""
+        build_start = time.time()
+        pair_prices = {}
+        pools_by_mint = defaultdict(list)
+        
+        for pair in pairs:
+            base_mint = pair.get('baseMint') or pair.get('base_mint')
+            quote_mint = pair.get('quoteMint') or pair.get('quote_mint')
+            if not base_mint or not quote_mint:
+                continue
+            
             try:
-                response = requests.get(raydium_url, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Look for direct token/SOL pairs
-                    for pair in data:
-                        # Check for token/SOL pairs in both directions
-                        if (pair.get("base_mint") == token_address and 
-                            pair.get("quote_mint") == SOL_TOKEN_ADDRESS):
-                            
-                            # Base is our token, quote is SOL
-                            price = 1.0 / float(pair.get("price", 0))
-                            if price > 0:
-                                logging.info(f"Found Raydium base/quote pair for {token_address}, price: {price} SOL")
-                                return price
-                                
-                        elif (pair.get("quote_mint") == token_address and 
-                               pair.get("base_mint") == SOL_TOKEN_ADDRESS):
-                            
-                            # Base is SOL, quote is our token
-                            price = float(pair.get("price", 0))
-                            if price > 0:
-                                logging.info(f"Found Raydium quote/base pair for {token_address}, price: {price} SOL")
-                                return price
-                    
-                    # If no direct SOL pair, try to find a USDC path and convert
-                    usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # USDC mint address
-                    
-                    # First find token/USDC price if exists
-                    token_usdc_price = None
-                    for pair in data:
-                        if (pair.get("base_mint") == token_address and 
-                            pair.get("quote_mint") == usdc_mint):
-                            
-                            # Calculate token price in USDC
-                            token_usdc_price = 1.0 / float(pair.get("price", 0))
-                            break
-                            
-                        elif (pair.get("quote_mint") == token_address and 
-                               pair.get("base_mint") == usdc_mint):
-                            
-                            # Calculate token price in USDC
-                            token_usdc_price = float(pair.get("price", 0))
-                            break
-                    
-                    # Now find SOL/USDC price if we found a token/USDC price
-                    if token_usdc_price:
-                        sol_usdc_price = None
-                        for pair in data:
-                            if (pair.get("base_mint") == SOL_TOKEN_ADDRESS and 
-                                pair.get("quote_mint") == usdc_mint):
-                                
-                                # Calculate SOL price in USDC
-                                sol_usdc_price = 1.0 / float(pair.get("price", 0))
-                                break
-                                
-                            elif (pair.get("quote_mint") == SOL_TOKEN_ADDRESS and 
-                                   pair.get("base_mint") == usdc_mint):
-                                
-                                # Calculate SOL price in USDC
-                                sol_usdc_price = float(pair.get("price", 0))
-                                break
-                        
-                        # If we found both prices, calculate token price in SOL
-                        if sol_usdc_price and sol_usdc_price > 0:
-                            token_sol_price = token_usdc_price / sol_usdc_price
-                            logging.info(f"Calculated Raydium price via USDC for {token_address}: {token_sol_price} SOL")
-                            return token_sol_price
-                    
-                    logging.warning(f"No Raydium pairs found for {token_address}")
-                    break
-                    
-                elif response.status_code == 429:
-                    # Rate limited, wait longer
-                    wait_time = (retry + 1) * 2
-                    logging.warning(f"Rate limited when getting Raydium price. Waiting {wait_time}s.")
-                    time.sleep(wait_time)
-                else:
-                    logging.warning(f"Failed to get Raydium price: {response.status_code}")
-                    break
-            except Exception as e:
-                logging.error(f"Error getting Raydium price (attempt {retry+1}): {str(e)}")
-                time.sleep(1)
-                
+                price = float(pair.get('price', 0) or 0)  # base priced in quote
+                liquidity = float(pair.get('liquidity', 0) or 0)
+            except (TypeError, ValueError):
+                continue
+            if price <= 0:
+                continue
+            
+            amm_id = pair.get('ammId') or pair.get('amm_id')
+            pools_by_mint[base_mint].append(amm_id)
+            pools_by_mint[quote_mint].append(amm_id)
+            
+            # Keep the deepest pool for each direction
+            for key, key_price in (((base_mint, quote_mint), price), ((quote_mint, base_mint), 1.0 / price)):
+                existing = pair_prices.get(key)
+                if existing is None or liquidity > existing[1]:
+                    pair_prices[key] = (key_price, liquidity, amm_id)
+        
+        pools_by_mint = {mint: tuple(pools) for mint, pools in pools_by_mint.items()}
+        
+        self.pair_prices = pair_prices
+        self.pools_by_mint = pools_by_mint
+        self.memory_bytes = self._estimate_memory(pair_prices, pools_by_mint)
+        self.last_build_time = time.time() - build_start
+        
+        logging.info(f"📚 Raydium index built: {len(pools_by_mint)} mints, {len(pair_prices) // 2} pairs, "
+                     f"{self.memory_bytes / 1024 / 1024:.1f} MB in {self.last_build_time:.2f}s")
+    
+    def _estimate_memory(self, pair_prices, pools_by_mint):
+        """Approximate bytes held by the index (containers plus their keys and values)"""
+        total = sys.getsizeof(pair_prices) + sys.getsizeof(pools_by_mint)
+        for key, value in pair_prices.items():
+            total += sys.getsizeof(key) + sys.getsizeof(value)
+        for mint, pools in pools_by_mint.items():
+            total += sys.getsizeof(mint) + sys.getsizeof(pools)
+        return total
+    
+    def _ensure_loaded(self):
+        """Kick off the background loader; lookups never download the pairs list themselves"""
+        self.start()
+        return bool(self.last_refresh)
+    
+    def get_pools(self, mint):
+        """All Raydium pool ids that include this mint (empty until the index is loaded)"""
+        if not self._ensure_loaded():
+            return ()
+        return self.pools_by_mint.get(mint, ())
+    
+    def get_price(self, mint, quote_mint):
+        """Price of mint in quote_mint from the deepest pool, or None (also while the index is loading)"""
+        if not self._ensure_loaded():
+            return None
+        self.stats['lookups'] += 1
+        entry = self.pair_prices.get((mint, quote_mint))
+        if entry:
+            self.stats['hits'] += 1
+            return entry[0]
+        return None
+    
+    def get_price_in_sol(self, mint):
+        """Direct SOL pool first, otherwise route through USDC"""
+        price = self.get_price(mint, SOL_TOKEN_ADDRESS)
+        if price:
+            return price
+        
+        token_usdc_price = self.get_price(mint, USDC_TOKEN_ADDRESS)
+        sol_usdc_price = self.get_price(SOL_TOKEN_ADDRESS, USDC_TOKEN_ADDRESS)
+        if token_usdc_price and sol_usdc_price:
+            return token_usdc_price / sol_usdc_price
+        return None
+    
+    def get_age(self):
+        """Seconds since the index was last confirmed current"""
+        return time.time() - self.last_refresh if self.last_refresh else None
+    
+    def get_memory_size(self):
+        return self.memory_bytes
+    
+    def get_stats(self):
+        return {
+            **self.stats,
+            'mints': len(self.pools_by_mint),
+            'pairs': len(self.pair_prices) // 2,
+            'age_seconds': self.get_age(),
+            'memory_bytes': self.memory_bytes,
+            'build_seconds': self.last_build_time
+        }
+
+# Create global Raydium pair index
+raydium_pair_index = RaydiumPairIndex(refresh_interval=CONFIG['RAYDIUM_INDEX_REFRESH_SECONDS'])
+
+def get_raydium_price(token_address: str) -> Optional[float]:
+    """Get token price in SOL from the Raydium pair index."""
+    try:
+        if token_address == SOL_TOKEN_ADDRESS:
+            return 1.0
+        
+        price = raydium_pair_index.get_price_in_sol(token_address)
+        if price and price > 0:
+            logging.info(f"Found Raydium price for {token_address}: {price} SOL")
+            return price
+        
+        logging.warning(f"No Raydium pairs found for {token_address}")
         return None
     except Exception as e:
         logging.error(f"Error in get_raydium_price: {str(e)}")
@@ -14292,6 +16946,11 @@ def get_raydium_price(token_address: str) -> Optional[float]:
 def calculate_price_from_liquidity(token_address: str) -> Optional[float]:
     """Calculate token price from liquidity pools using RPC."""
     try:
+        # Held tokens already have a live price from their pool vault subscriptions
+        live_price = pool_reserve_stream.get_price(token_address)
+        if live_price:
+            return live_price
+        
         if not wallet:
             return None
             
@@ -14301,77 +16960,806 @@ def calculate_price_from_liquidity(token_address: str) -> Optional[float]:
             logging.warning(f"Couldn't get token supply for {token_address}")
             return None
             
-        token_decimals = int(token_supply.get('decimals', 9))
-        
-        # Step 2: Try to find liquidity pools for this token
-        # We can do this by looking for token accounts with large balances
+        token_decimals = int(token_supply.get('decimals', 9))
+        
+        # Step 2: Try to find liquidity pools for this token
+        # We can do this by looking for token accounts with large balances
+        try:
+            # Find largest token accounts
+            largest_accounts_response = wallet._rpc_call("getTokenLargestAccounts", [token_address])
+            
+            if ('result' not in largest_accounts_response or 
+                'value' not in largest_accounts_response['result']):
+                logging.warning(f"Couldn't get largest accounts for {token_address}")
+                return None
+                
+            largest_accounts = largest_accounts_response['result']['value']
+            
+            # Look for liquidity pools among these largest accounts
+            for account in largest_accounts[:3]:  # Check top 3 accounts
+                account_address = account['address']
+                
+                # Get account info to check if it's a pool
+                account_info = wallet._rpc_call("getAccountInfo", [
+                    account_address, 
+                    {"encoding": "jsonParsed"}
+                ])
+                
+                if ('result' not in account_info or 
+                    'value' not in account_info['result']):
+                    continue
+                
+                # For Raydium pools, we'd analyze the account data
+                # This is a simplified approach - full implementation would be more complex
+                
+                # Instead, we'll try to determine if this is likely a pool account 
+                # by checking owner program
+                owner = account_info['result']['value'].get('owner')
+                
+                # Raydium pool programs
+                raydium_programs = [
+                    "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM program
+                    "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"   # Raydium pool program
+                ]
+                
+                if owner in raydium_programs:
+                    # This is likely a Raydium pool
+                    logging.info(f"Found potential Raydium pool for {token_address}")
+                    
+                    # For a real implementation, we would decode the account data
+                    # and extract the token reserves to calculate price
+                    
+                    # Since that's quite complex, let's use a simplification:
+                    # Check if we can get the price from Raydium API instead
+                    price = get_raydium_price(token_address)
+                    if price:
+                        return price
+                    
+                    # In an actual implementation, we would:
+                    # 1. Decode the pool data structure
+                    # 2. Extract token A and B reserves
+                    # 3. Calculate price based on the ratio
+            
+            logging.warning(f"Couldn't find liquidity pools for {token_address} through account analysis")
+            return None
+            
+        except Exception as e:
+            logging.error(f"Error analyzing liquidity pools: {str(e)}")
+            return None
+            
+    except Exception as e:
+        logging.error(f"Error in calculate_price_from_liquidity: {str(e)}")
+        return None
+
+
+RAYDIUM_AMM_PROGRAM = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
+PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+
+# Push-based pool pricing - held tokens are priced from their Raydium vault balances as they change
+class PoolReserveStream:
+    # Raydium AMM v4 pool state offsets
+    AMM_STATE_SIZE = 752
+    BASE_DECIMAL_OFFSET = 32
+    QUOTE_DECIMAL_OFFSET = 40
+    BASE_VAULT_OFFSET = 336
+    QUOTE_VAULT_OFFSET = 368
+    BASE_MINT_OFFSET = 400
+    QUOTE_MINT_OFFSET = 432
+    # SPL token account amount offset
+    TOKEN_AMOUNT_OFFSET = 64
+    
+    def __init__(self, ws_url, rpc_call, retry_unresolved_seconds=300):
+        self.ws_url = ws_url
+        self.rpc_call = rpc_call
+        self.retry_unresolved_seconds = retry_unresolved_seconds
+        self.ws = None
+        self.thread = None
+        self.lock = threading.RLock()
+        self.pools = {}           # token -> pool info incl. live reserves
+        self.vault_tokens = {}    # vault address -> token
+        self.subscriptions = {}   # subscription id -> vault address
+        self.pending = {}         # request id -> vault address
+        self.unresolved = {}      # token -> time we last failed to find a pool
+        self.prices = {}          # token -> (price, slot, updated_at)
+        self.listeners = []
+        self.next_request_id = 1
+        self.stats = {'updates': 0, 'prices': 0, 'reconnects': 0, 'subscribed': 0}
+    
+    def add_listener(self, listener):
+        """listener(token, price, slot) runs on the websocket thread - keep it short"""
+        self.listeners.append(listener)
+    
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='pool-reserve-stream', daemon=True)
+            self.thread.start()
+    
+    def _run(self):
+        """Keep the websocket connected, reconnecting with a short delay"""
+        while True:
+            try:
+                self.ws = websocket.WebSocketApp(
+                    self.ws_url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=lambda ws, error: logging.warning(f"Pool stream error: {error}"),
+                    on_close=lambda ws, code, msg: logging.info(f"Pool stream closed: {code}")
+                )
+                self.ws.run_forever(ping_interval=30, ping_timeout=10)
+            except Exception as e:
+                logging.error(f"Pool stream crashed: {e}")
+            
+            self.stats['reconnects'] += 1
+            time.sleep(2)
+    
+    def _send(self, method, params, vault=None):
+        with self.lock:
+            request_id = self.next_request_id
+            self.next_request_id += 1
+            if vault:
+                self.pending[request_id] = vault
+        try:
+            self.ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        except Exception as e:
+            logging.debug(f"Pool stream send failed ({method}): {e}")
+    
+    def _subscribe_vault(self, vault):
+        if self.ws and self.ws.sock and self.ws.sock.connected:
+            self._send("accountSubscribe", [vault, {"encoding": "base64", "commitment": "processed"}], vault=vault)
+    
+    def _on_open(self, ws):
+        """(Re)subscribe every watched vault on a fresh connection"""
+        with self.lock:
+            self.subscriptions.clear()
+            self.pending.clear()
+            vaults = list(self.vault_tokens.keys())
+        logging.info(f"🔌 Pool stream connected - subscribing {len(vaults)} vaults")
+        for vault in vaults:
+            self._subscribe_vault(vault)
+    
+    def _on_message(self, ws, message):
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        
+        # Subscription confirmation
+        if 'id' in data and 'result' in data:
+            with self.lock:
+                vault = self.pending.pop(data['id'], None)
+                if vault and vault in self.vault_tokens:
+                    self.subscriptions[data['result']] = vault
+                    self.stats['subscribed'] = len(self.subscriptions)
+            return
+        
+        if data.get('method') != 'accountNotification':
+            return
+        
+        params = data.get('params', {})
+        with self.lock:
+            vault = self.subscriptions.get(params.get('subscription'))
+        if not vault:
+            return
+        
+        result = params.get('result', {})
+        value = result.get('value') or {}
+        amount = self._decode_token_amount(value.get('data'))
+        if amount is not None:
+            self.stats['updates'] += 1
+            self._update_reserve(vault, amount, result.get('context', {}).get('slot'))
+    
+    def _decode_token_amount(self, account_data):
+        """Amount from a base64 SPL token account payload"""
+        if not account_data or not isinstance(account_data, list):
+            return None
+        raw = base64.b64decode(account_data[0])
+        if len(raw) < self.TOKEN_AMOUNT_OFFSET + 8:
+            return None
+        return int.from_bytes(raw[self.TOKEN_AMOUNT_OFFSET:self.TOKEN_AMOUNT_OFFSET + 8], 'little')
+    
+    def _update_reserve(self, vault, amount, slot=None):
+        """Store a vault balance and recompute the pool price locally"""
+        with self.lock:
+            token = self.vault_tokens.get(vault)
+            pool = self.pools.get(token)
+            if not pool:
+                return
+            pool['reserves'][vault] = amount
+            token_reserve = pool['reserves'].get(pool['token_vault'])
+            sol_reserve = pool['reserves'].get(pool['sol_vault'])
+        
+        if not token_reserve or not sol_reserve:
+            return
+        
+        price = (sol_reserve / 1e9) / (token_reserve / (10 ** pool['token_decimals']))
+        self.prices[token] = (price, slot, time.time())
+        self.stats['prices'] += 1
+        store_token_price(token, price)
+        
+        for listener in self.listeners:
+            try:
+                listener(token, price, slot)
+            except Exception as e:
+                logging.error(f"Pool price listener error for {token[:8]}: {e}")
+    
+    def _find_amm_id(self, token_address):
+        """Deepest Raydium SOL pool from the pair index, else the token store, else DexScreener"""
+        entry = raydium_pair_index.pair_prices.get((token_address, SOL_TOKEN_ADDRESS))
+        if entry and entry[2]:
+            token_store.set(token_address, pool_address=entry[2])
+            return entry[2]
+        
+        pool_address = token_store.get(token_address, 'pool_address')
+        if pool_address:
+            return pool_address
+        
+        response = HTTP_SESSION.get(f"https://api.dexscreener.com/latest/dex/tokens/{token_address}", timeout=10)
+        if response.status_code == 200:
+            pairs = response.json().get('pairs') or []
+            if pairs:
+                pool_address = summarize_dexscreener_pairs(token_address, pairs)['pool_address']
+                token_store.set(token_address, pool_address=pool_address)
+                return pool_address
+        return None
+    
+    def resolve_pool(self, token_address):
+        """Decode the AMM state for the token's vaults/decimals and seed the reserves"""
+        amm_id = self._find_amm_id(token_address)
+        if not amm_id:
+            return None
+        
+        response = self.rpc_call("getAccountInfo", [amm_id, {"encoding": "base64"}])
+        value = (response or {}).get('result', {}).get('value')
+        if not value or value.get('owner') != RAYDIUM_AMM_PROGRAM:
+            return None
+        
+        raw = base64.b64decode(value['data'][0])
+        if len(raw) < self.AMM_STATE_SIZE:
+            return None
+        
+        def read_u64(offset):
+            return int.from_bytes(raw[offset:offset + 8], 'little')
+        
+        def read_pubkey(offset):
+            return b58encode(raw[offset:offset + 32]).decode()
+        
+        base_mint = read_pubkey(self.BASE_MINT_OFFSET)
+        quote_mint = read_pubkey(self.QUOTE_MINT_OFFSET)
+        base_vault = read_pubkey(self.BASE_VAULT_OFFSET)
+        quote_vault = read_pubkey(self.QUOTE_VAULT_OFFSET)
+        
+        if base_mint == token_address and quote_mint == SOL_TOKEN_ADDRESS:
+            token_vault, sol_vault, token_decimals = base_vault, quote_vault, read_u64(self.BASE_DECIMAL_OFFSET)
+        elif quote_mint == token_address and base_mint == SOL_TOKEN_ADDRESS:
+            token_vault, sol_vault, token_decimals = quote_vault, base_vault, read_u64(self.QUOTE_DECIMAL_OFFSET)
+        else:
+            return None
+        
+        pool = {
+            'amm_id': amm_id,
+            'token_vault': token_vault,
+            'sol_vault': sol_vault,
+            'token_decimals': token_decimals,
+            'reserves': {}
+        }
+        
+        # Seed both reserves so the price exists before the first change lands
+        seed = self.rpc_call("getMultipleAccounts", [[token_vault, sol_vault], {"encoding": "base64"}])
+        for vault, account in zip((token_vault, sol_vault), (seed or {}).get('result', {}).get('value') or []):
+            amount = self._decode_token_amount((account or {}).get('data'))
+            if amount is not None:
+                pool['reserves'][vault] = amount
+        
+        return pool
+    
+    def watch(self, token_address):
+        """Subscribe to a token's pool vaults"""
+        with self.lock:
+            if token_address in self.pools:
+                return True
+            failed_at = self.unresolved.get(token_address)
+            if failed_at and time.time() - failed_at < self.retry_unresolved_seconds:
+                return False
+        
+        try:
+            pool = self.resolve_pool(token_address)
+        except Exception as e:
+            logging.debug(f"Could not resolve pool for {token_address[:8]}: {e}")
+            pool = None
+        
+        if not pool:
+            self.unresolved[token_address] = time.time()
+            return False
+        
+        with self.lock:
+            self.pools[token_address] = pool
+            self.vault_tokens[pool['token_vault']] = token_address
+            self.vault_tokens[pool['sol_vault']] = token_address
+        
+        self.start()
+        self._subscribe_vault(pool['token_vault'])
+        self._subscribe_vault(pool['sol_vault'])
+        
+        # Publish the seeded price right away
+        if pool['reserves'].get(pool['sol_vault']) is not None:
+            self._update_reserve(pool['sol_vault'], pool['reserves'][pool['sol_vault']])
+        
+        logging.info(f"📡 Streaming pool reserves for {token_address[:8]} (pool {pool['amm_id'][:8]})")
+        return True
+    
+    def unwatch(self, token_address):
+        with self.lock:
+            pool = self.pools.pop(token_address, None)
+            self.prices.pop(token_address, None)
+            if not pool:
+                return
+            vaults = {pool['token_vault'], pool['sol_vault']}
+            for vault in vaults:
+                self.vault_tokens.pop(vault, None)
+            stale_subscriptions = [sub_id for sub_id, vault in self.subscriptions.items() if vault in vaults]
+            for sub_id in stale_subscriptions:
+                del self.subscriptions[sub_id]
+        
+        for sub_id in stale_subscriptions:
+            self._send("accountUnsubscribe", [sub_id])
+    
+    def sync(self, token_addresses):
+        """Watch exactly the given tokens (called with the current positions)"""
+        wanted = set(token_addresses)
+        with self.lock:
+            watched = set(self.pools.keys())
+        for token_address in watched - wanted:
+            self.unwatch(token_address)
+        for token_address in wanted - watched:
+            self.watch(token_address)
+    
+    def is_connected(self):
+        return bool(self.ws and self.ws.sock and self.ws.sock.connected)
+    
+    def get_price(self, token_address):
+        """Latest streamed price - valid for as long as the subscription is live"""
+        entry = self.prices.get(token_address)
+        if entry and token_address in self.pools and self.is_connected():
+            return entry[0]
+        return None
+
+# Create global pool reserve stream
+pool_reserve_stream = PoolReserveStream(HELIUS_WEBSOCKET_URL, fast_rpc_call)
+
+# Alpha wallets' holdings of the tokens we copied - derived token accounts read in one getMultipleAccounts, then pushed
+class AlphaHoldingStream:
+    TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+    TOKEN_2022_PROGRAM = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+    ASSOCIATED_TOKEN_PROGRAM = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+    TOKEN_AMOUNT_OFFSET = 64
+    MAX_ACCOUNTS_PER_CALL = 100
+    
+    def __init__(self, ws_url, rpc_url, resync_seconds=30):
+        self.ws_url = ws_url
+        self.rpc_url = rpc_url
+        self.resync_seconds = resync_seconds
+        self.ws = None
+        self.thread = None
+        self.lock = threading.RLock()
+        self.holdings = {}        # (wallet, mint) -> {'accounts', 'amounts', 'seeded', 'held'}
+        self.account_pairs = {}   # token account -> (wallet, mint)
+        self.subscriptions = {}   # subscription id -> token account
+        self.pending = {}         # request id -> token account
+        self.listeners = []
+        self.next_request_id = 1
+        self.last_refresh = 0
+        self.stats = {'refreshes': 0, 'notifications': 0, 'exits': 0, 'reconnects': 0}
+    
+    @classmethod
+    def derive_token_accounts(cls, wallet, mint):
+        """Associated token account addresses of wallet for mint (SPL Token and Token-2022)"""
+        owner = bytes(PublicKey.from_string(wallet))
+        mint_key = bytes(PublicKey.from_string(mint))
+        program = PublicKey.from_string(cls.ASSOCIATED_TOKEN_PROGRAM)
+        return [
+            str(PublicKey.find_program_address([owner, bytes(PublicKey.from_string(token_program)), mint_key], program)[0])
+            for token_program in (cls.TOKEN_PROGRAM, cls.TOKEN_2022_PROGRAM)
+        ]
+    
+    def add_listener(self, listener):
+        """listener(wallet, mint) runs on the websocket thread when a held balance drops to zero - keep it short"""
+        self.listeners.append(listener)
+    
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='alpha-holding-stream', daemon=True)
+            self.thread.start()
+    
+    def _run(self):
+        """Keep the websocket connected, reconnecting with a short delay"""
+        while True:
+            try:
+                self.ws = websocket.WebSocketApp(
+                    self.ws_url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=lambda ws, error: logging.warning(f"Alpha holding stream error: {error}"),
+                    on_close=lambda ws, code, msg: logging.info(f"Alpha holding stream closed: {code}")
+                )
+                self.ws.run_forever(ping_interval=30, ping_timeout=10)
+            except Exception as e:
+                logging.error(f"Alpha holding stream crashed: {e}")
+            
+            self.stats['reconnects'] += 1
+            time.sleep(2)
+    
+    def _send(self, method, params, account=None):
+        with self.lock:
+            request_id = self.next_request_id
+            self.next_request_id += 1
+            if account:
+                self.pending[request_id] = account
+        try:
+            self.ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        except Exception as e:
+            logging.debug(f"Alpha holding stream send failed ({method}): {e}")
+    
+    def _subscribe_account(self, account):
+        if self.ws and self.ws.sock and self.ws.sock.connected:
+            self._send("accountSubscribe", [account, {"encoding": "base64", "commitment": "confirmed"}], account=account)
+    
+    def _on_open(self, ws):
+        """(Re)subscribe every watched account; changes missed while down are caught by the next refresh"""
+        with self.lock:
+            self.subscriptions.clear()
+            self.pending.clear()
+            accounts = list(self.account_pairs.keys())
+            self.last_refresh = 0
+        logging.info(f"🔌 Alpha holding stream connected - subscribing {len(accounts)} token accounts")
+        for account in accounts:
+            self._subscribe_account(account)
+    
+    def _on_message(self, ws, message):
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        
+        # Subscription confirmation
+        if 'id' in data and 'result' in data:
+            with self.lock:
+                account = self.pending.pop(data['id'], None)
+                if account and account in self.account_pairs:
+                    self.subscriptions[data['result']] = account
+            return
+        
+        if data.get('method') != 'accountNotification':
+            return
+        
+        params = data.get('params', {})
+        with self.lock:
+            account = self.subscriptions.get(params.get('subscription'))
+        if not account:
+            return
+        
+        self.stats['notifications'] += 1
+        value = params.get('result', {}).get('value')
+        exited = self._set_amount(account, self._decode_amount(value, self.TOKEN_AMOUNT_OFFSET))
+        if exited:
+            self.stats['exits'] += 1
+            for listener in self.listeners:
+                try:
+                    listener(*exited)
+                except Exception as e:
+                    logging.error(f"Alpha exit listener error for {exited[1][:8]}: {e}")
+    
+    def _decode_amount(self, value, offset):
+        """Token amount from a base64 account payload; a missing or closed account holds nothing"""
+        if not value or not value.get('data'):
+            return 0
+        raw = base64.b64decode(value['data'][0])
+        if len(raw) < offset + 8:
+            return 0
+        return int.from_bytes(raw[offset:offset + 8], 'little')
+    
+    def _set_amount(self, account, amount):
+        """Store an account balance; returns (wallet, mint) when a pair we saw holding drops to zero"""
+        with self.lock:
+            pair = self.account_pairs.get(account)
+            holding = self.holdings.get(pair)
+            if not holding:
+                return None
+            before = sum(holding['amounts'].values())
+            holding['amounts'][account] = amount
+            after = sum(holding['amounts'].values())
+            holding['held'] = holding['held'] or after > 0
+            if holding['seeded'] and before > 0 and after == 0:
+                return pair
+        return None
+    
+    def watch(self, wallet, mint):
+        with self.lock:
+            if (wallet, mint) in self.holdings:
+                return
+        try:
+            accounts = self.derive_token_accounts(wallet, mint)
+        except Exception as e:
+            logging.debug(f"Could not derive token accounts for {wallet[:8]}/{mint[:8]}: {e}")
+            return
+        
+        with self.lock:
+            self.holdings[(wallet, mint)] = {'accounts': accounts, 'amounts': {account: 0 for account in accounts},
+                                             'seeded': False, 'held': False}
+            for account in accounts:
+                self.account_pairs[account] = (wallet, mint)
+        for account in accounts:
+            self._subscribe_account(account)
+    
+    def unwatch(self, wallet, mint):
+        with self.lock:
+            holding = self.holdings.pop((wallet, mint), None)
+            if not holding:
+                return
+            for account in holding['accounts']:
+                self.account_pairs.pop(account, None)
+            stale_subscriptions = [sub_id for sub_id, account in self.subscriptions.items() if account in holding['accounts']]
+            for sub_id in stale_subscriptions:
+                del self.subscriptions[sub_id]
+        
+        for sub_id in stale_subscriptions:
+            self._send("accountUnsubscribe", [sub_id])
+    
+    def sync(self, pairs):
+        """Watch exactly the given (wallet, mint) pairs (called with the current copied positions)"""
+        wanted = set(pairs)
+        with self.lock:
+            watched = set(self.holdings.keys())
+        for wallet, mint in watched - wanted:
+            self.unwatch(wallet, mint)
+        for wallet, mint in wanted - watched:
+            self.watch(wallet, mint)
+    
+    def refresh(self, force=False):
+        """Read every watched account in one getMultipleAccounts round trip.
+        
+        Skipped while the subscriptions are live and the last read is recent, unless a pair is still unseeded.
+        """
+        with self.lock:
+            unseeded = any(not holding['seeded'] for holding in self.holdings.values())
+            accounts = list(self.account_pairs.keys())
+        if not accounts:
+            return
+        if not force and not unseeded and self.is_connected() and time.time() - self.last_refresh < self.resync_seconds:
+            return
+        
+        options = {"encoding": "base64", "commitment": "confirmed",
+                   "dataSlice": {"offset": self.TOKEN_AMOUNT_OFFSET, "length": 8}}
+        chunks = [accounts[i:i + self.MAX_ACCOUNTS_PER_CALL] for i in range(0, len(accounts), self.MAX_ACCOUNTS_PER_CALL)]
+        results = rpc_batch([("getMultipleAccounts", [chunk, options]) for chunk in chunks], self.rpc_url, RPC_SESSION)
+        
+        for chunk, result in zip(chunks, results):
+            if not result:
+                continue    # unknown, not zero - keep what we had
+            for account, value in zip(chunk, result.get('value') or []):
+                self._set_amount(account, self._decode_amount(value, 0))
+            with self.lock:
+                for account in chunk:
+                    holding = self.holdings.get(self.account_pairs.get(account))
+                    if holding:
+                        holding['seeded'] = True
+        
+        self.last_refresh = time.time()
+        self.stats['refreshes'] += 1
+    
+    def balance(self, wallet, mint):
+        """Raw amount the wallet holds across its token accounts for mint.
+        
+        None when unknown - not read yet, or never seen in these accounts (the wallet may hold it
+        in a non-associated account), so the caller should fall back to a full lookup.
+        """
+        with self.lock:
+            holding = self.holdings.get((wallet, mint))
+            if not holding or not holding['seeded'] or not holding['held']:
+                return None
+            return sum(holding['amounts'].values())
+    
+    def is_connected(self):
+        return bool(self.ws and self.ws.sock and self.ws.sock.connected)
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'pairs': len(self.holdings), 'subscribed': len(self.subscriptions)}
+
+# Create global alpha holding stream
+alpha_holding_stream = AlphaHoldingStream(HELIUS_WEBSOCKET_URL, HELIUS_RPC_URL)
+
+# Streaming launch discovery - pump.fun creates and Raydium pool inits arrive as program logs
+class LaunchStream:
+    # Anchor event discriminator of pump.fun's CreateEvent (name, symbol, uri, mint, ...)
+    CREATE_EVENT_DISCRIMINATOR = hashlib.sha256(b"event:CreateEvent").digest()[:8]
+    # Raydium AMM v4 initialize2 account positions
+    INIT_AMM_INDEX = 4
+    INIT_COIN_MINT_INDEX = 8
+    INIT_PC_MINT_INDEX = 9
+    QUOTE_MINTS = {SOL_TOKEN_ADDRESS, USDC_TOKEN_ADDRESS}
+    
+    def __init__(self, ws_url, rpc_call, max_launches=500):
+        self.ws_url = ws_url
+        self.rpc_call = rpc_call
+        self.ws = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.launches = deque(maxlen=max_launches)   # (mint, source, seen_at), newest last
+        self.seen = OrderedDict()                    # mints already queued, so repeats are dropped
+        self.max_launches = max_launches
+        self.subscriptions = {}                      # subscription id -> program
+        self.pending = {}                            # request id -> program
+        # Raydium logs don't carry the mints - their transactions are fetched off the websocket thread
+        self.resolver = ThreadPoolExecutor(max_workers=2, thread_name_prefix='launch-resolve')
+        self.stats = {'pump_fun': 0, 'raydium': 0, 'decode_errors': 0, 'reconnects': 0}
+    
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='launch-stream', daemon=True)
+            self.thread.start()
+    
+    def _run(self):
+        """Keep the websocket connected, reconnecting with a short delay"""
+        while True:
+            try:
+                self.ws = websocket.WebSocketApp(
+                    self.ws_url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=lambda ws, error: logging.warning(f"Launch stream error: {error}"),
+                    on_close=lambda ws, code, msg: logging.info(f"Launch stream closed: {code}")
+                )
+                self.ws.run_forever(ping_interval=30, ping_timeout=10)
+            except Exception as e:
+                logging.error(f"Launch stream crashed: {e}")
+            
+            self.stats['reconnects'] += 1
+            time.sleep(2)
+    
+    def _on_open(self, ws):
+        with self.lock:
+            self.subscriptions.clear()
+            self.pending.clear()
+        logging.info("🔌 Launch stream connected - subscribing pump.fun and Raydium AMM logs")
+        for request_id, program in enumerate((PUMP_FUN_PROGRAM, RAYDIUM_AMM_PROGRAM), start=1):
+            with self.lock:
+                self.pending[request_id] = program
+            ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "logsSubscribe",
+                "params": [{"mentions": [program]}, {"commitment": "confirmed"}]
+            }))
+    
+    def _on_message(self, ws, message):
         try:
-            # Find largest token accounts
-            largest_accounts_response = wallet._rpc_call("getTokenLargestAccounts", [token_address])
-            
-            if ('result' not in largest_accounts_response or 
-                'value' not in largest_accounts_response['result']):
-                logging.warning(f"Couldn't get largest accounts for {token_address}")
-                return None
-                
-            largest_accounts = largest_accounts_response['result']['value']
+            data = json.loads(message)
+        except ValueError:
+            return
+        
+        if 'id' in data and 'result' in data:
+            with self.lock:
+                program = self.pending.pop(data['id'], None)
+                if program:
+                    self.subscriptions[data['result']] = program
+            return
+        
+        if data.get('method') != 'logsNotification':
+            return
+        
+        params = data.get('params', {})
+        value = (params.get('result') or {}).get('value') or {}
+        if value.get('err') is not None:
+            return
+        with self.lock:
+            program = self.subscriptions.get(params.get('subscription'))
+        logs = value.get('logs') or []
+        
+        if program == PUMP_FUN_PROGRAM and any(line.startswith('Program log: Instruction: Create') for line in logs):
+            self._handle_pump_fun_create(logs)
+        elif program == RAYDIUM_AMM_PROGRAM and any('initialize2' in line for line in logs):
+            self.resolver.submit(self._resolve_raydium_init, value.get('signature'))
+    
+    def _handle_pump_fun_create(self, logs):
+        """Decode the CreateEvent emitted in the logs - no RPC needed"""
+        for line in logs:
+            if not line.startswith('Program data: '):
+                continue
+            try:
+                raw = base64.b64decode(line[len('Program data: '):])
+            except ValueError:
+                continue
+            if raw[:8] != self.CREATE_EVENT_DISCRIMINATOR:
+                continue
             
-            # Look for liquidity pools among these largest accounts
-            for account in largest_accounts[:3]:  # Check top 3 accounts
-                account_address = account['address']
-                
-                # Get account info to check if it's a pool
-                account_info = wallet._rpc_call("getAccountInfo", [
-                    account_address, 
-                    {"encoding": "jsonParsed"}
-                ])
-                
-                if ('result' not in account_info or 
-                    'value' not in account_info['result']):
-                    continue
-                
-                # For Raydium pools, we'd analyze the account data
-                # This is a simplified approach - full implementation would be more complex
-                
-                # Instead, we'll try to determine if this is likely a pool account 
-                # by checking owner program
-                owner = account_info['result']['value'].get('owner')
-                
-                # Raydium pool programs
-                raydium_programs = [
-                    "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM program
-                    "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"   # Raydium pool program
-                ]
-                
-                if owner in raydium_programs:
-                    # This is likely a Raydium pool
-                    logging.info(f"Found potential Raydium pool for {token_address}")
-                    
-                    # For a real implementation, we would decode the account data
-                    # and extract the token reserves to calculate price
-                    
-                    # Since that's quite complex, let's use a simplification:
-                    # Check if we can get the price from Raydium API instead
-                    price = get_raydium_price(token_address)
-                    if price:
-                        return price
-                    
-                    # In an actual implementation, we would:
-                    # 1. Decode the pool data structure
-                    # 2. Extract token A and B reserves
-                    # 3. Calculate price based on the ratio
+            try:
+                offset = 8
+                strings = []
+                for _ in range(3):   # name, symbol, uri
+                    length = int.from_bytes(raw[offset:offset + 4], 'little')
+                    strings.append(raw[offset + 4:offset + 4 + length].decode('utf-8', 'replace'))
+                    offset += 4 + length
+                mint = b58encode(raw[offset:offset + 32]).decode()
+            except Exception as e:
+                self.stats['decode_errors'] += 1
+                logging.debug(f"Could not decode pump.fun create event: {e}")
+                return
             
-            logging.warning(f"Couldn't find liquidity pools for {token_address} through account analysis")
-            return None
+            # The create transaction is the mint's first, so its creation time is now
+            mint_creation_times.record(mint, time.time())
+            token_store.set(mint, symbol=strings[1] or None)
+            self._push(mint, 'pump_fun')
+            return
+    
+    def _resolve_raydium_init(self, signature):
+        """Read the new pool's mints and AMM id from its initialize2 instruction"""
+        if not signature:
+            return
+        response = self.rpc_call("getTransaction", [signature, {
+            "encoding": "jsonParsed",
+            "commitment": "confirmed",
+            "maxSupportedTransactionVersion": 0
+        }])
+        transaction = (response or {}).get('result')
+        if not transaction:
+            return
+        
+        instructions = transaction.get('transaction', {}).get('message', {}).get('instructions') or []
+        for instruction in instructions:
+            accounts = instruction.get('accounts') or []
+            if instruction.get('programId') != RAYDIUM_AMM_PROGRAM or len(accounts) <= self.INIT_PC_MINT_INDEX:
+                continue
             
-        except Exception as e:
-            logging.error(f"Error analyzing liquidity pools: {str(e)}")
-            return None
+            coin_mint = accounts[self.INIT_COIN_MINT_INDEX]
+            pc_mint = accounts[self.INIT_PC_MINT_INDEX]
+            mint = pc_mint if coin_mint in self.QUOTE_MINTS else coin_mint
+            if mint in self.QUOTE_MINTS:
+                return
             
-    except Exception as e:
-        logging.error(f"Error in calculate_price_from_liquidity: {str(e)}")
-        return None
+            if SOL_TOKEN_ADDRESS in (coin_mint, pc_mint):
+                token_store.set(mint, pool_address=accounts[self.INIT_AMM_INDEX])
+            self._push(mint, 'raydium')
+            return
+    
+    def _push(self, mint, source):
+        with self.lock:
+            if mint in self.seen:
+                return
+            self.seen[mint] = True
+            while len(self.seen) > self.max_launches * 4:
+                self.seen.popitem(last=False)
+            self.launches.append((mint, source, time.time()))
+            self.stats[source] += 1
+        logging.info(f"🛰️ Launch streamed ({source}): {mint[:8]}")
+    
+    def recent(self, max_age_seconds=300, limit=None, source=None):
+        """Mints launched within max_age_seconds, newest first (scanners read without consuming)"""
+        mints = [mint for mint, _, _ in self.recent_launches(max_age_seconds, source)]
+        return mints[:limit] if limit else mints
+    
+    def recent_launches(self, max_age_seconds=300, source=None):
+        """(mint, source, seen_at) launched within max_age_seconds, newest first; source 'pump_fun' or 'raydium'"""
+        cutoff = time.time() - max_age_seconds
+        with self.lock:
+            return [
+                launch for launch in reversed(self.launches)
+                if launch[2] >= cutoff and (source is None or launch[1] == source)
+            ]
+    
+    def is_connected(self):
+        return bool(self.ws and self.ws.sock and self.ws.sock.connected and self.subscriptions)
+    
+    def get_stats(self):
+        with self.lock:
+            return {**self.stats, 'queued': len(self.launches)}
 
+launch_stream = LaunchStream(HELIUS_WEBSOCKET_URL, fast_rpc_call)
 
 def get_jupiter_price_alternative(token_address: str) -> Optional[float]:
     """Alternative method to get token price from Jupiter API."""
@@ -14391,29 +17779,16 @@ def get_jupiter_price_alternative(token_address: str) -> Optional[float]:
             "Accept": "application/json"
         }
         
-        # Rate limiting
-        global last_api_call_time, api_call_delay
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            sleep_time = api_call_delay - time_since_last_call
-            if ULTRA_DIAGNOSTICS:
-                logging.info(f"Rate limiting: Sleeping for {sleep_time:.2f}s before Jupiter API call")
-            time.sleep(sleep_time)
-        
         # Make the API request with retries
-        last_api_call_time = time.time()
-        response = requests.get(quote_url, params=params, headers=headers, timeout=10)
+        response = HTTP_SESSION.get(quote_url, params=params, headers=headers, timeout=10)
         
         # Handle rate limiting
         if response.status_code == 429:
-            logging.warning(f"Rate limited on alternative Jupiter endpoint (429). Waiting and retrying...")
-            time.sleep(3)
-            last_api_call_time = time.time()
-            response = requests.get(quote_url, params=params, headers=headers, timeout=10)
+            logging.warning(f"Rate limited on alternative Jupiter endpoint (429). Retrying once the limiter allows...")
+            response = HTTP_SESSION.get(quote_url, params=params, headers=headers, timeout=10)
             
             if response.status_code == 429:
-                api_call_delay += 1.0
-                logging.warning(f"Still rate limited. Increased delay to {api_call_delay}s")
+                logging.warning("Still rate limited - Jupiter limiter is backing off")
                 return None
         
         if response.status_code == 200:
@@ -14426,8 +17801,7 @@ def get_jupiter_price_alternative(token_address: str) -> Optional[float]:
                     price = float(price_data["price"])
                     
                     # Update cache
-                    price_cache[token_address] = price
-                    price_cache_time[token_address] = time.time()
+                    store_token_price(token_address, price)
                     
                     logging.info(f"Got Jupiter alternative price for {token_address}: {price} SOL")
                     return price
@@ -14445,30 +17819,21 @@ def get_jupiter_price_alternative(token_address: str) -> Optional[float]:
             "slippageBps": "1000"  # 10% slippage
         }
         
-        # Rate limiting
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            sleep_time = api_call_delay - time_since_last_call
-            if ULTRA_DIAGNOSTICS:
-                logging.info(f"Rate limiting: Sleeping for {sleep_time:.2f}s before Jupiter API call")
-            time.sleep(sleep_time)
-        
         # Make alternate API call
-        last_api_call_time = time.time()
-        response = requests.get(alternate_quote_url, params=alternate_params, headers=headers, timeout=10)
+        response = HTTP_SESSION.get(alternate_quote_url, params=alternate_params, headers=headers, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
             if "outAmount" in data:
                 out_amount = int(data["outAmount"])
-                token_price = 0.05 / (out_amount / 1000000000)  # Adjusted for 0.05 SOL
-                
-                # Update cache
-                price_cache[token_address] = token_price
-                price_cache_time[token_address] = time.time()
+                token_price = sol_per_token_from_quote(token_address, 50000000, out_amount)  # 0.05 SOL in
                 
-                logging.info(f"Got Jupiter alternate quote price for {token_address}: {token_price} SOL")
-                return token_price
+                if token_price:
+                    # Update cache
+                    store_token_price(token_address, token_price)
+                    
+                    logging.info(f"Got Jupiter alternate quote price for {token_address}: {token_price} SOL")
+                    return token_price
                 
         return None
     except Exception as e:
@@ -14564,8 +17929,7 @@ def initialize():
             logging.info(f"Getting initial price for {token['symbol']} ({token['address']})...")
             token_price = get_token_price(token['address'])
             if token_price:
-                price_cache[token['address']] = token_price
-                price_cache_time[token['address']] = time.time()
+                price_cache.set(token['address'], token_price)
                 logging.info(f"Cached price for {token['symbol']}: {token_price} SOL")
             else:
                 logging.warning(f"Could not get initial price for {token['symbol']}")
@@ -14648,25 +18012,65 @@ def check_token_socials(token_address):
         # On error, allow the token to be traded
         return True
 
-def get_token_supply(token_address):
-    """Get the total supply of a token."""
+def store_mint_account(token_address, account):
+    """Write decimals, supply and authorities from a jsonParsed mint account into token_store"""
+    try:
+        info = account['value']['data']['parsed']['info']
+    except (KeyError, TypeError):
+        return None
+    
+    # Renounced authorities are stored as '' so they read back as "known, none"
+    attributes = {
+        'decimals': info.get('decimals'),
+        'supply': info.get('supply'),
+        'mint_authority': info.get('mintAuthority') or '',
+        'freeze_authority': info.get('freezeAuthority') or ''
+    }
+    token_store.set(token_address, **attributes)
+    return attributes
+
+def get_mint_info(token_address):
+    """Decimals, supply and mint/freeze authorities (renounced = ''), from token_store or one getAccountInfo"""
+    fields = ('decimals', 'supply', 'mint_authority', 'freeze_authority')
+    attributes = {field: token_store.get(token_address, field) for field in fields}
+    if all(value is not None for value in attributes.values()):
+        return attributes
+    
     try:
         if not wallet:
             return None
-        
-        # Make RPC call to get token supply information
-        response = wallet._rpc_call("getTokenSupply", [token_address])
-        
-        if 'result' not in response or 'value' not in response['result']:
+        response = wallet._rpc_call("getAccountInfo", [token_address, {"encoding": "jsonParsed"}])
+        return store_mint_account(token_address, response.get('result'))
+    except Exception as e:
+        logging.debug(f"Error getting mint info for {token_address[:8]}: {e}")
+        return None
+
+def get_token_decimals(token_address):
+    """Mint decimals from token_store or one getAccountInfo, None when unknown"""
+    if token_address == SOL_TOKEN_ADDRESS:
+        return 9
+    decimals = token_store.get(token_address, 'decimals')
+    if decimals is None:
+        mint_info = get_mint_info(token_address)
+        decimals = mint_info['decimals'] if mint_info else None
+    return int(decimals) if decimals is not None else None
+
+def get_token_supply(token_address):
+    """Get the total supply of a token."""
+    try:
+        mint_info = get_mint_info(token_address)
+        if not mint_info or mint_info['supply'] is None:
             logging.warning(f"Could not get token supply for {token_address}")
             return None
-            
-        supply_info = response['result']['value']
+        
+        amount = str(mint_info['supply'])
+        decimals = int(mint_info['decimals'])
+        ui_amount = int(amount) / (10 ** decimals)
         return {
-            'amount': supply_info.get('amount'),
-            'decimals': supply_info.get('decimals'),
-            'uiAmount': supply_info.get('uiAmount'),
-            'uiAmountString': supply_info.get('uiAmountString')
+            'amount': amount,
+            'decimals': decimals,
+            'uiAmount': ui_amount,
+            'uiAmountString': str(ui_amount)
         }
     except Exception as e:
         logging.error(f"Error getting token supply: {str(e)}")
@@ -14803,7 +18207,7 @@ def ensure_token_account_exists(token_address: str, max_attempts: int = 3) -> bo
                 "slippageBps": "3000"  # 30% slippage for higher chance of success
             }
             
-            quote_response = requests.get(quote_url, params=params, timeout=15)
+            quote_response = HTTP_SESSION.get(quote_url, params=params, timeout=15)
             
             if quote_response.status_code != 200:
                 logging.error(f"Quote failed: {quote_response.status_code}")
@@ -14823,7 +18227,7 @@ def ensure_token_account_exists(token_address: str, max_attempts: int = 3) -> bo
                 "prioritizationFeeLamports": 100000  # 0.0001 SOL priority fee
             }
             
-            swap_response = requests.post(
+            swap_response = HTTP_SESSION.post(
                 swap_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -14987,15 +18391,8 @@ def check_token_liquidity(token_address):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         
-        # Rate limiting
-        global last_api_call_time, api_call_delay
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            time.sleep(api_call_delay - time_since_last_call)
-        
         # Make API call
-        last_api_call_time = time.time()
-        response = requests.get(quote_url, params=params, headers=headers, timeout=5)
+        response = HTTP_SESSION.get(quote_url, params=params, headers=headers, timeout=5)
         
         # Process response
         if response.status_code == 200:
@@ -15011,14 +18408,8 @@ def check_token_liquidity(token_address):
             "slippageBps": "3000"
         }
         
-        # Rate limiting
-        time_since_last_call = time.time() - last_api_call_time
-        if time_since_last_call < api_call_delay:
-            time.sleep(api_call_delay - time_since_last_call)
-        
         # Make reverse API call
-        last_api_call_time = time.time()
-        response = requests.get(quote_url, params=reverse_params, headers=headers, timeout=5)
+        response = HTTP_SESSION.get(quote_url, params=reverse_params, headers=headers, timeout=5)
         
         if response.status_code == 200:
             data = response.json()
@@ -15045,7 +18436,7 @@ def get_recent_transactions(limit: int = 100) -> List[Dict]:
             ]
         }
         
-        response = requests.post(
+        response = HTTP_SESSION.post(
             CONFIG['SOLANA_RPC_URL'],
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -15107,60 +18498,27 @@ def analyze_transaction(signature: str) -> List[str]:
         if ULTRA_DIAGNOSTICS:
             logging.info(f"Analyzing transaction: {signature}")
             
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "getTransaction",
-            "params": [
-                signature,
-                {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}
-            ]
-        }
-        
-        response = requests.post(
-            CONFIG['SOLANA_RPC_URL'],
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
-        
-        if response.status_code != 200:
-            if ULTRA_DIAGNOSTICS:
-                logging.warning(f"Failed to get transaction {signature}: {response.status_code}")
-            return []
-            
-        data = response.json()
-        if "result" not in data or data["result"] is None:
+        summary = get_transactions_batch([signature], CONFIG['SOLANA_RPC_URL'], HTTP_SESSION, timeout=10)[0]
+        if summary is None:
             if ULTRA_DIAGNOSTICS:
                 logging.warning(f"No result in transaction data for {signature}")
             return []
-            
-        result = data["result"]
         
         # Look for token creation or mint instructions
         found_tokens = []
         
-        if "meta" in result and "innerInstructions" in result["meta"]:
-            for inner_instruction in result["meta"]["innerInstructions"]:
-                for instruction in inner_instruction.get("instructions", []):
-                    # Check for MintTo or InitializeMint instructions
-                    if "parsed" in instruction and "type" in instruction["parsed"]:
-                        if instruction["parsed"]["type"] in ["mintTo", "initializeMint"]:
-                            if "info" in instruction["parsed"] and "mint" in instruction["parsed"]["info"]:
-                                token_address = instruction["parsed"]["info"]["mint"]
-                                found_tokens.append(token_address)
-                                if ULTRA_DIAGNOSTICS:
-                                    logging.info(f"Found token in mint instruction: {token_address}")
+        # Check for MintTo or InitializeMint instructions
+        for token_address in summary.minted:
+            found_tokens.append(token_address)
+            if ULTRA_DIAGNOSTICS:
+                logging.info(f"Found token in mint instruction: {token_address}")
         
         # Also look for token accounts in account keys
-        if "transaction" in result and "message" in result["transaction"]:
-            for account in result["transaction"]["message"].get("accountKeys", []):
-                if "pubkey" in account and len(account["pubkey"]) == 44:  # Typical Solana address length
-                    token_address = account["pubkey"]
-                    if token_address not in found_tokens:
-                        found_tokens.append(token_address)
-                        if ULTRA_DIAGNOSTICS:
-                            logging.info(f"Found potential token in account keys: {token_address}")
+        for token_address in summary.account_keys:
+            if token_address and len(token_address) == 44 and token_address not in found_tokens:  # Typical Solana address length
+                found_tokens.append(token_address)
+                if ULTRA_DIAGNOSTICS:
+                    logging.info(f"Found potential token in account keys: {token_address}")
         
         if found_tokens and ULTRA_DIAGNOSTICS:
             logging.info(f"Found {len(found_tokens)} potential tokens in transaction {signature}")
@@ -15191,7 +18549,7 @@ def get_pump_fun_tokens_from_quicknode():
             }
             
             logging.info(f"Fetching newest tokens from pump.fun (attempt {attempt+1}/{max_retries})")
-            response = requests.get(url, headers=headers, timeout=15)
+            response = HTTP_SESSION.get(url, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -15258,7 +18616,7 @@ def get_pump_fun_trending_tokens(limit=20):
             "Accept": "application/json",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        response = requests.get(url, headers=headers, params={"limit": limit})
+        response = HTTP_SESSION.get(url, headers=headers, params={"limit": limit})
         
         if response.status_code != 200:
             logging.error(f"Error fetching trending tokens: {response.status_code}")
@@ -15450,6 +18808,11 @@ def get_fallback_newest_tokens():
 def scan_recent_solana_transactions():
     """Alternative method to find new tokens by scanning recent Solana transactions."""
     try:
+        launch_stream.start()
+        if launch_stream.is_connected():
+            # Raydium pool inits arrive over the websocket - no need to poll the program's signatures
+            return launch_stream.recent(max_age_seconds=300, source='raydium')
+        
         logging.info("Scanning recent Solana transactions for new tokens")
         
         # Get recent signatures from a known active wallet or DEX
@@ -15472,12 +18835,13 @@ def scan_recent_solana_transactions():
             data = response.json()
             if "result" in data and data["result"]:
                 signatures = [tx["signature"] for tx in data["result"][:5]]  # Limit to 5
+                transactions = get_transactions_batch(signatures, CONFIG['SOLANA_RPC_URL'], RPC_SESSION, timeout=8)
                 
                 # Analyze these transactions for new token addresses
                 potential_tokens = []
-                for signature in signatures:
+                for signature, transaction in zip(signatures, transactions):
                     try:
-                        token_addresses = analyze_transaction_for_tokens(signature)
+                        token_addresses = extract_transaction_tokens(transaction) if transaction else []
                         potential_tokens.extend(token_addresses[:2])  # Limit tokens per tx
                         
                         if len(potential_tokens) >= 3:  # Limit total tokens
@@ -15500,58 +18864,42 @@ def scan_recent_solana_transactions():
 def analyze_transaction_for_tokens(signature):
     """Analyze a transaction to extract potential new token addresses."""
     try:
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "getTransaction",
-            "params": [
-                signature,
-                {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}
-            ]
-        }
-        
-        response = requests.post(
-            CONFIG['SOLANA_RPC_URL'],
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=8
-        )
-        
-        if response.status_code != 200:
-            return []
-            
-        data = response.json()
-        if "result" not in data or not data["result"]:
-            return []
-        
-        # Extract token addresses from transaction
-        token_addresses = []
-        transaction = data["result"]
-        
-        if "transaction" in transaction and "message" in transaction["transaction"]:
-            message = transaction["transaction"]["message"]
-            
-            # Look for token program interactions
-            if "instructions" in message:
-                for instruction in message["instructions"]:
-                    if "parsed" in instruction and "info" in instruction["parsed"]:
-                        info = instruction["parsed"]["info"]
-                        
-                        # Look for mint addresses in various instruction types
-                        if "mint" in info:
-                            mint_address = info["mint"]
-                            if mint_address not in token_addresses and len(mint_address) > 40:
-                                token_addresses.append(mint_address)
-        
-        return token_addresses[:2]  # Return max 2 tokens per transaction
+        summary = get_transactions_batch([signature], CONFIG['SOLANA_RPC_URL'], HTTP_SESSION, timeout=8)[0]
+        return extract_transaction_tokens(summary) if summary else []
         
     except Exception as e:
         logging.error(f"Error analyzing transaction {signature}: {str(e)}")
         return []
 
+def extract_transaction_tokens(transaction):
+    """Mint addresses referenced by a parsed transaction's instructions (max 2)"""
+    try:
+        summary = transaction_summary(transaction)
+        return summary.instruction_mints[:2] if summary else []  # Return max 2 tokens per transaction
+        
+    except Exception as e:
+        logging.error(f"Error extracting tokens from transaction: {str(e)}")
+        return []
+
 def get_newest_pump_fun_tokens(limit=20):
     """Get newest tokens from pump.fun API with improved error handling."""
     try:
+        launch_stream.start()
+        if launch_stream.is_connected():
+            # pump.fun creates arrive over the websocket - no need to poll the API
+            now = time.time()
+            return [
+                {
+                    "address": mint,
+                    "symbol": "Unknown",
+                    "name": "Unknown",
+                    "price": 0,
+                    "minutes_old": (now - seen_at) / 60,
+                    "createdAt": seen_at
+                }
+                for mint, source, seen_at in launch_stream.recent_launches(max_age_seconds=300, source='pump_fun')
+            ][:limit]
+        
         # Updated URL based on network inspection of pump.fun website
         url = "https://backend.pump.fun/tokens/newest"
         headers = {
@@ -15565,7 +18913,7 @@ def get_newest_pump_fun_tokens(limit=20):
         
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, headers=headers, params={"limit": limit}, timeout=10)
+                response = HTTP_SESSION.get(url, headers=headers, params={"limit": limit}, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -15716,7 +19064,7 @@ def check_token_tradability(token_address: str) -> bool:
         }
         
         logging.info(f"Checking tradability for {token_address}")
-        response = requests.get(quote_url, params=params, timeout=10)
+        response = HTTP_SESSION.get(quote_url, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -15809,16 +19157,10 @@ def verify_token(token_address):
 def get_jupiter_quote_and_swap(input_mint, output_mint, amount, is_buy=True, dexes=None, slippage_bps=100):
     """Get Jupiter quote with rate limiting and better error handling"""
     try:
-        # RATE LIMIT CHECK - CRITICAL!
-        jupiter_limiter.wait_if_needed()
+        # Rate limiting is handled by the shared Jupiter limiter on HTTP_SESSION
         
         # Build quote parameters
-        quote_url = "https://quote-api.jup.ag/v6/quote"
-        params = {
-            "inputMint": input_mint,
-            "outputMint": output_mint,
-            "amount": str(amount),
-            "slippageBps": str(slippage_bps),
+        extra_params = {
             "onlyDirectRoutes": "false",
             "asLegacyTransaction": "false",
             "maxAccounts": "64"
@@ -15826,22 +19168,14 @@ def get_jupiter_quote_and_swap(input_mint, output_mint, amount, is_buy=True, dex
         
         # Add DEX filter if specified
         if dexes:
-            params["dexes"] = ",".join(dexes)
-        
-        # Get quote with retries
-        quote_response = requests.get(quote_url, params=params, timeout=10)
+            extra_params["dexes"] = ",".join(dexes)
         
-        if quote_response.status_code == 400:
-            error_data = quote_response.json()
-            if "TOKEN_NOT_TRADABLE" in str(error_data):
-                logging.warning(f"Token {output_mint[:8]} not tradable on Jupiter - might be too new")
-                return None, None
-                
-        if quote_response.status_code != 200:
-            logging.error(f"Quote failed: {quote_response.status_code}")
+        # Reuse a quote only if it is a few hundred ms old and for exactly this amount - it gets swapped
+        quote_data = get_jupiter_quote(input_mint, output_mint, amount, slippage_bps, extra_params=extra_params,
+                                       exact_amount=True)
+        if not quote_data:
+            logging.error(f"Quote failed for {output_mint[:8]}")
             return None, None
-            
-        quote_data = quote_response.json()
         
         # Check if we got a valid quote
         if not quote_data.get('routePlan'):
@@ -15870,7 +19204,7 @@ def get_jupiter_quote_and_swap(input_mint, output_mint, amount, is_buy=True, dex
             "Accept": "application/json"
         }
         
-        swap_response = requests.post(swap_url, json=swap_payload, headers=headers, timeout=15)
+        swap_response = HTTP_SESSION.post(swap_url, json=swap_payload, headers=headers, timeout=15)
         
         if swap_response.status_code != 200:
             logging.error(f"Swap preparation failed: {swap_response.status_code}")
@@ -15906,7 +19240,7 @@ def execute_raydium_swap(token_address, amount_sol, is_buy=True):
             
             # Get pool info first
             pool_info_url = f"https://api.raydium.io/v2/main/pool?mint={token_address}"
-            pool_response = requests.get(pool_info_url, timeout=5)
+            pool_response = HTTP_SESSION.get(pool_info_url, timeout=5)
             
             if pool_response.status_code != 200:
                 logging.error("No Raydium pool found")
@@ -15928,7 +19262,7 @@ def execute_raydium_swap(token_address, amount_sol, is_buy=True):
             }
             
             # Get swap transaction
-            swap_response = requests.post(
+            swap_response = HTTP_SESSION.post(
                 "https://api.raydium.io/v2/swap/transaction",
                 json=swap_params,
                 headers={"Content-Type": "application/json"},
@@ -16040,10 +19374,214 @@ def execute_sell_with_retries(token_address, amount, max_retries=3):
     logging.error(f"🚨 ALL SELL ATTEMPTS FAILED for {token_address}")
     return False
 
-def execute_via_javascript(token_address, amount, is_sell=False, max_retries=3):
-   """Execute trade via JavaScript with proper amount handling and sell fixes"""
+# Long-lived `node swap.js --worker` process - JSON lines over stdin/stdout, matched by request id
+class SwapWorker:
+    def __init__(self, cwd, name, startup_timeout=20):
+        self.cwd = cwd
+        self.name = name
+        self.startup_timeout = startup_timeout
+        self.proc = None
+        self.ready = threading.Event()
+        self.lock = threading.Lock()         # guards proc, pending and stdin writes
+        self.pending = {}                    # request id -> [Event, response]
+        self.ids = itertools.count(1)
+        self.busy = False                    # claimed by a trade or health check (SwapWorkerPool)
+        self.stderr_tail = deque(maxlen=20)
+        self.started_at = 0
+    
+    def available(self):
+        return self.proc is not None and self.proc.poll() is None and self.ready.is_set()
+    
+    def start(self):
+        """(Re)spawn the node process and wait for its ready line"""
+        self.stop()
+        proc = subprocess.Popen(
+            ['node', 'swap.js', '--worker'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            cwd=self.cwd
+        )
+        with self.lock:
+            self.proc = proc
+            self.ready.clear()
+            self.started_at = time.time()
+        threading.Thread(target=self._read_responses, args=(proc,), name=f'{self.name}-out', daemon=True).start()
+        threading.Thread(target=self._read_logs, args=(proc,), name=f'{self.name}-err', daemon=True).start()
+        return self.ready.wait(self.startup_timeout)
+    
+    def stop(self, proc=None):
+        """Kill the process (only if it is still `proc`, when given) and fail whatever is waiting on it"""
+        with self.lock:
+            if proc is not None and proc is not self.proc:
+                return
+            proc, self.proc = self.proc, None
+            self.ready.clear()
+            waiters = list(self.pending.values())
+            self.pending.clear()
+        for event, _ in waiters:
+            event.set()
+        if proc and proc.poll() is None:
+            proc.kill()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+    
+    def _read_responses(self, proc):
+        for line in proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if message.get('type') == 'ready':
+                if proc is self.proc:
+                    self.ready.set()
+                continue
+            with self.lock:
+                waiter = self.pending.pop(message.get('id'), None)
+            if waiter:
+                waiter[1] = message
+                waiter[0].set()
+        
+        # stdout closed - the process is gone and nothing pending will be answered
+        if proc is self.proc:
+            logging.warning(f"⚠️ {self.name} exited: {' | '.join(self.stderr_tail)[-300:]}")
+            self.stop(proc)
+    
+    def _read_logs(self, proc):
+        for line in proc.stderr:
+            line = line.rstrip()
+            if line:
+                self.stderr_tail.append(line)
+    
+    def request(self, payload, timeout):
+        """Send one request and wait for its response - None if the worker died or timed out"""
+        request_id = next(self.ids)
+        waiter = [threading.Event(), None]
+        with self.lock:
+            proc = self.proc
+            if proc is None or proc.poll() is not None or not self.ready.is_set():
+                return None
+            self.pending[request_id] = waiter
+            try:
+                proc.stdin.write(json.dumps({**payload, 'id': request_id}) + '\n')
+                proc.stdin.flush()
+            except (OSError, ValueError):
+                self.pending.pop(request_id, None)
+                return None
+        
+        waiter[0].wait(timeout)
+        with self.lock:
+            self.pending.pop(request_id, None)
+        return waiter[1]
+    
+    def ping(self, timeout=5):
+        response = self.request({'type': 'ping'}, timeout)
+        return bool(response and response.get('ok'))
+
+# Warm swap.js workers for execute_via_javascript - a trade that finds none free spawns node as before
+class SwapWorkerPool:
+    def __init__(self, size=2, cwd='/opt/render/project/src', health_interval=15):
+        self.workers = [SwapWorker(cwd, f'swap-worker-{i}') for i in range(max(size, 1))]
+        self.health_interval = health_interval
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stats = {'requests': 0, 'fallbacks': 0, 'timeouts': 0, 'restarts': 0, 'failed_pings': 0}
+    
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._run, name='swap-workers', daemon=True)
+            self.thread.start()
+    
+    def _claim(self, worker, require_ready=True):
+        with self.lock:
+            if worker.busy or (require_ready and not worker.available()):
+                return False
+            worker.busy = True
+            return True
+    
+    def _release(self, worker):
+        with self.lock:
+            worker.busy = False
+    
+    def _run(self):
+        """Spawn the workers, then ping idle ones and restart any that died or stopped answering"""
+        while True:
+            for worker in self.workers:
+                if not self._claim(worker, require_ready=False):
+                    continue
+                try:
+                    if worker.available():
+                        if worker.ping():
+                            continue
+                        self.stats['failed_pings'] += 1
+                        logging.warning(f"⚠️ {worker.name} missed a health check - restarting")
+                    
+                    restarted = worker.started_at > 0
+                    if worker.start():
+                        if restarted:
+                            self.stats['restarts'] += 1
+                        logging.info(f"⚙️ {worker.name} ready (pid {worker.proc.pid})")
+                    else:
+                        logging.warning(f"⚠️ {worker.name} did not come up: {' | '.join(worker.stderr_tail)[-300:]}")
+                        worker.stop()
+                except Exception as e:
+                    logging.error(f"Swap worker health check error: {e}")
+                finally:
+                    self._release(worker)
+            
+            time.sleep(self.health_interval)
+    
+    def execute(self, token_address, amount, is_sell, small_token_sell=False, timeout=30):
+        """Run one swap on a free worker - None when no worker could take it.
+        Raises subprocess.TimeoutExpired like subprocess.run if the worker hangs or dies mid-trade."""
+        worker = next((w for w in self.workers if self._claim(w)), None)
+        if worker is None:
+            self.stats['fallbacks'] += 1
+            return None
+        
+        try:
+            self.stats['requests'] += 1
+            response = worker.request({
+                'type': 'swap',
+                'token': token_address,
+                'amount': amount,
+                'isSell': bool(is_sell),
+                'smallTokenSell': small_token_sell
+            }, timeout)
+            if response is None:
+                # Stuck or crashed mid-trade - kill it so the health check brings up a clean process
+                self.stats['timeouts'] += 1
+                worker.stop()
+                raise subprocess.TimeoutExpired(['node', 'swap.js', '--worker'], timeout)
+            return response
+        finally:
+            self._release(worker)
+    
+    def get_stats(self):
+        return {
+            **self.stats,
+            'workers': len(self.workers),
+            'ready': sum(1 for worker in self.workers if worker.available())
+        }
+
+swap_workers = SwapWorkerPool(CONFIG['SWAP_WORKERS'], health_interval=CONFIG['SWAP_WORKER_HEALTH_SECONDS'])
+
+def execute_via_javascript(token_address, amount, is_sell=False, max_retries=3, with_signature=False):
+   """Execute trade via JavaScript with proper amount handling and sell fixes.
+   Returns (success, output), or (success, output, signature) with with_signature=True."""
    global wallet
    
+   def finish(success, output, signature=None):
+       return (success, output, signature) if with_signature else (success, output)
+   
    for attempt in range(max_retries):
        try:
            import subprocess
@@ -16063,42 +19601,64 @@ def execute_via_javascript(token_address, amount, is_sell=False, max_retries=3):
            # Reduced timeout - fail faster
            timeout_duration = 30  # 30 seconds for both buy and sell
            
-           result = subprocess.run([
-               'node', 'swap.js',
-               token_address,
-               trade_amount,
-               'true' if is_sell else 'false'
-           ], 
-           capture_output=True,
-           text=True,
-           timeout=timeout_duration,  # Reduced from 120
-           cwd='/opt/render/project/src'
+           # swap.js calls Jupiter itself, so take a slot from the shared limiter first
+           HOST_RATE_LIMITERS['jupiter'].acquire(
+               HostRateLimiter.PRIORITY_EXIT if is_sell else HostRateLimiter.PRIORITY_TRADE
            )
-           logging.info(f"✅ Subprocess completed without timeout")
-           
-           stdout_output = result.stdout if result.stdout else ""
-           stderr_output = result.stderr if result.stderr else ""
-           combined_output = stdout_output + stderr_output
            
-           logging.info(f"📤 Output length: {len(combined_output)} characters")
+           # A warm swap.js worker skips node startup - without a free one, spawn swap.js as before
+           response = None
+           if CONFIG['SWAP_WORKER_ENABLED']:
+               response = swap_workers.execute(
+                   token_address, amount, is_sell,
+                   small_token_sell=os.environ.get('SMALL_TOKEN_SELL') == 'true',
+                   timeout=timeout_duration
+               )
            
-           # SUCCESS DETECTION
-           success_indicators = [
-               "SUCCESS" in combined_output,
-               "BUY SUCCESS:" in combined_output,
-               "SELL SUCCESS:" in combined_output,
-               "confirmed" in combined_output.lower(),
-               "submitted" in combined_output.lower(),
-               "🎉 SUCCESS" in combined_output  # Your swap.js success indicator
-           ]
+           if response is not None:
+               logging.info(f"✅ Worker swap completed in {response.get('elapsedMs', 0)}ms")
+               combined_output = response.get('output') or response.get('error') or ""
+               signature = response.get('signature')
+               # The worker reports the outcome itself - no need to guess from the log text
+               is_successful = bool(response.get('ok'))
+           else:
+               result = subprocess.run([
+                   'node', 'swap.js',
+                   token_address,
+                   trade_amount,
+                   'true' if is_sell else 'false'
+               ], 
+               capture_output=True,
+               text=True,
+               timeout=timeout_duration,  # Reduced from 120
+               cwd='/opt/render/project/src'
+               )
+               logging.info(f"✅ Subprocess completed without timeout")
+               
+               stdout_output = result.stdout if result.stdout else ""
+               stderr_output = result.stderr if result.stderr else ""
+               combined_output = stdout_output + stderr_output
+               
+               # SUCCESS DETECTION (one-shot runs only have their output to go on)
+               success_indicators = [
+                   "SUCCESS" in combined_output,
+                   "BUY SUCCESS:" in combined_output,
+                   "SELL SUCCESS:" in combined_output,
+                   "confirmed" in combined_output.lower(),
+                   "submitted" in combined_output.lower(),
+                   "🎉 SUCCESS" in combined_output  # Your swap.js success indicator
+               ]
+               is_successful = any(success_indicators)
+               signature_match = re.search(r'🎉 SUCCESS (\w+)', combined_output)
+               signature = signature_match.group(1) if signature_match else None
            
-           is_successful = any(success_indicators)
+           logging.info(f"📤 Output length: {len(combined_output)} characters")
            
            action = "SELL" if is_sell else "BUY"
            
            if is_successful:
                logging.info(f"✅ {action} SUCCESS: {token_address}")
-               return True, combined_output
+               return finish(True, combined_output, signature)
            else:
                logging.error(f"❌ {action} FAILED: {token_address}")
                logging.error(f"Output: {combined_output[:500]}")  # Show first 500 chars of output
@@ -16110,7 +19670,7 @@ def execute_via_javascript(token_address, amount, is_sell=False, max_retries=3):
                    time.sleep(wait_time)
                    continue
                
-               return False, combined_output
+               return finish(False, combined_output)
                
        except subprocess.TimeoutExpired:
            logging.error(f"⏰ TIMEOUT: {timeout_duration} seconds exceeded for {token_address}")
@@ -16121,7 +19681,7 @@ def execute_via_javascript(token_address, amount, is_sell=False, max_retries=3):
                time.sleep(2)
                continue
                
-           return False, f"Timeout after {max_retries} attempts"
+           return finish(False, f"Timeout after {max_retries} attempts")
            
        except Exception as e:
            logging.error(f"❌ ERROR: {e}")
@@ -16132,10 +19692,10 @@ def execute_via_javascript(token_address, amount, is_sell=False, max_retries=3):
                time.sleep(2)
                continue
                
-           return False, f"Error after {max_retries} attempts: {str(e)}"
+           return finish(False, f"Error after {max_retries} attempts: {str(e)}")
    
    # Should never reach here, but just in case
-   return False, "Max retries exceeded"
+   return finish(False, "Max retries exceeded")
 
 def get_token_symbol(token_address):
     """Get symbol for token address, or return None if not found."""
@@ -16152,15 +19712,10 @@ def get_token_symbol(token_address):
         if token_address in known_tokens:
             return known_tokens[token_address]
             
-        # If not in our mapping, try to get from RPC
-        if wallet:
-            try:
-                # This is a simplified approach - you may need to adjust based on your wallet implementation
-                token_info = wallet._rpc_call("getTokenSupply", [token_address])
-                if 'result' in token_info and 'value' in token_info['result'] and 'symbol' in token_info['result']['value']:
-                    return token_info['result']['value']['symbol']
-            except Exception as e:
-                logging.debug(f"Error getting token symbol from RPC: {str(e)}")
+        # Symbols seen in DexScreener pair data are kept in the token store
+        symbol = token_store.get(token_address, 'symbol')
+        if symbol:
+            return symbol
                 
         # Return a shortened address if we couldn't get a symbol
         return token_address[:8]
@@ -16751,32 +20306,11 @@ def cleanup_memory():
     # Force garbage collection
     gc.collect()
     
-    # Clear unnecessary memory
-    global price_cache, price_cache_time
-    
-    # Only keep essential token prices
-    if len(price_cache) > 25:  # Reduced threshold
-        logging.info(f"Clearing price cache (size: {len(price_cache)})")
-        
-        # Keep only recent and currently monitored tokens
-        current_time = time.time()
-        keep_tokens = set(monitored_tokens.keys())
-        keep_tokens.update([t["address"] for t in KNOWN_TOKENS])
-        
-        # Find old cache entries to remove
-        old_keys = []
-        for key, timestamp in price_cache_time.items():
-            if key not in keep_tokens and current_time - timestamp > 600:  # 10 minutes
-                old_keys.append(key)
-        
-        # Remove old keys
-        for key in old_keys:
-            if key in price_cache:
-                del price_cache[key]
-            if key in price_cache_time:
-                del price_cache_time[key]
-        
-        logging.info(f"Price cache reduced to {len(price_cache)} items")
+    # Price cache bounds itself; just drop entries too old to serve
+    expired = price_cache.prune()
+    cache_stats = price_cache.get_stats()
+    logging.info(f"Price cache: {cache_stats['size']}/{cache_stats['max_size']} entries, "
+                 f"{cache_stats['hit_rate']:.0f}% hit rate, {cache_stats['evictions']} evictions, {expired} expired")
     
     # Clear other large dictionaries
     global token_buy_timestamps
@@ -16986,22 +20520,14 @@ def simplified_buy_token(token_address: str, amount_sol: float = 0.01) -> bool:
         if not CONFIG['SIMULATION_MODE']:
             blockhash = wallet.get_latest_blockhash()
         
-        # 1. Get Jupiter quote
-        quote_url = f"{CONFIG['JUPITER_API_URL']}/v6/quote"
-        params = {
-            "inputMint": SOL_TOKEN_ADDRESS,
-            "outputMint": token_address,
-            "amount": str(amount_lamports),
-            "slippageBps": "100"  # 1% slippage
-        }
-        
-        quote_response = requests.get(quote_url, params=params, timeout=15)
+        # 1. Get Jupiter quote (1% slippage), reusing a just-fetched one for exactly this amount
+        quote_data = get_jupiter_quote(SOL_TOKEN_ADDRESS, token_address, amount_lamports, 100, timeout=15,
+                                       exact_amount=True)
         
-        if quote_response.status_code != 200:
-            logging.error(f"Failed to get quote: {quote_response.status_code}")
+        if not quote_data:
+            logging.error(f"Failed to get quote for {token_address[:8]}")
             return False
             
-        quote_data = quote_response.json()
         logging.info(f"Got Jupiter quote. Output amount: {quote_data.get('outAmount', 'unknown')}")
         
         # 2. Prepare swap transaction
@@ -17017,7 +20543,7 @@ def simplified_buy_token(token_address: str, amount_sol: float = 0.01) -> bool:
         if blockhash:
             swap_params["blockhash"] = blockhash
         
-        swap_response = requests.post(
+        swap_response = HTTP_SESSION.post(
             swap_url,
             json=swap_params,
             headers={"Content-Type": "application/json"},
@@ -17341,7 +20867,7 @@ def submit_via_helius(signed_transaction):
         
         # Send request
         headers = {"Content-Type": "application/json"}
-        response = requests.post(helius_endpoint, json=payload, headers=headers, timeout=15)
+        response = HTTP_SESSION.post(helius_endpoint, json=payload, headers=headers, timeout=15)
         
         if response.status_code == 200:
             data = response.json()
@@ -17560,7 +21086,7 @@ def submit_via_helius(signed_transaction):
         
         # Send request
         headers = {"Content-Type": "application/json"}
-        response = requests.post(helius_endpoint, json=payload, headers=headers, timeout=15)
+        response = HTTP_SESSION.post(helius_endpoint, json=payload, headers=headers, timeout=15)
         
         if response.status_code == 200:
             data = response.json()
@@ -17652,10 +21178,11 @@ def get_token_info(token_address):
             ]
         }
         
-        response = requests.post(CONFIG['SOLANA_RPC_URL'], json=payload, headers=headers, timeout=5)
+        response = HTTP_SESSION.post(CONFIG['SOLANA_RPC_URL'], json=payload, headers=headers, timeout=5)
         
         if response.status_code == 200:
             result = response.json()
+            store_mint_account(token_address, result.get('result'))
             return result.get('result')
             
     except Exception as e:
@@ -17905,14 +21432,10 @@ def execute_optimized_transaction(token_address, amount_sol, is_sell=False):
         
         # ALWAYS USE JAVASCRIPT FOR BOTH BUY AND SELL
         logging.info(f"🚀 Executing {action} via JavaScript swap.js...")
-        success, output = execute_via_javascript(token_address, amount_sol, is_sell=is_sell)
+        success, output, signature = execute_via_javascript(token_address, amount_sol, is_sell=is_sell, with_signature=True)
         
         if success:
-            # Extract signature from output
-            if "https://solscan.io/tx/" in output:
-                start = output.find("https://solscan.io/tx/") + len("https://solscan.io/tx/")
-                end = output.find("\n", start) if "\n" in output[start:] else len(output)
-                signature = output[start:end].strip()
+            if signature:
                 logging.info(f"✅ Real {action} transaction: {signature}")
                 return signature
             else:
@@ -17937,10 +21460,8 @@ def get_all_token_balances(wallet_pubkey):
     global wallet
     
     try:
-        import requests
-        
         # Use Helius or your RPC to get all token accounts
-        response = requests.post(
+        response = HTTP_SESSION.post(
             SOLANA_RPC_URL,
             json={
                 "jsonrpc": "2.0",
@@ -40,6 +40,37 @@ process.stderr.write = function(chunk, encoding, callback) {
   return originalStderrWrite.call(process.stderr, chunk, encoding, callback);
 };
 
+// WORKER MODE: `node swap.js --worker` stays up and takes JSON-line requests on stdin.
+// stdout carries only protocol lines, so all logging goes to stderr plus the current request's output buffer.
+const util = require('util');
+const http = require('http');
+const https = require('https');
+const IS_WORKER_MODE = process.argv[2] === '--worker';
+let workerOutput = null;
+
+if (IS_WORKER_MODE) {
+  const workerLog = (...args) => {
+    const line = util.format(...args);
+    if (workerOutput !== null) {
+      workerOutput.push(line);
+    }
+    process.stderr.write(line + '\n');
+  };
+  console.log = workerLog;
+  console.info = workerLog;
+  console.warn = workerLog;
+  console.error = workerLog;
+
+  // A stray timer from a finished trade must not take the whole worker down
+  process.on('unhandledRejection', (reason) => {
+    console.error('⚠️ Unhandled rejection in worker:', reason && reason.message ? reason.message : reason);
+  });
+}
+
+// Keep Jupiter/QuickNode HTTPS connections alive between requests
+axios.defaults.httpAgent = new http.Agent({ keepAlive: true });
+axios.defaults.httpsAgent = new https.Agent({ keepAlive: true });
+
 // Rate limiting constants
 const MAX_RETRIES = 10; // INCREASED from 7
 const INITIAL_RETRY_DELAY = 2000; // REDUCED from 3000
@@ -103,15 +134,47 @@ function getQuickNodeHeaders() {
   return headers;
 }
 
-const TOKEN_ADDRESS = process.argv[2] || 'EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm';
-const AMOUNT_SOL = parseFloat(process.argv[3] || '0.005');
-const IS_SELL = process.argv[4] === 'true';
-const IS_FORCE_SELL = process.argv[5] === 'true';
+// Trade parameters come from argv for one-shot runs; worker mode resets them per request
+let TOKEN_ADDRESS = process.argv[2] || 'EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm';
+let AMOUNT_SOL = parseFloat(process.argv[3] || '0.005');
+let IS_SELL = process.argv[4] === 'true';
+let IS_FORCE_SELL = process.argv[5] === 'true';
 
 // Get environment variables
 const RPC_URL = SOLANA_RPC_ENDPOINT || process.env.solana_rpc_url || '';
 const PRIVATE_KEY = process.env.WALLET_PRIVATE_KEY || '';
-const IS_SMALL_TOKEN_SELL = process.env.SMALL_TOKEN_SELL === 'true' && IS_SELL;
+let IS_SMALL_TOKEN_SELL = process.env.SMALL_TOKEN_SELL === 'true' && IS_SELL;
+
+// Signature of the last submitted swap, reported back in worker responses
+let LAST_SIGNATURE = null;
+
+// Connection and keypair are built once and reused by every trade in worker mode
+let sharedConnection = null;
+let sharedKeypair = null;
+
+function getConnection() {
+  if (!sharedConnection) {
+    // ENHANCED CONNECTION SETUP with better error handling
+    sharedConnection = new Connection(RPC_URL, {
+      commitment: 'processed', // CHANGED: faster confirmation
+      disableRetryOnRateLimit: false,
+      confirmTransactionInitialTimeout: 120000, // REDUCED from 90000
+      wsEndpoint: undefined, // Disable WebSocket to avoid connection issues
+      httpHeaders: {
+        'Content-Type': 'application/json',
+        'User-Agent': 'SolanaBot/2.0'
+      }
+    });
+  }
+  return sharedConnection;
+}
+
+function getKeypair() {
+  if (!sharedKeypair) {
+    sharedKeypair = Keypair.fromSecretKey(bs58.decode(PRIVATE_KEY));
+  }
+  return sharedKeypair;
+}
 
 // Show environment variables are available
 console.log(`RPC_URL available: ${!!RPC_URL}`);
@@ -1086,44 +1149,36 @@ async function executeBundle(trades) {
     
     if (transactions.length === 0) {
         console.error('No valid transactions created');
-        process.exit(1);
+        return 1;
     }
     
     // Submit as Jito bundle
     try {
         const bundleId = await submitToJito(transactions, keypair);
         console.log(`🎉 Bundle submitted successfully: ${bundleId}`);
-        process.exit(0);
+        return 0;
     } catch (error) {
         console.error('Bundle submission failed:', error.message);
-        process.exit(1);
+        return 1;
     }
 }
 
 // ==================== END JITO BUNDLE SUPPORT ====================
 
+// Returns the process exit code (0 done / 1 failed / 2 blocked by safety checks)
 async function executeSwap() {
+  LAST_SIGNATURE = null;
   try {
     console.log(`Starting ${IS_SELL ? 'sell' : 'buy'} for ${TOKEN_ADDRESS} with ${AMOUNT_SOL} SOL${IS_FORCE_SELL ? ' (FORCE SELL MODE)' : ''}`);
     console.log(`Using ${USE_QUICKNODE_METIS ? 'QuickNode Metis Jupiter API' : 'Public Jupiter API'}`);
     
     if (USE_QUICKNODE_METIS && !QUICKNODE_JUPITER_ENDPOINT) {
       console.error('QuickNode Metis enabled but QUICKNODE_JUPITER_URL not set!');
-      process.exit(1);
+      return 1;
     }
     
-    // ENHANCED CONNECTION SETUP with better error handling
-    const connection = new Connection(RPC_URL, {
-      commitment: 'processed', // CHANGED: faster confirmation
-      disableRetryOnRateLimit: false,
-      confirmTransactionInitialTimeout: 120000, // REDUCED from 90000
-      wsEndpoint: undefined, // Disable WebSocket to avoid connection issues
-      httpHeaders: {
-        'Content-Type': 'application/json',
-        'User-Agent': 'SolanaBot/2.0'
-      }
-    });
-    
+    const connection = getConnection();
+
     // ==================== SAFETY CHECKS BEFORE TRADING ====================
     // Run safety checks for buy operations
     const safetyChecksPassed = await performSafetyChecks(TOKEN_ADDRESS, connection, !IS_SELL);
@@ -1134,7 +1189,7 @@ async function executeSwap() {
         
         // Exit with error code 2 to indicate safety check failure
         // Your Python code can detect this and handle accordingly
-        process.exit(2);
+        return 2;
     }
 
     // Run enhanced checks for high-value trades
@@ -1143,7 +1198,7 @@ async function executeSwap() {
         if (!enhancedChecksPassed) {
             console.error(`\n❌ ENHANCED SAFETY CHECKS FAILED`);
             console.error(`High-value trade blocked due to liquidity concerns`);
-            process.exit(2);
+            return 2;
         }
     }
 
@@ -1152,12 +1207,11 @@ async function executeSwap() {
     // Create keypair from private key with better error handling
     let keypair;
     try {
-      const secretKey = bs58.decode(PRIVATE_KEY);
-      keypair = Keypair.fromSecretKey(secretKey);
+      keypair = getKeypair();
       console.log(`Using wallet public key: ${keypair.publicKey.toBase58()}`);
     } catch (error) {
       console.error('Error creating keypair from private key:', error.message);
-      process.exit(1);
+      return 1;
     }
     
     // Convert SOL to lamports
@@ -1187,7 +1241,7 @@ async function executeSwap() {
           console.log(`Token supply query failed, token may not exist: ${tokenInfoError.message}`);
           if (tokenInfoError.message.includes("Invalid") || tokenInfoError.message.includes("not found")) {
             console.error("Token appears to be invalid. Marking as sold to remove from monitoring.");
-            process.exit(0);
+            return 0;
           }
         }
         
@@ -1203,7 +1257,7 @@ async function executeSwap() {
           
           if (IS_FORCE_SELL) {
             console.log("Force sell mode: Marking token as sold despite errors");
-            process.exit(0);
+            return 0;
           }
           
           throw tokenError;
@@ -1214,7 +1268,7 @@ async function executeSwap() {
           
           if (IS_FORCE_SELL) {
             console.log("Force sell mode: No token accounts found, marking as sold");
-            process.exit(0);
+            return 0;
           }
           
           // Try alternative method
@@ -1246,7 +1300,7 @@ async function executeSwap() {
                   
                   if (tokenBalance === 0) {
                     console.log("Token balance is zero, marking as sold.");
-                    process.exit(0);
+                    return 0;
                   }
                   
                   amount = tokenBalance;
@@ -1260,12 +1314,12 @@ async function executeSwap() {
             
             if (!foundTokenAccount) {
               console.error("Could not find token. Marking as sold anyway to remove from monitoring.");
-              process.exit(0);
+              return 0;
             }
           } catch (error) {
             console.error(`Error getting all token accounts: ${error.message}`);
             console.error("Marking as sold to remove from monitoring.");
-            process.exit(0);
+            return 0;
           }
         } else {
           console.log(`Found ${tokenAccounts.value.length} token accounts for ${TOKEN_ADDRESS}`);
@@ -1291,7 +1345,7 @@ async function executeSwap() {
             amount = largestBalance;
           } else {
             console.log("All token accounts have zero balance, marking as sold.");
-            process.exit(0);
+            return 0;
           }
         }
       } catch (error) {
@@ -1299,16 +1353,16 @@ async function executeSwap() {
         
         if (error.message.includes("Invalid public key input")) {
           console.error("Invalid token address. Marking as sold to remove from monitoring.");
-          process.exit(0);
+          return 0;
         }
         
         console.error("Could not find token. Marking as sold anyway to remove from monitoring.");
-        process.exit(0);
+        return 0;
       }
       
       if (amount <= 0) {
         console.error("Amount to sell is zero or negative. Marking as sold.");
-        process.exit(0);
+        return 0;
       }
       
       console.log(`Final amount to sell: ${amount}`);
@@ -1417,9 +1471,9 @@ async function executeSwap() {
       console.error('No swap transaction available from any method');
       if (IS_SELL || IS_FORCE_SELL) {
         console.error("Marking as sold anyway to remove from monitoring.");
-        process.exit(0);
+        return 0;
       }
-      process.exit(1);
+      return 1;
     }
     
     // Enhanced transaction deserialization with multiple format support
@@ -1467,9 +1521,9 @@ async function executeSwap() {
       console.error('❌ Critical transaction error:', deserializeError.message);
       if (IS_SELL || IS_FORCE_SELL) {
         console.log('🚫 Marking as sold due to transaction error');
-        process.exit(0);
+        return 0;
       }
-      process.exit(1);
+      return 1;
     }
     
     // NUCLEAR TRANSACTION SUBMISSION with StructError bypass
@@ -1542,12 +1596,17 @@ async function executeSwap() {
           };
           
           // Execute with timeout
+          let submitTimer;
           const timeoutPromise = new Promise((_, reject) => {
-            setTimeout(() => reject(new Error('Transaction submission timeout')), 30000); // REDUCED from 30000
+            submitTimer = setTimeout(() => reject(new Error('Transaction submission timeout')), 30000); // REDUCED from 30000
           });
-          
-          txSignature = await Promise.race([submitTransaction(), timeoutPromise]);
-          
+
+          try {
+            txSignature = await Promise.race([submitTransaction(), timeoutPromise]);
+          } finally {
+            clearTimeout(submitTimer); // worker mode outlives the trade, so don't leave the timer armed
+          }
+
           if (txSignature) {
             console.log('✅ Transaction submitted successfully:', txSignature);
             break;
@@ -1605,18 +1664,19 @@ async function executeSwap() {
       
       console.log(`🔗 View on Solscan: https://solscan.io/tx/${txSignature}`);
       console.log('🎉 SUCCESS', txSignature);
+      LAST_SIGNATURE = txSignature;
       
-      process.exit(0);
+      return 0;
       
     } catch (finalError) {
       console.error('❌ Final transaction submission failed:', finalError.message);
       
       if (IS_SELL || IS_FORCE_SELL) {
         console.log('🚫 Marking as sold to prevent infinite retry loops');
-        process.exit(0);
+        return 0;
       }
       
-      process.exit(1);
+      return 1;
     }
     
   } catch (error) {
@@ -1632,28 +1692,125 @@ async function executeSwap() {
     // For sell operations, mark as sold to avoid infinite attempts
     if (IS_SELL || IS_FORCE_SELL) {
       console.error(`Error during ${IS_FORCE_SELL ? 'force sell' : 'sell'} operation. Marking as sold anyway to remove from monitoring.`);
-      process.exit(0);
+      return 0;
     }
     
-    process.exit(1);
+    return 1;
+  }
+}
+
+// ==================== WORKER MODE ====================
+// Protocol: one JSON object per line each way, matched by id.
+//   {"id": 1, "type": "swap", "token": "...", "amount": 0.05, "isSell": false, "forceSell": false,
+//    "smallTokenSell": false}
+//   -> {"id": 1, "ok": true, "code": 0, "signature": "...", "output": "...", "elapsedMs": 850}
+//   {"id": 2, "type": "ping"} -> {"id": 2, "ok": true, "type": "pong", "busy": false, ...}
+// Swaps run one at a time because the trade parameters are module-level; pings answer immediately.
+
+let workerQueue = Promise.resolve();
+let workerBusy = false;
+let workerHandled = 0;
+const workerStartedAt = Date.now();
+
+function sendWorkerMessage(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+async function handleSwapRequest(request) {
+  TOKEN_ADDRESS = request.token;
+  AMOUNT_SOL = parseFloat(request.amount);
+  IS_SELL = !!request.isSell;
+  IS_FORCE_SELL = !!request.forceSell;
+  IS_SMALL_TOKEN_SELL = !!request.smallTokenSell && IS_SELL;
+
+  workerBusy = true;
+  workerOutput = [];
+  const startedAt = Date.now();
+  let code;
+  try {
+    code = await executeSwap();
+  } catch (error) {
+    console.error('Worker swap crashed:', error.message);
+    code = 1;
+  }
+  const output = workerOutput.join('\n');
+  workerOutput = null;
+  workerBusy = false;
+  workerHandled++;
+
+  sendWorkerMessage({
+    id: request.id,
+    ok: code === 0 && !!LAST_SIGNATURE,
+    code,
+    signature: LAST_SIGNATURE,
+    output,
+    elapsedMs: Date.now() - startedAt
+  });
+}
+
+function startWorker() {
+  const readline = require('readline');
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+  rl.on('line', (line) => {
+    if (!line.trim()) {
+      return;
+    }
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (error) {
+      sendWorkerMessage({ id: null, ok: false, error: `Invalid request JSON: ${error.message}` });
+      return;
+    }
+
+    if (request.type === 'ping') {
+      sendWorkerMessage({
+        id: request.id,
+        ok: true,
+        type: 'pong',
+        busy: workerBusy,
+        handled: workerHandled,
+        uptimeMs: Date.now() - workerStartedAt
+      });
+    } else if (request.type === 'swap') {
+      workerQueue = workerQueue.then(() => handleSwapRequest(request));
+    } else {
+      sendWorkerMessage({ id: request.id, ok: false, error: `Unknown request type: ${request.type}` });
+    }
+  });
+
+  // Parent closed stdin - finish the queued swaps, then exit
+  rl.on('close', () => workerQueue.then(() => process.exit(0)));
+
+  // Warm the RPC connection and decode the key before the first trade needs them
+  try {
+    getKeypair();
+  } catch (error) {
+    console.error('Error creating keypair from private key:', error.message);
   }
+  getConnection().getSlot()
+    .catch((error) => console.warn(`⚠️ RPC warm-up failed: ${error.message}`))
+    .finally(() => sendWorkerMessage({ type: 'ready', pid: process.pid }));
 }
 
 // Run the function
 // Check if running in bundle mode
 const IS_BUNDLE_MODE = process.argv[2] === 'bundle';
 
-if (IS_BUNDLE_MODE) {
+if (IS_WORKER_MODE) {
+    startWorker();
+} else if (IS_BUNDLE_MODE) {
     // Bundle mode: expects JSON array of trades as argv[3]
     // Example: node swap.js bundle '[{"tokenAddress":"...","amountSol":0.05},...]'
     try {
         const trades = JSON.parse(process.argv[3]);
-        executeBundle(trades);
+        executeBundle(trades).then((code) => process.exit(code));
     } catch (error) {
         console.error('Invalid bundle trades JSON:', error.message);
         process.exit(1);
     }
 } else {
     // Single trade mode (existing behavior)
-    executeSwap();
+    executeSwap().then((code) => process.exit(code));
 }
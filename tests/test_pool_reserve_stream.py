@@ -0,0 +1,251 @@
+"""PoolReserveStream: vault accountNotifications -> pool price -> stream stop exit"""
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # needs the full requirements.txt environment
+
+TOKEN = 'TokenMint1111111111111111111111111111111111'
+TOKEN_VAULT = 'TokenVault111111111111111111111111111111111'
+SOL_VAULT = 'SolVault11111111111111111111111111111111111'
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def token_account_data(amount):
+    """base64 SPL token account payload with `amount` at offset 64"""
+    raw = bytearray(165)
+    raw[64:72] = amount.to_bytes(8, 'little')
+    return [base64.b64encode(bytes(raw)).decode(), 'base64']
+
+
+def account_notification(subscription, amount, slot):
+    return json.dumps({
+        'jsonrpc': '2.0',
+        'method': 'accountNotification',
+        'params': {
+            'subscription': subscription,
+            'result': {
+                'context': {'slot': slot},
+                'value': {'data': token_account_data(amount)}
+            }
+        }
+    })
+
+
+class MockSolanaWebsocket:
+    """Minimal RFC 6455 server: confirms accountSubscribe calls, then pushes scripted vault balances"""
+
+    def __init__(self, balances):
+        self.balances = balances   # [(vault, amount, slot)] sent once every vault is subscribed
+        self.subscribed = {}       # vault -> subscription id
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(1)
+        self.url = f"ws://127.0.0.1:{self.server.getsockname()[1]}"
+        self.conn = None
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _recv_exact(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError('client closed')
+            data += chunk
+        return data
+
+    def _recv_frame(self):
+        first, second = self._recv_exact(2)
+        length = second & 0x7f
+        if length == 126:
+            length = struct.unpack('>H', self._recv_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack('>Q', self._recv_exact(8))[0]
+        mask = self._recv_exact(4) if second & 0x80 else b'\0\0\0\0'
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(self._recv_exact(length)))
+        return first & 0x0f, payload
+
+    def send(self, text):
+        payload = text.encode()
+        if len(payload) < 126:
+            header = struct.pack('>BB', 0x81, len(payload))
+        else:
+            header = struct.pack('>BBH', 0x81, 126, len(payload))
+        self.conn.sendall(header + payload)
+
+    def _serve(self):
+        self.conn, _ = self.server.accept()
+        request = b''
+        while b'\r\n\r\n' not in request:
+            request += self.conn.recv(4096)
+        key = next(line.split(':', 1)[1].strip() for line in request.decode().split('\r\n')
+                   if line.lower().startswith('sec-websocket-key'))
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        self.conn.sendall((
+            'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+            f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+        ).encode())
+
+        try:
+            while True:
+                opcode, payload = self._recv_frame()
+                if opcode == 0x8:
+                    return
+                if opcode != 0x1:
+                    continue
+                request = json.loads(payload)
+                if request.get('method') != 'accountSubscribe':
+                    continue
+                vault = request['params'][0]
+                self.subscribed[vault] = 100 + len(self.subscribed)
+                self.send(json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': self.subscribed[vault]}))
+                if len(self.subscribed) == 2:
+                    for vault, amount, slot in self.balances:
+                        self.send(account_notification(self.subscribed[vault], amount, slot))
+        except (ConnectionError, OSError):
+            return
+
+    def close(self):
+        for sock in (self.conn, self.server):
+            try:
+                sock and sock.close()
+            except OSError:
+                pass
+
+
+def make_stream(ws_url):
+    stream = main.PoolReserveStream(ws_url, rpc_call=mock.Mock())
+    stream.pools[TOKEN] = {
+        'amm_id': 'AmmId',
+        'token_vault': TOKEN_VAULT,
+        'sol_vault': SOL_VAULT,
+        'token_decimals': 6,
+        'reserves': {}
+    }
+    stream.vault_tokens = {TOKEN_VAULT: TOKEN, SOL_VAULT: TOKEN}
+    return stream
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    monkeypatch.setattr(main, 'price_cache', mock.Mock())
+    stream = make_stream('wss://example.invalid')
+    # Subscription confirmations map the notification ids back to the vaults
+    stream.pending = {1: TOKEN_VAULT, 2: SOL_VAULT}
+    stream._on_message(None, json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': 101}))
+    stream._on_message(None, json.dumps({'jsonrpc': '2.0', 'id': 2, 'result': 102}))
+    return stream
+
+
+def test_decode_token_amount_reads_offset_64():
+    stream = main.PoolReserveStream('wss://example.invalid', rpc_call=mock.Mock())
+    assert stream._decode_token_amount(token_account_data(123456789)) == 123456789
+    assert stream._decode_token_amount([base64.b64encode(b'short').decode(), 'base64']) is None
+    assert stream._decode_token_amount(None) is None
+
+
+def test_vault_updates_produce_pool_price(stream):
+    prices = []
+    stream.add_listener(lambda token, price, slot: prices.append((token, price, slot)))
+
+    # 1,000,000 tokens (6 decimals) against 50 SOL
+    stream._on_message(None, account_notification(101, 1_000_000 * 10**6, slot=500))
+    assert prices == []   # no price until both reserves are known
+    stream._on_message(None, account_notification(102, 50 * 10**9, slot=501))
+
+    assert len(prices) == 1
+    token, price, slot = prices[0]
+    assert token == TOKEN
+    assert slot == 501
+    assert price == pytest.approx(50 / 1_000_000)
+    assert stream.prices[TOKEN][0] == pytest.approx(50 / 1_000_000)
+    main.price_cache.set.assert_called_with(TOKEN, pytest.approx(50 / 1_000_000))
+
+    # SOL leaves the pool -> price halves
+    stream._on_message(None, account_notification(102, 25 * 10**9, slot=502))
+    assert prices[-1][1] == pytest.approx(25 / 1_000_000)
+
+
+def test_stream_prices_from_local_websocket_server(monkeypatch):
+    monkeypatch.setattr(main, 'price_cache', mock.Mock())
+    server = MockSolanaWebsocket([
+        (TOKEN_VAULT, 1_000_000 * 10**6, 700),
+        (SOL_VAULT, 50 * 10**9, 701),
+        (SOL_VAULT, 40 * 10**9, 702),
+    ])
+    stream = make_stream(server.url)
+    prices = []
+    done = threading.Event()
+
+    def on_price(token, price, slot):
+        prices.append((token, price, slot))
+        if len(prices) == 2:
+            done.set()
+
+    stream.add_listener(on_price)
+    try:
+        stream.start()
+        assert done.wait(10), f"stream produced {prices}"
+    finally:
+        stream.ws.close()
+        server.close()
+
+    assert set(server.subscribed) == {TOKEN_VAULT, SOL_VAULT}
+    assert [(token, slot) for token, _, slot in prices] == [(TOKEN, 701), (TOKEN, 702)]
+    assert prices[0][1] == pytest.approx(50 / 1_000_000)
+    assert prices[1][1] == pytest.approx(40 / 1_000_000)
+
+
+def test_price_drop_triggers_stream_stop_exit(stream):
+    trader = main.AdaptiveAlphaTrader.__new__(main.AdaptiveAlphaTrader)
+    position = {'entry_price': 50 / 1_000_000, 'strategy': 'ALPHA_COPY', 'source_wallet': 'AlphaWallet'}
+    trader.positions = {TOKEN: position}
+    trader.alpha_wallets = [{'address': 'AlphaWallet', 'name': 'alpha', 'style': 'SCALPER'}]
+    trader.wallet_styles = {}
+    trader.stream_exit_executor = mock.Mock(submit=lambda fn: fn())
+    trader.check_trailing_stop = mock.Mock(return_value=False)
+    trader.check_stop_loss = mock.Mock(return_value=True)
+    stream.add_listener(trader.on_pool_price_update)
+
+    stream._on_message(None, account_notification(101, 1_000_000 * 10**6, slot=500))
+    stream._on_message(None, account_notification(102, 49 * 10**9, slot=501))   # -2%: inside the 8% stop
+    trader.check_stop_loss.assert_not_called()
+
+    stream._on_message(None, account_notification(102, 40 * 10**9, slot=502))   # -20%: through it
+    trader.check_stop_loss.assert_called_once()
+    args = trader.check_stop_loss.call_args[0]
+    assert args[0] == TOKEN
+    assert args[2] == pytest.approx(-20.0)
+    assert args[3] == -8.0
+    assert position['exit_pending'] is False
+
+
+def test_raw_unit_entry_price_is_converted_not_stopped_out(stream, monkeypatch):
+    # Entry recorded from a raw-unit quote: 1000x too large for a 6-decimal token
+    monkeypatch.setattr(main, 'token_store', mock.Mock(get=lambda token, field: 6 if field == 'decimals' else None))
+    trader = main.AdaptiveAlphaTrader.__new__(main.AdaptiveAlphaTrader)
+    position = {'entry_price': 50 / 1_000, 'peak_price': 50 / 1_000, 'strategy': 'ALPHA_COPY', 'source_wallet': 'AlphaWallet'}
+    trader.positions = {TOKEN: position}
+    trader.alpha_wallets = [{'address': 'AlphaWallet', 'name': 'alpha', 'style': 'SCALPER'}]
+    trader.wallet_styles = {}
+    trader.stream_exit_executor = mock.Mock(submit=lambda fn: fn())
+    trader.check_trailing_stop = mock.Mock(return_value=False)
+    trader.check_stop_loss = mock.Mock(return_value=True)
+    stream.add_listener(trader.on_pool_price_update)
+
+    stream._on_message(None, account_notification(101, 1_000_000 * 10**6, slot=500))
+    stream._on_message(None, account_notification(102, 49 * 10**9, slot=501))   # -2% once in the same unit
+
+    trader.check_stop_loss.assert_not_called()
+    assert position['entry_price'] == pytest.approx(50 / 1_000_000)
+    assert position['peak_price'] == pytest.approx(50 / 1_000_000)